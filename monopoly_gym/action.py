@@ -1,10 +1,12 @@
 # monopoly_gym/gym/action.py
 from __future__ import annotations
 from abc import ABC, abstractmethod
+import bisect
 import copy
-from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, Union, List, Tuple, Type, TYPE_CHECKING
+import functools
+import time
+from typing import Callable, Optional, Dict, Union, List, Tuple, Type, TYPE_CHECKING
 import numpy as np
 
 from gym.spaces import (
@@ -19,7 +21,6 @@ from gym.spaces import (
 from monopoly_gym.state import HOTEL_AUCTION_THRESHOLD, HOUSE_AUCTION_THRESHOLD, MAX_HOTELS_AVAILABLE_FOR_AUCTION, MAX_HOUSES_AVAILABLE_FOR_AUCTION, AuctionBid, AuctionState, BuildingType, State, TradeOffer
 from monopoly_gym.tile import Property, Street
 import logging
-import random
 
 if TYPE_CHECKING:
     from monopoly_gym.player import Player
@@ -37,11 +38,218 @@ JAIL_BAIL_AMOUNT = 50
 VOLUNTARY_BANKRUPTCY = True
 MAX_MESSAGE_LENGTH = 500
 
+# Every cash amount a Discrete(MAX_CASH + 1) parameter can take, used to build
+# cash masks with a single vectorized comparison instead of a Python loop.
+_CASH_RANGE = np.arange(MAX_CASH + 1, dtype=np.int32)
+
+# All-False bid mask; read-only so it can be handed out without copying.
+_BID_TEMPLATE = np.zeros(MAX_CASH + 1, dtype=np.bool_)
+_BID_TEMPLATE.setflags(write=False)
+
+def _frozen_zeros(size: int) -> np.ndarray:
+    mask = np.zeros(size, dtype=np.bool_)
+    mask.setflags(write=False)
+    return mask
+
+# qty - 1 for each build quantity, to compare against per-street quantity caps.
+_BUILD_QTY_OFFSETS = np.arange(MAX_BUILD_COUNT)
+
+# Shared single-entry masks for the many yes/no actions.
+_FALSE_BIT = _frozen_zeros(1)
+_TRUE_BIT = np.ones(1, dtype=np.bool_)
+_TRUE_BIT.setflags(write=False)
+
+def _bit(valid: bool) -> np.ndarray:
+    return _TRUE_BIT if valid else _FALSE_BIT
+
+# Yes/no action availability packed into one int per state version; see
+# _player_action_bits.
+_CAN_USE_JAIL_CARD = 1
+_CAN_PAY_JAIL_FINE = 2
+_CAN_ROLL_FOR_JAIL = 4
+_CAN_GO_BANKRUPT = 8
+_CAN_FOLD = 16
+_CAN_ANSWER_TRADE = 32
+
+def _player_action_bits(state: State) -> int:
+    """Availability bits for the jail, bankruptcy, fold and trade-answer actions, computed once per state version."""
+    cached = state.mask_cache.get("player_action_bits")
+    if cached is not None and cached[0] == state.version:
+        return cached[1]
+    player = state.current_player()
+    free = not state.actions_blocked
+    bits = 0
+    if player.in_jail and free:
+        if player.jail_free_cards > 0:
+            bits |= _CAN_USE_JAIL_CARD
+        if player.balance >= JAIL_BAIL_AMOUNT:
+            bits |= _CAN_PAY_JAIL_FINE
+        if player.jail_turns < 3:
+            bits |= _CAN_ROLL_FOR_JAIL
+    if player.balance < 0:
+        bits |= _CAN_GO_BANKRUPT
+    if state.auction_state and len(state.auction_state.participants) >= 1:
+        bits |= _CAN_FOLD
+    # Player objects are never copied within a game, so identity is equality.
+    if state.pending_trade and player is state.pending_trade.responder:
+        bits |= _CAN_ANSWER_TRADE
+    state.mask_cache["player_action_bits"] = (state.version, bits)
+    return bits
+
+_NO_PROPERTIES = _frozen_zeros(MAX_PROPERTIES)
+_NO_BUILDS = _frozen_zeros(MAX_STREETS * MAX_BUILD_COUNT)
+
+# Returned from the disabled branches of the masks below; shared, never mutated.
+_DISABLED_TRADE_MASK = {
+    "trade_partner": _frozen_zeros(MAX_PLAYERS - 1),
+    "cash_offered": _BID_TEMPLATE,
+    "properties_offered": _NO_PROPERTIES,
+    "get_out_of_jail_cards_offered": _frozen_zeros(2),
+    "cash_asking": _BID_TEMPLATE,
+    "properties_asking": _NO_PROPERTIES,
+    "get_out_of_jail_cards_asking": _frozen_zeros(2),
+}
+_DISABLED_BUILD_MASK = {
+    "street": _frozen_zeros(MAX_STREETS),
+    "quantity": _frozen_zeros(MAX_BUILD_COUNT),
+}
+_DISABLED_MESSAGE_MASK = {
+    "recipient": _frozen_zeros(MAX_PLAYERS + 1),
+    "message": _FALSE_BIT,
+}
+
+def _message_mask(player_count: int) -> Dict[str, np.ndarray]:
+    # Recipient slot 0 is the public channel; slots 1.. are the seated players.
+    recipient = np.zeros(MAX_PLAYERS + 1, dtype=np.bool_)
+    recipient[:player_count + 1] = True
+    recipient.setflags(write=False)
+    return {"recipient": recipient, "message": _TRUE_BIT}
+
+# The enabled SendMessage mask only depends on the number of players.
+_MESSAGE_MASKS = [_message_mask(n) for n in range(MAX_PLAYERS + 1)]
+
+def _mask_layout(sizes: List[Tuple[str, int]]) -> Tuple[Dict[str, slice], int]:
+    """Lay out named masks back to back in one buffer; return their slices and the total size."""
+    layout, offset = {}, 0
+    for key, size in sizes:
+        layout[key] = slice(offset, offset + size)
+        offset += size
+    return layout, offset
+
+_TRADE_MASK_LAYOUT, _TRADE_MASK_SIZE = _mask_layout([
+    ("trade_partner", MAX_PLAYERS - 1),
+    ("cash_offered", MAX_CASH + 1),
+    ("properties_offered", MAX_PROPERTIES),
+    ("get_out_of_jail_cards_offered", 2),
+    ("cash_asking", MAX_CASH + 1),
+    ("properties_asking", MAX_PROPERTIES),
+    ("get_out_of_jail_cards_asking", 2),
+])
+
+def _fill_trade_masks(
+    mask: Dict[str, np.ndarray],
+    balance: int,
+    max_cash_asking: int,
+    offered_idxs: List[int],
+    asking_idxs: List[int],
+    partner_n: int,
+) -> None:
+    """Write the array parts of a trade mask into the (zeroed) views in ``mask``."""
+    mask["trade_partner"][:partner_n] = True
+    np.less_equal(_CASH_RANGE, balance, out=mask["cash_offered"])
+    np.less_equal(_CASH_RANGE, max_cash_asking, out=mask["cash_asking"])
+    mask["properties_offered"][offered_idxs] = True
+    mask["properties_asking"][asking_idxs] = True
+
+def _freeze_mask(mask: Union[np.ndarray, Dict[str, np.ndarray], List[bool]]) -> None:
+    """Make a mask's arrays read-only, so one holder cannot edit what others share."""
+    arrays = mask.values() if isinstance(mask, dict) else (mask,)
+    for array in arrays:
+        if isinstance(array, np.ndarray):
+            array.setflags(write=False)
+
+def _version_cached(kind: str):
+    """
+    Memoize a mask classmethod on the state, keyed by (class, kind) and valid
+    for as long as state.version is unchanged. The cache lives on the state
+    because versions are only monotonic per State instance.
+
+    Every caller in that version gets the same arrays, so they are made
+    read-only. For views into a reused state.mask_buffers buffer only the view
+    is frozen; the buffer itself stays writable for the next version's refill.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(cls, state: State):
+            key = (cls, kind)
+            cached = state.mask_cache.get(key)
+            if cached is not None and cached[0] == state.version:
+                return cached[1]
+            mask = fn(cls, state)
+            _freeze_mask(mask)
+            state.mask_cache[key] = (state.version, mask)
+            return mask
+        return wrapper
+    return decorator
+
+def _class_cached(fn):
+    """
+    Memoize a no-argument classmethod per class. For results that never change,
+    such as parameter spaces, which are costly to rebuild on every call.
+    """
+    cache = {}
+    @functools.wraps(fn)
+    def wrapper(cls):
+        result = cache.get(cls)
+        if result is None:
+            result = cache[cls] = fn(cls)
+        return result
+    return wrapper
+
+# Dice are drawn from a pre-rolled pool refilled in batches, which is much
+# cheaper per roll than two random.randint calls.
+_DICE_POOL_SIZE = 8192
+_RNG = np.random.default_rng()
+_DICE_POOL = np.empty(0, dtype=np.int8)
+_DICE_IDX = 0
+
+def seed_dice(seed: Optional[int] = None) -> None:
+    """Reseed the dice generator and discard any pre-rolled dice."""
+    global _RNG, _DICE_POOL, _DICE_IDX
+    _RNG = np.random.default_rng(seed)
+    _DICE_POOL = np.empty(0, dtype=np.int8)
+    _DICE_IDX = 0
+
+def dice_snapshot() -> tuple:
+    """Capture the dice stream's position, so restore_dice() can replay the same rolls."""
+    return _RNG, _RNG.bit_generator.state, _DICE_POOL, _DICE_IDX
+
+def restore_dice(snapshot: tuple) -> None:
+    """Rewind the dice stream to a dice_snapshot()."""
+    global _RNG, _DICE_POOL, _DICE_IDX
+    _RNG, rng_state, _DICE_POOL, _DICE_IDX = snapshot
+    _RNG.bit_generator.state = rng_state
+
+def _roll_two() -> Tuple[int, int]:
+    global _DICE_POOL, _DICE_IDX
+    if _DICE_IDX + 2 > len(_DICE_POOL):
+        _DICE_POOL = _RNG.integers(1, 7, size=_DICE_POOL_SIZE, dtype=np.int8)
+        _DICE_IDX = 0
+    i = _DICE_IDX
+    _DICE_IDX += 2
+    return int(_DICE_POOL[i]), int(_DICE_POOL[i + 1])
+
 class ActionSpaceType(Enum):
     FLAT = "flat"
     HIERARCHICAL = "hierarchical"
 
 class Action(ABC):
+    __slots__ = ("name", "player")
+
+    # The hierarchical mask while no auction or trade is pending, for classes
+    # where it is fixed then; None when it always depends on the state.
+    IDLE_HIERARCHICAL_MASK: Optional[Dict[str, np.ndarray]] = None
+
     def __init__(self, name: str, player: Optional[Player] = None) -> None:
         self.name = name
         self.player = player
@@ -54,6 +262,14 @@ class Action(ABC):
     def process(self, state: State) -> None:
         ...
 
+    def process_unchecked(self, state: State) -> None:
+        """Apply an action already known to be legal (e.g. sampled from its mask).
+
+        Subclasses whose ``process`` re-validates preconditions override this to
+        skip those checks; by default it is just ``process``.
+        """
+        self.process(state)
+
     @classmethod
     @abstractmethod
     def to_action_mask_flat(cls, state: State) -> List[bool]:
@@ -64,6 +280,14 @@ class Action(ABC):
     def flat_parameter_size(cls) -> int:
         ...
 
+    @classmethod
+    def fill_flat(cls, state: State, buf: np.ndarray, offset: int) -> None:
+        """Write this class's flat mask into buf[offset:offset + flat_parameter_size()].
+
+        buf is not zeroed beforehand, so every entry of the slice must be written.
+        """
+        buf[offset:offset + cls.flat_parameter_size()] = cls.to_action_mask_flat(state)
+
     @classmethod
     @abstractmethod
     def to_action_mask_hierarchical(cls, state: State) -> Dict[str, List[bool]]:
@@ -88,6 +312,16 @@ class ProposeTradeAction(Action):
     Player proposes a trade to a specific responder,
     offering 'give' and asking for 'receive'.
     """
+    __slots__ = (
+        "responder",
+        "cash_offered",
+        "properties_offered",
+        "get_out_of_jail_cards_offered",
+        "cash_asking",
+        "properties_asking",
+        "get_out_of_jail_cards_asking",
+    )
+
 
     def __init__(self, trade_offer: TradeOffer ):
         super().__init__("ProposeTrade", trade_offer.proposer)
@@ -120,11 +354,12 @@ class ProposeTradeAction(Action):
         return f"T({self.player.mgn_code}>{self.responder.mgn_code}:{give_part};{receive_part})"
 
     def process(self, state: State) -> None:
+        state.bump_version()
         if state.pending_trade:
             logger.warning("Cannot propose a new trade while another trade is pending.")
             return
 
-        if self.responder not in state.players:
+        if self.responder.mgn_code not in state.players_by_mgn:
             logger.warning(f"Responder {self.responder.name} not in the game. Trade not proposed.")
             return
 
@@ -141,11 +376,12 @@ class ProposeTradeAction(Action):
         )
 
     @classmethod
+    @_version_cached("flat")
     def to_action_mask_flat(cls, state: State) -> List[bool]:
         current_player = state.current_player()
-        if state.pending_trade or state.auction_state:
-            return [False]
-        return [len(state.players) > 1 and not state.pending_trade]
+        if state.actions_blocked:
+            return _FALSE_BIT
+        return _bit(len(state.players) > 1 and not state.pending_trade)
 
     @classmethod
     def flat_parameter_size(cls) -> int:
@@ -153,61 +389,47 @@ class ProposeTradeAction(Action):
         return 1
 
     @classmethod
-    def to_action_mask_hierarchical(cls, state: State) -> Dict[str, List[bool]]:
+    @_version_cached("hierarchical")
+    def to_action_mask_hierarchical(cls, state: State) -> Dict[str, np.ndarray]:
+        """
+        The returned masks are read-only views into one buffer owned by the
+        state, so they are overwritten the next time the mask is built for a
+        new state version. Copy them if they must outlive the current decision.
+        """
         current_player = state.current_player()
         num_other_players = len(state.players) - 1
 
-        if state.pending_trade or state.auction_state or num_other_players <= 1:
-            partner_mask = [False] * (MAX_PLAYERS - 1)
-            return {
-                "trade_partner": partner_mask,
-                "cash_offered": [False]*(MAX_CASH+1),
-                "properties_offered": [False]*MAX_PROPERTIES,
-                "get_out_of_jail_cards_offered": [False] * 2,
-                "cash_asking": [False]*(MAX_CASH+1),
-                "properties_asking": [False]*MAX_PROPERTIES,
-                "get_out_of_jail_cards_asking": [False] * 2
-            }
+        if state.actions_blocked or num_other_players <= 1:
+            return _DISABLED_TRADE_MASK
+
+        buf = state.mask_buffers.get(cls)
+        if buf is None:
+            buf = state.mask_buffers[cls] = np.zeros(_TRADE_MASK_SIZE, dtype=np.bool_)
+        else:
+            buf[:] = False
+        mask = {key: buf[span] for key, span in _TRADE_MASK_LAYOUT.items()}
+
+        others = [p for p in state.players if p is not current_player]
+        _fill_trade_masks(
+            mask,
+            balance=current_player.balance,
+            max_cash_asking=state.max_balance_excluding(current_player),
+            offered_idxs=[prop.property_idx for prop in current_player.properties],
+            asking_idxs=[prop.property_idx for other in others for prop in other.properties],
+            partner_n=num_other_players,
+        )
 
-        partner_mask = [True] * num_other_players
-        partner_mask.extend([False] * (MAX_PLAYERS - 1 - num_other_players))
-
-        give_prop_mask = [False]*MAX_PROPERTIES
-        for prop in current_player.properties:
-            give_prop_mask[prop.property_idx] = True
-
-        get_out_of_jail_cards_offered_mask = [False] * 2 # Max offer 1 card
-        if current_player.jail_free_cards > 0:
-            get_out_of_jail_cards_offered_mask[1] = True 
-        get_out_of_jail_cards_offered_mask[0] = True 
-
-        receive_prop_mask = [False]*MAX_PROPERTIES
-        responder_balances = [p.balance for p in state.players if p != current_player]
-        max_cash_asking = max(responder_balances) if responder_balances else 0
-        cash_asking_mask = [c <= max_cash_asking for c in range(MAX_CASH + 1)]
-        get_out_of_jail_cards_asking_mask = [False] * 2
-        for other in state.players:
-            if other != current_player:
-                for prop in other.properties:
-                    receive_prop_mask[prop.property_idx] = True
-                if other.jail_free_cards > 0:
-                    get_out_of_jail_cards_asking_mask[1] = True
-        get_out_of_jail_cards_asking_mask[0] = True
-
-        cash_offered_mask = [c <= current_player.balance for c in range(MAX_CASH+1)]
+        # Max offer 1 card
+        mask["get_out_of_jail_cards_offered"][0] = True
+        mask["get_out_of_jail_cards_offered"][1] = bool(current_player.jail_free_cards)
+        mask["get_out_of_jail_cards_asking"][0] = True
+        mask["get_out_of_jail_cards_asking"][1] = any(other.jail_free_cards > 0 for other in others)
 
-        return {
-            "trade_partner": partner_mask,
-            "cash_offered": cash_offered_mask,
-            "properties_offered": give_prop_mask,
-            "get_out_of_jail_cards_offered": get_out_of_jail_cards_offered_mask,
-            "cash_asking": cash_asking_mask,
-            "properties_asking": receive_prop_mask,
-            "get_out_of_jail_cards_asking": get_out_of_jail_cards_asking_mask
-        }
+        return mask
 
 
     @classmethod
+    @_class_cached
     def hierarchical_parameters(cls) -> Dict[str, Space]:
         return {
             "trade_partner": Discrete(MAX_PLAYERS - 1),
@@ -226,33 +448,33 @@ class ProposeTradeAction(Action):
             "responder_id": self.responder.mgn_code,
             "cash_offered": self.cash_offered,
             "properties_offered_indices": [p.index for p in self.properties_offered],
-            "properties_offered_details": [{"name": p.name, "index": p.index} for p in self.properties_offered],
             "get_out_of_jail_cards_offered": self.get_out_of_jail_cards_offered,
             "cash_asking": self.cash_asking,
             "properties_asking_indices": [p.index for p in self.properties_asking],
-            "properties_asking_details": [{"name": p.name, "index": p.index} for p in self.properties_asking],
             "get_out_of_jail_cards_asking": self.get_out_of_jail_cards_asking,
         }
 
+    @classmethod
+    def _properties_at(cls, data: Dict, key: str, state: State) -> List[Property]:
+        """The properties at the tile indices listed under data[key], skipping invalid ones."""
+        properties = []
+        property_at = state.board.property_at
+        for idx in data.get(key, []):
+            prop = property_at[idx] if 0 <= idx < len(property_at) else None
+            if prop is not None:
+                properties.append(prop)
+            else:
+                logger.warning(f"Invalid property index {idx} in {key} for ProposeTradeAction.")
+        return properties
+
     @classmethod
     def from_dict(cls, data: Dict, state: State) -> ProposeTradeAction:
         proposer_mgn_code = data.get("proposer_id", data.get("mgn_code"))
-        proposer = next(p for p in state.players if p.mgn_code == proposer_mgn_code)
-        responder = next(p for p in state.players if p.mgn_code == data["responder_id"])
-
-        properties_offered = []
-        for idx in data.get("properties_offered_indices", []):
-            if 0 <= idx < len(state.board.board) and isinstance(state.board.board[idx], Property):
-                properties_offered.append(state.board.board[idx])
-            else:
-                logger.warning(f"Invalid property index {idx} in properties_offered_indices for ProposeTradeAction.")
+        proposer = state.players_by_mgn[proposer_mgn_code]
+        responder = state.players_by_mgn[data["responder_id"]]
 
-        properties_asking = []
-        for idx in data.get("properties_asking_indices", []):
-            if 0 <= idx < len(state.board.board) and isinstance(state.board.board[idx], Property):
-                properties_asking.append(state.board.board[idx])
-            else:
-                logger.warning(f"Invalid property index {idx} in properties_asking_indices for ProposeTradeAction.")
+        properties_offered = cls._properties_at(data, "properties_offered_indices", state)
+        properties_asking = cls._properties_at(data, "properties_asking_indices", state)
 
         return ProposeTradeAction(
             trade_offer=TradeOffer(
@@ -268,6 +490,7 @@ class ProposeTradeAction(Action):
         )
 class RollDiceAction(Action):
     """Action for rolling dice and moving the player."""
+    __slots__ = ("dice_roll", "rolled_doubles")
     
     def __init__(self, player: Player):
         super().__init__("RollDice", player)
@@ -278,13 +501,14 @@ class RollDiceAction(Action):
         return f"{self.player.mgn_code} ROLL"
 
     def process(self, state: State) -> None:
-        logger.info(f"[ACTION] {self.player.name} attempts to ROLL dice.")
+        state.bump_version()
+        logger.info("[ACTION] %s attempts to ROLL dice.", self.player.name)
         state.rolled_this_turn = True
         d1, d2 = self.dice_roll
         if self.dice_roll == (0, 0):
-            d1, d2 = random.randint(1, 6), random.randint(1, 6)
+            d1, d2 = _roll_two()
             self.dice_roll = (d1, d2)
-            logger.info(f"[ACTION] {self.player.name} rolled dice: {self.dice_roll}")
+            logger.info("[ACTION] %s rolled dice: %s", self.player.name, self.dice_roll)
         
         self.rolled_doubles = (d1 == d2)
         
@@ -294,56 +518,58 @@ class RollDiceAction(Action):
             state.current_consecutive_doubles = 0
         
         if state.current_consecutive_doubles >= 3:
-            logger.info(f"[ACTION] {self.player.name} rolled three consecutive doubles! Going to jail.")
+            logger.info("[ACTION] %s rolled three consecutive doubles! Going to jail.", self.player.name)
             state.send_player_to_jail(self.player)
             state.rolled_this_turn = True  
             return
         
         old_pos = self.player.position
-        total = d1 + d2
-        self.player.position = (old_pos + total) % len(state.board.board)
+        new_raw = old_pos + d1 + d2
+        passed_go = new_raw >= state.board.size
+        self.player.position = new_raw - state.board.size if passed_go else new_raw
         
-        if old_pos + total >= len(state.board.board):
+        if passed_go:
             self.player.balance += 200
-            logger.info(f"[ACTION] {self.player.name} passed Go, +$200 => {self.player.balance}")
+            logger.info("[ACTION] %s passed Go, +$200 => %s", self.player.name, self.player.balance)
         
-        logger.info(f"[ACTION] {self.player.name} moves from {old_pos} to {self.player.position}")
+        logger.info("[ACTION] %s moves from %s to %s", self.player.name, old_pos, self.player.position)
         state.handle_landing_on_tile(player=self.player, dice_roll=(d1, d2))
 
         if self.rolled_doubles:
-            logger.info(f"[ACTION] {self.player.name} rolled doubles; may roll again.")
+            logger.info("[ACTION] %s rolled doubles; may roll again.", self.player.name)
         else:
             state.rolled_this_turn = True
-            logger.info(f"[ACTION] {self.player.name} normal roll => done rolling for this turn.")
+            logger.info("[ACTION] %s normal roll => done rolling for this turn.", self.player.name)
 
 
     @classmethod
+    @_version_cached("flat")
     def to_action_mask_flat(cls, state: State) -> List[bool]:
         current_player = state.current_player()
 
-        if current_player.in_jail or state.auction_state is not None or state.pending_trade is not None:
+        if current_player.in_jail or state.actions_blocked:
             valid = False
         else:
             valid = (not state.rolled_this_turn)
-        return [valid]
+        return _bit(valid)
 
     @classmethod
     def flat_parameter_size(cls) -> int:
-        return 0 
+        return 1
 
     @classmethod
+    @_version_cached("hierarchical")
     def to_action_mask_hierarchical(cls, state: State) -> Dict[str, List[bool]]:
-        if state == None:
-            return
         current_player = state.current_player()
-        if current_player.in_jail or state.auction_state is not None or state.pending_trade is not None:
+        if current_player.in_jail or state.actions_blocked:
             valid = False
         else:
             valid = (not state.rolled_this_turn)
 
-        return {"roll": [valid]}
+        return {"roll": _bit(valid)}
 
     @classmethod
+    @_class_cached
     def hierarchical_parameters(cls) -> Dict[str, Space]:
         return {} 
 
@@ -357,7 +583,7 @@ class RollDiceAction(Action):
 
     @classmethod
     def from_dict(cls, data: Dict, state: State) -> RollDiceAction:
-        player = next(p for p in state.players if p.mgn_code == data["mgn_code"])
+        player = state.players_by_mgn[data["mgn_code"]]
         action = RollDiceAction(player)
         action.dice_roll = tuple(data.get("dice_roll", (0, 0)))
         action.rolled_doubles = data.get("rolled_doubles", False)
@@ -365,6 +591,8 @@ class RollDiceAction(Action):
 
 
 class EndTurnAction(Action):
+    __slots__ = ()
+
     def __init__(self, player: Player):
         super().__init__("EndTurn", player)
 
@@ -372,6 +600,7 @@ class EndTurnAction(Action):
         return f"{self.player.mgn_code} ENDTURN"
 
     def process(self, state: State) -> None:
+        state.bump_version()
         state.rolled_this_turn = False
         if state.current_consecutive_doubles == 0:
             if state.auction_state:
@@ -381,11 +610,12 @@ class EndTurnAction(Action):
                 state.advance_turn(self.player)
 
     @classmethod
+    @_version_cached("flat")
     def to_action_mask_flat(cls, state: State) -> List[bool]:
         current_player = state.current_player()
-        tile = state.board.board[current_player.position]
+        tile = state.current_property()
         must_decide_property = (
-            isinstance(tile, Property) 
+            tile is not None
             and tile.owner is None 
             and state.auction_state is None
             and state.rolled_this_turn is True
@@ -393,27 +623,29 @@ class EndTurnAction(Action):
         has_negative_balance = current_player.balance < 0
         in_auction = not state.auction_state is None
         valid = not must_decide_property and not in_auction and not has_negative_balance and state.pending_trade is None and state.rolled_this_turn
-        return [valid]
+        return _bit(valid)
 
     @classmethod
     def flat_parameter_size(cls) -> int:
         return 1
 
     @classmethod
+    @_version_cached("hierarchical")
     def to_action_mask_hierarchical(cls, state: State) -> Dict[str, List[bool]]:
         current_player = state.current_player()
-        tile = state.board.board[current_player.position]
+        tile = state.current_property()
         must_decide_property = (
-            isinstance(tile, Property) 
+            tile is not None
             and tile.owner is None 
             and state.auction_state is None
         )
         has_negative_balance = current_player.balance < 0
         in_auction = not state.auction_state is None
         valid = not must_decide_property and not in_auction and not has_negative_balance and state.pending_trade is None and state.rolled_this_turn == True
-        return {"valid": [valid]}
+        return {"valid": _bit(valid)}
 
     @classmethod
+    @_class_cached
     def hierarchical_parameters(cls) -> Dict[str, Space]:
         return {"valid": Discrete(1)}
 
@@ -422,10 +654,12 @@ class EndTurnAction(Action):
 
     @classmethod
     def from_dict(cls, data: Dict, state: State) -> EndTurnAction:
-        player = next(p for p in state.players if p.mgn_code == data["mgn_code"])
+        player = state.players_by_mgn[data["mgn_code"]]
         return EndTurnAction(player)
 
 class BuyAction(Action):
+    __slots__ = ("property", "price")
+
     def __init__(self, player: Player, property: Property):
         super().__init__("Buy", player)
         self.property = property
@@ -436,43 +670,52 @@ class BuyAction(Action):
 
     def process(self, state: State) -> None:
         if self.player.balance >= self.price and self.property.owner is None:
-            self.property.owner = self.player
-            self.player.balance -= self.price
-            self.player.properties.append(self.property)
+            self.process_unchecked(state)
+        else:
+            state.bump_version()
+
+    def process_unchecked(self, state: State) -> None:
+        state.bump_version()
+        self.property.owner = self.player
+        self.player.balance -= self.price
+        self.player.properties.append(self.property)
 
     @classmethod
+    @_version_cached("flat")
     def to_action_mask_flat(cls, state: State) -> List[bool]:
         current_player = state.current_player()
-        tile = state.board.board[current_player.position]
+        tile = state.current_property()
         valid = (
-            isinstance(tile, Property)
+            tile is not None
             and tile.owner is None
             and current_player.balance >= tile.purchase_cost
             and state.auction_state is None
             and state.pending_trade is None
             and not state.property_decision_made_this_landing
         )
-        return [valid]
+        return _bit(valid)
 
     @classmethod
     def flat_parameter_size(cls) -> int:
         return 1
 
     @classmethod
+    @_version_cached("hierarchical")
     def to_action_mask_hierarchical(cls, state: State) -> Dict[str, List[bool]]:
         current_player = state.current_player()
-        tile = state.board.board[current_player.position]
+        tile = state.current_property()
         valid = (
-            isinstance(tile, Property)
+            tile is not None
             and tile.owner is None
             and current_player.balance >= tile.purchase_cost
             and state.auction_state is None
             and state.pending_trade is None
             and not state.property_decision_made_this_landing
         )
-        return {"property": [valid]}
+        return {"property": _bit(valid)}
 
     @classmethod
+    @_class_cached
     def hierarchical_parameters(cls) -> Dict[str, Space]:
         return {"property": Discrete(1)}
 
@@ -485,11 +728,13 @@ class BuyAction(Action):
 
     @classmethod
     def from_dict(cls, data: Dict, state: State) -> BuyAction:
-        player = next(p for p in state.players if p.mgn_code == data["mgn_code"])
+        player = state.players_by_mgn[data["mgn_code"]]
         prop = state.board.board[data["property_index"]]
         return BuyAction(player, prop)
 
 class AuctionAction(Action):
+    __slots__ = ("property",)
+
     def __init__(self, player: Player, property: Property):
         super().__init__("Auction", player)
         self.property = property
@@ -498,6 +743,7 @@ class AuctionAction(Action):
         return f"AU@{self.property.index}"
 
     def process(self, state: State) -> None:
+        state.bump_version()
         state.auction_state = AuctionState(
             aucition_item=self.property,
             participants=[player for player in state.players],
@@ -506,24 +752,25 @@ class AuctionAction(Action):
         )
 
     @classmethod
+    @_version_cached("flat")
     def to_action_mask_flat(cls, state: State) -> List[bool]:
-        current_player = state.current_player()
-        tile = state.board.board[current_player.position]
-        valid = isinstance(tile, Property) and tile.owner is None  and state.auction_state is None and state.pending_trade is None and not state.property_decision_made_this_landing
-        return [valid]
+        tile = state.current_property()
+        valid = tile is not None and tile.owner is None  and state.auction_state is None and state.pending_trade is None and not state.property_decision_made_this_landing
+        return _bit(valid)
 
     @classmethod
     def flat_parameter_size(cls) -> int:
         return 1
 
     @classmethod
+    @_version_cached("hierarchical")
     def to_action_mask_hierarchical(cls, state: State) -> Dict[str, List[bool]]:
-        current_player = state.current_player()
-        tile = state.board.board[current_player.position]
-        valid = isinstance(tile, Property) and tile.owner is None and state.auction_state is None and state.pending_trade is None and not state.property_decision_made_this_landing
-        return {"auction_item": [valid]}
+        tile = state.current_property()
+        valid = tile is not None and tile.owner is None and state.auction_state is None and state.pending_trade is None and not state.property_decision_made_this_landing
+        return {"auction_item": _bit(valid)}
 
     @classmethod
+    @_class_cached
     def hierarchical_parameters(cls) -> Dict[str, Space]:
         return {"auction_item": Discrete(1)}
 
@@ -536,11 +783,14 @@ class AuctionAction(Action):
 
     @classmethod
     def from_dict(cls, data: Dict, state: State) -> AuctionAction:
-        player = next(p for p in state.players if p.mgn_code == data["mgn_code"])
+        player = state.players_by_mgn[data["mgn_code"]]
         prop = state.board.board[data["property_index"]]
         return AuctionAction(player, prop)
 
 class AuctionBidAction(Action):
+    __slots__ = ("bid_amount",)
+    IDLE_HIERARCHICAL_MASK = {"bid_amount": _BID_TEMPLATE}
+
     def __init__(self, player: Player, bid_amount: int):
         super().__init__("AuctionBid", player)
         self.bid_amount = bid_amount
@@ -549,9 +799,15 @@ class AuctionBidAction(Action):
         return f"{self.player.mgn_code}.${self.bid_amount}"
 
     def process(self, state: State) -> None:
-        #print("Processing auction bid action")
         if state.auction_state:
-            state.auction_state.bids.append(AuctionBid(self.player, self.bid_amount))
+            self.process_unchecked(state)
+        else:
+            state.bump_version()
+
+    def process_unchecked(self, state: State) -> None:
+        state.bump_version()
+        #print("Processing auction bid action")
+        state.auction_state.bids.append(AuctionBid(self.player, self.bid_amount))
         if state.auction_state.is_done():
             #print("Auctioning is done. resolving.")
             state.auction_state.resolve(state)
@@ -562,36 +818,37 @@ class AuctionBidAction(Action):
 
 
     @classmethod
-    def to_action_mask_flat(cls, state: State) -> List[bool]:
+    def _bid_mask(cls, state: State) -> np.ndarray:
         if not state.auction_state:
-            return [False] * (MAX_CASH + 1)
+            return _BID_TEMPLATE
 
         current_player = state.auction_state.participants[state.auction_state.current_bidder_index]
         highest_bid = state.auction_state.highest_bid()
         min_bid = (highest_bid.bid_amount + 1) if highest_bid else 1
         max_bid = current_player.balance
+        if max_bid < min_bid:
+            return _BID_TEMPLATE
 
-        return [(min_bid <= i <= max_bid) for i in range(MAX_CASH + 1)]
+        mask = _BID_TEMPLATE.copy()
+        mask[min_bid:max_bid + 1] = True
+        return mask
+
+    @classmethod
+    @_version_cached("flat")
+    def to_action_mask_flat(cls, state: State) -> np.ndarray:
+        return cls._bid_mask(state)
 
     @classmethod
     def flat_parameter_size(cls) -> int:
         return MAX_CASH + 1
 
     @classmethod
-    def to_action_mask_hierarchical(cls, state: State) -> Dict[str, List[bool]]:
-        if not state.auction_state:
-            return {"bid_amount": [False]*(MAX_CASH+1)}
-
-        current_player = state.auction_state.participants[state.auction_state.current_bidder_index]
-        highest_bid = state.auction_state.highest_bid()
-        min_bid = (highest_bid.bid_amount + 1) if highest_bid else 1
-        max_bid = current_player.balance
-
-        return {
-            "bid_amount": [(min_bid <= i <= max_bid) for i in range(MAX_CASH + 1)]
-        }
+    @_version_cached("hierarchical")
+    def to_action_mask_hierarchical(cls, state: State) -> Dict[str, np.ndarray]:
+        return {"bid_amount": cls._bid_mask(state)}
 
     @classmethod
+    @_class_cached
     def hierarchical_parameters(cls) -> Dict[str, Space]:
         return {"bid_amount": Discrete(MAX_CASH + 1)}
 
@@ -604,10 +861,12 @@ class AuctionBidAction(Action):
 
     @classmethod
     def from_dict(cls, data: Dict, state: State) -> AuctionBidAction:
-        player = next(p for p in state.players if p.mgn_code == data["mgn_code"])
+        player = state.players_by_mgn[data["mgn_code"]]
         return AuctionBidAction(player, data["bid_amount"])
 
 class MortgageAction(Action):
+    __slots__ = ("property",)
+
     def __init__(self, player: Player, property: Property):
         super().__init__("Mortgage", player)
         self.property = property
@@ -618,37 +877,41 @@ class MortgageAction(Action):
     def process(self, state: State) -> None:
         #print(f"attempting to mortgage {self.property.to_dict()}")
         if not self.property.is_mortgaged:
-            self.property.is_mortgaged = True
-            self.player.balance += self.property.mortgage_price
+            self.process_unchecked(state)
+        else:
+            state.bump_version()
+
+    def process_unchecked(self, state: State) -> None:
+        state.bump_version()
+        self.property.is_mortgaged = True
+        self.player.balance += self.property.mortgage_price
 
     @classmethod
-    def to_action_mask_flat(cls, state: State) -> List[bool]:
+    def _property_mask(cls, state: State) -> np.ndarray:
+        if state.actions_blocked:
+            return _NO_PROPERTIES
+        mask = np.zeros(MAX_PROPERTIES, dtype=np.bool_)
         current_player = state.current_player()
-        mask = [False] * MAX_PROPERTIES
-        if state.auction_state is not None or state.pending_trade is not None:
-            return mask
-        for prop in current_player.properties:
-            if isinstance(prop, Property) and not prop.is_mortgaged:
-                mask[prop.property_idx] = True
+        mask[[prop.property_idx for prop in current_player.properties if not prop.is_mortgaged]] = True
         return mask
 
+    @classmethod
+    @_version_cached("flat")
+    def to_action_mask_flat(cls, state: State) -> np.ndarray:
+        return cls._property_mask(state)
+
 
     @classmethod
     def flat_parameter_size(cls) -> int:
         return MAX_PROPERTIES
 
     @classmethod
-    def to_action_mask_hierarchical(cls, state: State) -> Dict[str, List[bool]]:
-        current_player = state.current_player()
-        prop_mask = [False] * MAX_PROPERTIES
-        if state.auction_state is not None or state.pending_trade is not None:
-            return {"property": prop_mask}
-        for prop in current_player.properties:
-            if isinstance(prop, Property) and not prop.is_mortgaged:
-                prop_mask[prop.property_idx] = True
-        return {"property": prop_mask}
+    @_version_cached("hierarchical")
+    def to_action_mask_hierarchical(cls, state: State) -> Dict[str, np.ndarray]:
+        return {"property": cls._property_mask(state)}
 
     @classmethod
+    @_class_cached
     def hierarchical_parameters(cls) -> Dict[str, Space]:
         return {"property": Discrete(MAX_PROPERTIES)}
 
@@ -661,11 +924,13 @@ class MortgageAction(Action):
 
     @classmethod
     def from_dict(cls, data: Dict, state: State) -> MortgageAction:
-        player = next(p for p in state.players if p.mgn_code == data["mgn_code"])
+        player = state.players_by_mgn[data["mgn_code"]]
         prop = state.board.board[data["property_index"]]
         return MortgageAction(player, prop)
 
 class UnmortgageAction(Action):
+    __slots__ = ("property",)
+
     def __init__(self, player: Player, property: Property):
         super().__init__("Unmortgage", player)
         self.property = property
@@ -677,36 +942,44 @@ class UnmortgageAction(Action):
         #print(f"current player is = {state.current_player().mgn_code}")
         #print(f"attempting to unmortgage {self.property.to_dict()}")
         if self.property.is_mortgaged and self.player.balance >= self.property.unmortgage_price:
-            self.property.is_mortgaged = False
-            self.player.balance -= self.property.unmortgage_price
+            self.process_unchecked(state)
+        else:
+            state.bump_version()
+
+    def process_unchecked(self, state: State) -> None:
+        state.bump_version()
+        self.property.is_mortgaged = False
+        self.player.balance -= self.property.unmortgage_price
 
     @classmethod
-    def to_action_mask_flat(cls, state: State) -> List[bool]:
+    def _property_mask(cls, state: State) -> np.ndarray:
+        if state.actions_blocked:
+            return _NO_PROPERTIES
+        mask = np.zeros(MAX_PROPERTIES, dtype=np.bool_)
         current_player = state.current_player()
-        mask = [False] * MAX_PROPERTIES
-        if state.auction_state is not None or state.pending_trade is not None:
-            return mask
-        for prop in current_player.properties:
-            if isinstance(prop, Property) and prop.is_mortgaged and current_player.balance >= prop.unmortgage_price:
-                mask[prop.property_idx] = True
+        balance = current_player.balance
+        mask[[
+            prop.property_idx for prop in current_player.properties
+            if prop.is_mortgaged and balance >= prop.unmortgage_price
+        ]] = True
         return mask
 
+    @classmethod
+    @_version_cached("flat")
+    def to_action_mask_flat(cls, state: State) -> np.ndarray:
+        return cls._property_mask(state)
+
     @classmethod
     def flat_parameter_size(cls) -> int:
         return MAX_PROPERTIES
 
     @classmethod
-    def to_action_mask_hierarchical(cls, state: State) -> Dict[str, List[bool]]:
-        current_player = state.current_player()
-        prop_mask = [False] * MAX_PROPERTIES
-        if state.auction_state is not None or state.pending_trade is not None:
-            return {"property": prop_mask}
-        for prop in current_player.properties:
-            if isinstance(prop, Property) and prop.is_mortgaged and current_player.balance >= prop.unmortgage_price:
-                prop_mask[prop.property_idx] = True
-        return {"property": prop_mask}
+    @_version_cached("hierarchical")
+    def to_action_mask_hierarchical(cls, state: State) -> Dict[str, np.ndarray]:
+        return {"property": cls._property_mask(state)}
 
     @classmethod
+    @_class_cached
     def hierarchical_parameters(cls) -> Dict[str, Space]:
         return {"property": Discrete(MAX_PROPERTIES)}
 
@@ -719,11 +992,13 @@ class UnmortgageAction(Action):
 
     @classmethod
     def from_dict(cls, data: Dict, state: State) -> UnmortgageAction:
-        player = next(p for p in state.players if p.mgn_code == data["mgn_code"])
+        player = state.players_by_mgn[data["mgn_code"]]
         prop = state.board.board[data["property_index"]]
         return UnmortgageAction(player, prop)
 
 class BuildAction(Action):
+    __slots__ = ("street", "quantity")
+
     def __init__(self, player: Player, street: Street, quantity: int):
         super().__init__("Build", player)
         self.street = street
@@ -733,6 +1008,15 @@ class BuildAction(Action):
         return f"{self.player.mgn_code} H@{self.street.index}x{self.quantity}"
 
     def process(self, state: State) -> None:
+        try:
+            self._build(state)
+        finally:
+            # _build consults the state's memoized build predicates before it
+            # changes any buildings; start a new version so they are recomputed.
+            state.bump_version()
+
+    def _build(self, state: State) -> None:
+        state.bump_version()
         current_player = self.player
 
         if not isinstance(self.street, Street):
@@ -809,12 +1093,8 @@ class BuildAction(Action):
 
         if building_type_attempted == BuildingType.HOUSE and self.quantity > 1:
             new_total = self.street.houses + self.quantity
-            same_color_streets = [
-                s for s in state.board.board
-                if isinstance(s, Street) and s.color_set == self.street.color_set
-            ]
-            for other in same_color_streets:
-                if other is not self.street and other.houses < new_total - 1:
+            for other in state.board.color_set_peers[self.street.index]:
+                if other.houses < new_total - 1:
                     raise Exception(f"Cannot build due to even-build rule on {other.name}")
 
         else:
@@ -845,19 +1125,25 @@ class BuildAction(Action):
             threshold_needed = HOTEL_AUCTION_THRESHOLD
         
         if is_shortage:
-            competitors = state.get_potential_building_auction_competitors(
+            competitor_count = state.count_potential_building_auction_competitors(
                 initiator=current_player,
                 building_type_to_auction=building_type_attempted,
-                cost_basis_property=self.street
+                cost_basis_property=self.street,
+                up_to=threshold_needed,
             )
-            if len(competitors) >= threshold_needed:
+            if competitor_count >= threshold_needed:
+                competitors = state.get_potential_building_auction_competitors(
+                    initiator=current_player,
+                    building_type_to_auction=building_type_attempted,
+                    cost_basis_property=self.street
+                )
                 logger.info(f"Building shortage for {building_type_attempted.name} on {self.street.name}. "
                             f"Available: H:{state.houses_available}, HTL:{state.hotels_available}. "
                             f"Competitors: {len(competitors)}. Triggering auction.")
                 
                 auction_participants = [current_player] + competitors
                 try:
-                    initial_bidder_idx_in_game_players = state.players.index(current_player)
+                    initial_bidder_idx_in_game_players = state.player_index(current_player)
                 except ValueError:
                     logger.error(f"CRITICAL: Initiator {current_player.name} not in state.players. Cannot start auction.")
                     return
@@ -882,92 +1168,86 @@ class BuildAction(Action):
         logger.info(f"No building auction triggered for {current_player.name}'s attempt on {self.street.name}. Proceeding with normal build.")
 
 
-        if building_type_attempted == BuildingType.HOUSE:
-            can_build_this_many = True
-            for _ in range(self.quantity):
-                if not state.player_can_build_on_property(current_player, self.street, BuildingType.HOUSE, check_even_build=True):
-
-                    if self.quantity > 1: logger.warning("Multi-house even build check is simplified here.")
-                    pass
-
-                if not can_build_this_many:
-                    logger.warning(f"{current_player.name} cannot build {self.quantity} houses on {self.street.name} due to even-build rules for the full quantity.")
-                    return
+        if self._BUILD_OPS[building_type_attempted](self, state):
+            state.property_decision_made_this_landing = True
 
-            total_cost = self.street.color_set.house_cost * self.quantity
-            if current_player.balance < total_cost:
-                logger.warning(f"{current_player.name} cannot afford to build {self.quantity} house(s) for ${total_cost} on {self.street.name}.")
-                return
-            if state.houses_available < self.quantity:
-                logger.warning(f"Not enough houses in bank ({state.houses_available}) to build {self.quantity} for {current_player.name} on {self.street.name}.")
-                return
-            
-            current_player.balance -= total_cost
-            state.houses_available -= self.quantity
-            self.street.houses += self.quantity
-            logger.info(f"{current_player.name} built {self.quantity} house(s) on {self.street.name}. Houses left: {self.street.houses}.")
-
-        elif building_type_attempted == BuildingType.HOTEL:
-            if self.street.houses != 4:
-                logger.warning(f"{current_player.name} cannot build hotel on {self.street.name}: needs 4 houses first.")
-                return
-            
-            total_cost = self.street.color_set.hotel_cost
-            if current_player.balance < total_cost:
-                logger.warning(f"{current_player.name} cannot afford to build hotel for ${total_cost} on {self.street.name}.")
-                return
-            if state.hotels_available < 1:
-                logger.warning(f"Not enough hotels in bank ({state.hotels_available}) for {current_player.name} on {self.street.name}.")
-                return
-
-            current_player.balance -= total_cost
-            state.hotels_available -= 1
-            state.houses_available += 4
-            self.street.houses = 0
-            self.street.hotels = 1
-            logger.info(f"{current_player.name} built a hotel on {self.street.name}.")
-        
-        state.property_decision_made_this_landing = True
-
-    @classmethod
+    def _place_houses(self, state: State) -> bool:
+        current_player = self.player
+        # The multi-house even-build rule was enforced against the whole
+        # color set above; this only flags the simplified single-step check.
+        if self.quantity > 1 and not state.player_can_build_on_property(current_player, self.street, BuildingType.HOUSE, check_even_build=True):
+            logger.warning("Multi-house even build check is simplified here.")
+
+        total_cost = self.street.color_set.house_cost * self.quantity
+        if current_player.balance < total_cost:
+            logger.warning(f"{current_player.name} cannot afford to build {self.quantity} house(s) for ${total_cost} on {self.street.name}.")
+            return False
+        if state.houses_available < self.quantity:
+            logger.warning(f"Not enough houses in bank ({state.houses_available}) to build {self.quantity} for {current_player.name} on {self.street.name}.")
+            return False
+
+        current_player.balance -= total_cost
+        state.houses_available -= self.quantity
+        self.street.houses += self.quantity
+        logger.info(f"{current_player.name} built {self.quantity} house(s) on {self.street.name}. Houses left: {self.street.houses}.")
+        return True
+
+    def _place_hotel(self, state: State) -> bool:
+        current_player = self.player
+        if self.street.houses != 4:
+            logger.warning(f"{current_player.name} cannot build hotel on {self.street.name}: needs 4 houses first.")
+            return False
+
+        total_cost = self.street.color_set.hotel_cost
+        if current_player.balance < total_cost:
+            logger.warning(f"{current_player.name} cannot afford to build hotel for ${total_cost} on {self.street.name}.")
+            return False
+        if state.hotels_available < 1:
+            logger.warning(f"Not enough hotels in bank ({state.hotels_available}) for {current_player.name} on {self.street.name}.")
+            return False
+
+        current_player.balance -= total_cost
+        state.hotels_available -= 1
+        state.houses_available += 4
+        self.street.houses = 0
+        self.street.hotels = 1
+        logger.info(f"{current_player.name} built a hotel on {self.street.name}.")
+        return True
+
+    # How a normal (non-auction) build of each building type is placed.
+    _BUILD_OPS = {
+        BuildingType.HOUSE: _place_houses,
+        BuildingType.HOTEL: _place_hotel,
+    }
+
+    @classmethod
+    @_version_cached("flat")
     def to_action_mask_flat(cls, state: State) -> List[bool]:
+        if state.actions_blocked:
+            return _NO_BUILDS
         current_player = state.current_player()
-        mask = [False] * (MAX_STREETS * MAX_BUILD_COUNT)
-        if state.auction_state or state.pending_trade:
+        mask = np.zeros(MAX_STREETS * MAX_BUILD_COUNT, dtype=np.bool_)
+        streets = [street for street in state.buildable_streets(current_player) if street.hotels == 0]
+        if not streets:
             return mask
-        for street in current_player.properties:
-            if isinstance(street, Street) and state.player_has_complete_color_set(current_player, street.color_set) and not street.is_mortgaged:
-                if street.hotels > 0:
-                    continue
-                
-                same_color_streets = [
-                    s for s in state.board.board
-                    if isinstance(s, Street) and s.color_set == street.color_set
-                ]
-
-                max_build = min(5 - street.houses, state.houses_available)
-                if max_build <= 0:
-                    continue
-
-                for qty in range(1, max_build + 1):
-                    new_total = street.houses + qty
-
-                    can_build = True
-                    for other in same_color_streets:
-                        if other == street:
-                            continue 
-                        if other.houses < (new_total - 1):
-                            can_build = False
-                            break
-
-                    if can_build:
-                        idx = street.street_idx * MAX_BUILD_COUNT + (qty - 1)
-                        cost_of_build = street.color_set.house_cost * qty
-                        if 0 <= idx < len(mask):
-                            mask[idx] = current_player.balance >= cost_of_build
-                        else:
-                            logger.error(f"BuildAction mask index out of range: {idx}")
 
+        # Valid quantities for a street form a prefix 1..n, where n is capped by
+        # houses left on the street and in the bank, affordability, and the
+        # even-build rule against the rest of its color set.
+        houses = np.array([street.houses for street in streets])
+        lowest_other = np.array([
+            min((other.houses for other in state.board.color_set_peers[street.index]), default=MAX_BUILD_COUNT)
+            for street in streets
+        ])
+        street_idxs = [street.street_idx for street in streets]
+        n = np.minimum.reduce([
+            5 - houses,
+            lowest_other + 1 - houses,
+            current_player.balance // state.board.house_costs[street_idxs],
+        ])
+        n = np.minimum(n, state.houses_available)
+
+        mask.reshape(MAX_STREETS, MAX_BUILD_COUNT)[street_idxs] = _BUILD_QTY_OFFSETS < n[:, None]
         return mask
 
 
@@ -976,6 +1256,7 @@ class BuildAction(Action):
         return MAX_STREETS * MAX_BUILD_COUNT
 
     @classmethod
+    @_version_cached("hierarchical")
     def to_action_mask_hierarchical(cls, state: State) -> Dict[str, List[bool]]:
         current_player = state.current_player()
 
@@ -983,8 +1264,8 @@ class BuildAction(Action):
         state.auction_state.placing_building_after_win and \
         state.auction_state.building_winner == current_player:
             
-            street_param_mask = [False] * MAX_STREETS
-            quantity_param_mask = [False] * MAX_BUILD_COUNT
+            street_param_mask = np.zeros(MAX_STREETS, dtype=np.bool_)
+            quantity_param_mask = np.zeros(MAX_BUILD_COUNT, dtype=np.bool_)
             quantity_param_mask[0] = True
             building_to_place = state.auction_state.building_type_to_place
             
@@ -998,33 +1279,27 @@ class BuildAction(Action):
                 "quantity": quantity_param_mask,
             }
         
-        if state.auction_state or state.pending_trade:
-            return {"street": [False] * MAX_STREETS, "quantity": [False] * MAX_BUILD_COUNT}
-
-        pairs = []
-        for property_candidate in current_player.properties:
-            if not isinstance(property_candidate, Street):
-                continue
-            street = property_candidate
-            if state.player_can_build_on_property(current_player, street, BuildingType.HOUSE):
-                if current_player.balance >= street.color_set.house_cost and state.houses_available > 0:
-                    pairs.append((street.street_idx, 1))
-                    
-            if state.player_can_build_on_property(current_player, street, BuildingType.HOTEL):
-                if current_player.balance >= street.color_set.hotel_cost and state.hotels_available > 0:
-                    pairs.append((street.street_idx, 5))
-                    
-        street_mask = [False] * MAX_STREETS
-        quantity_mask = [False] * MAX_BUILD_COUNT
-        
-        if not pairs:
-            return {"street": street_mask, "quantity": quantity_mask}
+        if state.actions_blocked:
+            return _DISABLED_BUILD_MASK
+
+        balance = current_player.balance
+        pairs = [
+            (street.street_idx, qty)
+            for street in state.buildable_streets(current_player)
+            for qty, building_type, cost, available in (
+                (1, BuildingType.HOUSE, street.color_set.house_cost, state.houses_available),
+                (5, BuildingType.HOTEL, street.color_set.hotel_cost, state.hotels_available),
+            )
+            if available > 0 and balance >= cost
+            and state.player_can_build_on_property(current_player, street, building_type)
+        ]
 
-        for s_idx, qty in pairs:
-            if 0 <= s_idx < MAX_STREETS:
-                street_mask[s_idx] = True
-            if 1 <= qty <= MAX_BUILD_COUNT:
-                quantity_mask[qty - 1] = True
+        street_mask = np.zeros(MAX_STREETS, dtype=np.bool_)
+        quantity_mask = np.zeros(MAX_BUILD_COUNT, dtype=np.bool_)
+        for s_idx in {s_idx for s_idx, _ in pairs}:
+            street_mask[s_idx] = True
+        for qty in {qty for _, qty in pairs}:
+            quantity_mask[qty - 1] = True
 
         return {
             "street": street_mask,
@@ -1033,6 +1308,7 @@ class BuildAction(Action):
 
 
     @classmethod
+    @_class_cached
     def hierarchical_parameters(cls) -> Dict[str, Space]:
         return {
             "street": Discrete(MAX_STREETS),
@@ -1050,11 +1326,13 @@ class BuildAction(Action):
 
     @classmethod
     def from_dict(cls, data: Dict, state: State) -> BuildAction:
-        player = next(p for p in state.players if p.mgn_code == data["mgn_code"])
+        player = state.players_by_mgn[data["mgn_code"]]
         street = state.board.streets[data["street_index"]]
         return BuildAction(player, street, data["quantity"])
 
 class SellBuildingAction(Action):
+    __slots__ = ("street", "quantity")
+
     def __init__(self, player: Player, street: Street, quantity: int):
         super().__init__("SellBuilding", player)
         self.street = street
@@ -1064,6 +1342,7 @@ class SellBuildingAction(Action):
         return f"{self.player.mgn_code} SH@{self.street.index}x{self.quantity}"
 
     def process(self, state: State) -> None:
+        state.bump_version()
         if self.street.houses >= self.quantity:
             refund = (self.street.color_set.house_cost * self.quantity) // 2
             self.street.sell(self.quantity)
@@ -1071,20 +1350,17 @@ class SellBuildingAction(Action):
             state.houses_available += self.quantity
 
     @classmethod
+    @_version_cached("flat")
     def to_action_mask_flat(cls, state: State) -> List[bool]:
+        if state.actions_blocked:
+            return _NO_BUILDS
         current_player = state.current_player()
-        mask = [False] * (MAX_STREETS * MAX_BUILD_COUNT)
-        if state.auction_state or state.pending_trade:
-            return mask
-        for street in current_player.properties:
-            if isinstance(street, Street) and street.houses > 0:
-                max_sell = min(street.houses, 5)
-                for qty in range(1, max_sell + 1):
-                    idx = street.street_idx * MAX_BUILD_COUNT + (qty - 1)
-                    if 0 <= idx < len(mask):
-                        mask[idx] = True
-                    else:
-                        logger.error(f"SellBuildingAction mask index out of range: {idx}")
+        mask = np.zeros(MAX_STREETS * MAX_BUILD_COUNT, dtype=np.bool_)
+        for street in state.streets_owned(current_player):
+            if street.houses > 0:
+                assert 0 <= street.street_idx < MAX_STREETS
+                base = street.street_idx * MAX_BUILD_COUNT
+                mask[base:base + min(street.houses, 5)] = True
 
         return mask
 
@@ -1093,25 +1369,24 @@ class SellBuildingAction(Action):
         return MAX_STREETS * MAX_BUILD_COUNT
 
     @classmethod
+    @_version_cached("hierarchical")
     def to_action_mask_hierarchical(cls, state: State) -> Dict[str, List[bool]]:
+        if state.actions_blocked:
+            return _DISABLED_BUILD_MASK
         current_player = state.current_player()
-        pairs = []
-        for street in current_player.properties:
-            if state.auction_state or state.pending_trade:
-                continue
-            if isinstance(street, Street) and street.houses > 0:
-                max_sell = min(street.houses, 5)
-                for qty in range(1, max_sell + 1):
-                    pairs.append((street.street_idx, qty))
-
-        street_mask = [False] * MAX_STREETS
-        quantity_mask = [False] * MAX_BUILD_COUNT
-        for street_idx, q in pairs:
-            if street_idx >= MAX_STREETS or street_idx < 0:
-                logger.error(f"Invalid street_idx: {street_idx}")
-                continue 
+        pairs = [
+            (street.street_idx, min(street.houses, 5))
+            for street in state.streets_owned(current_player)
+            if street.houses > 0
+        ]
+
+        street_mask = np.zeros(MAX_STREETS, dtype=np.bool_)
+        quantity_mask = np.zeros(MAX_BUILD_COUNT, dtype=np.bool_)
+        max_sell = 0
+        for street_idx, street_max in pairs:
             street_mask[street_idx] = True
-            quantity_mask[q - 1] = True
+            max_sell = max(max_sell, street_max)
+        quantity_mask[:max_sell] = True
 
         return {
             "street": street_mask,
@@ -1119,6 +1394,7 @@ class SellBuildingAction(Action):
         }
 
     @classmethod
+    @_class_cached
     def hierarchical_parameters(cls) -> Dict[str, Space]:
         return {
             "street": Discrete(MAX_STREETS),
@@ -1135,11 +1411,13 @@ class SellBuildingAction(Action):
 
     @classmethod
     def from_dict(cls, data: Dict, state: State) -> SellBuildingAction:
-        player = next(p for p in state.players if p.mgn_code == data["mgn_code"])
+        player = state.players_by_mgn[data["mgn_code"]]
         street = state.board.streets[data["street_index"]]
         return SellBuildingAction(player, street, data["quantity"])
 
 class UseJailCardAction(Action):
+    __slots__ = ()
+
     def __init__(self, player: Player):
         super().__init__("UseJailCard", player)
 
@@ -1147,6 +1425,7 @@ class UseJailCardAction(Action):
         return f"{self.player.mgn_code} GOOJF"
 
     def process(self, state: State) -> None:
+        state.bump_version()
         if self.player.jail_free_cards > 0 and self.player.in_jail:
             self.player.jail_free_cards -= 1
             self.player.in_jail = False
@@ -1154,8 +1433,7 @@ class UseJailCardAction(Action):
 
     @classmethod
     def to_action_mask_flat(cls, state: State) -> List[bool]:
-        current_player = state.current_player()
-        return [current_player.jail_free_cards > 0 and current_player.in_jail and not state.pending_trade and not state.auction_state]
+        return _bit(_player_action_bits(state) & _CAN_USE_JAIL_CARD)
 
     @classmethod 
     def flat_parameter_size(cls) -> int:
@@ -1163,10 +1441,10 @@ class UseJailCardAction(Action):
 
     @classmethod
     def to_action_mask_hierarchical(cls, state: State) -> Dict[str, List[bool]]:
-        current_player = state.current_player()
-        return {"use_card": [current_player.jail_free_cards > 0 and current_player.in_jail and not state.pending_trade and not state.auction_state]}
+        return {"use_card": _bit(_player_action_bits(state) & _CAN_USE_JAIL_CARD)}
 
     @classmethod
+    @_class_cached
     def hierarchical_parameters(cls) -> Dict[str, Space]:
         return {"use_card": Discrete(1)}
 
@@ -1178,10 +1456,12 @@ class UseJailCardAction(Action):
 
     @classmethod
     def from_dict(cls, data: Dict, state: State) -> UseJailCardAction:
-        player = next(p for p in state.players if p.mgn_code == data["mgn_code"])
+        player = state.players_by_mgn[data["mgn_code"]]
         return UseJailCardAction(player)
 
 class PayJailFineAction(Action):
+    __slots__ = ()
+
     def __init__(self, player: Player):
         super().__init__("PayJailFine", player)
 
@@ -1189,6 +1469,7 @@ class PayJailFineAction(Action):
         return f"{self.player.mgn_code} P${JAIL_BAIL_AMOUNT}"
 
     def process(self, state: State) -> None:
+        state.bump_version()
         if self.player.balance >= JAIL_BAIL_AMOUNT and self.player.in_jail:
             self.player.balance -= JAIL_BAIL_AMOUNT
             self.player.in_jail = False
@@ -1196,8 +1477,7 @@ class PayJailFineAction(Action):
 
     @classmethod
     def to_action_mask_flat(cls, state: State) -> List[bool]:
-        current_player = state.current_player()
-        return [current_player.balance >= JAIL_BAIL_AMOUNT and current_player.in_jail and not state.pending_trade and not state.auction_state]
+        return _bit(_player_action_bits(state) & _CAN_PAY_JAIL_FINE)
 
     @classmethod
     def flat_parameter_size(cls) -> int:
@@ -1205,10 +1485,10 @@ class PayJailFineAction(Action):
 
     @classmethod
     def to_action_mask_hierarchical(cls, state: State) -> Dict[str, List[bool]]:
-        current_player = state.current_player()
-        return {"pay_fine": [current_player.balance >= JAIL_BAIL_AMOUNT and current_player.in_jail and not state.pending_trade and not state.auction_state]}
+        return {"pay_fine": _bit(_player_action_bits(state) & _CAN_PAY_JAIL_FINE)}
 
     @classmethod
+    @_class_cached
     def hierarchical_parameters(cls) -> Dict[str, Space]:
         return {"pay_fine": Discrete(1)}
 
@@ -1221,10 +1501,12 @@ class PayJailFineAction(Action):
 
     @classmethod
     def from_dict(cls, data: Dict, state: State) -> PayJailFineAction:
-        player = next(p for p in state.players if p.mgn_code == data["mgn_code"])
+        player = state.players_by_mgn[data["mgn_code"]]
         return PayJailFineAction(player)
 
 class RollJailAction(Action):
+    __slots__ = ()
+
     def __init__(self, player: Player):
         super().__init__("RollJail", player)
 
@@ -1232,13 +1514,13 @@ class RollJailAction(Action):
         return f"{self.player.mgn_code} R"
 
     def process(self, state: State) -> None:
+        state.bump_version()
         if self.player.in_jail and self.player.jail_turns < 3:
             self.player.jail_turns += 1
 
     @classmethod
     def to_action_mask_flat(cls, state: State) -> List[bool]:
-        current_player = state.current_player()
-        return [current_player.in_jail and current_player.jail_turns < 3 and not state.pending_trade and not state.auction_state]
+        return _bit(_player_action_bits(state) & _CAN_ROLL_FOR_JAIL)
 
     @classmethod
     def flat_parameter_size(cls) -> int:
@@ -1246,10 +1528,10 @@ class RollJailAction(Action):
 
     @classmethod
     def to_action_mask_hierarchical(cls, state: State) -> Dict[str, List[bool]]:
-        current_player = state.current_player()
-        return {"roll": [current_player.in_jail and current_player.jail_turns < 3 and not state.pending_trade and not state.auction_state]}
+        return {"roll": _bit(_player_action_bits(state) & _CAN_ROLL_FOR_JAIL)}
 
     @classmethod
+    @_class_cached
     def hierarchical_parameters(cls) -> Dict[str, Space]:
         return {"roll": Discrete(1)}
 
@@ -1262,10 +1544,12 @@ class RollJailAction(Action):
 
     @classmethod
     def from_dict(cls, data: Dict, state: State) -> RollJailAction:
-        player = next(p for p in state.players if p.mgn_code == data["mgn_code"])
+        player = state.players_by_mgn[data["mgn_code"]]
         return RollJailAction(player)
 
 class BankruptcyAction(Action):
+    __slots__ = ()
+
     def __init__(self, player: Player):
         super().__init__("Bankruptcy", player)
 
@@ -1273,15 +1557,14 @@ class BankruptcyAction(Action):
         return f"{self.player.mgn_code} Bankrupt"
 
     def process(self, state: State) -> None:
+        state.bump_version()
         player_to_remove = self.player
         try:
-            original_player_list_idx = state.players.index(player_to_remove)
+            original_player_list_idx = state.player_index(player_to_remove)
         except ValueError:
             logger.error(f"Critical Error: Player {player_to_remove.name} not found in state.players during bankruptcy processing.")
-            original_player_list_idx = state.current_player_index
-            if player_to_remove not in state.players:
-                 logger.error(f"Player {player_to_remove.name} was not in state.players. Cannot remove.")
-                 return
+            logger.error(f"Player {player_to_remove.name} was not in state.players. Cannot remove.")
+            return
 
 
         logger.info(f"Player {player_to_remove.name} is declaring bankruptcy.")
@@ -1300,10 +1583,7 @@ class BankruptcyAction(Action):
         player_to_remove.is_bankrupt = True # Mark player as bankrupt
 
         # Remove player from the game list
-        if player_to_remove in state.players:
-            state.players.pop(original_player_list_idx)
-        else:
-            logger.warning(f"Player {player_to_remove.name} was already removed or not found when trying to pop.")
+        state.remove_player_at(original_player_list_idx)
 
 
         logger.info(f"Player {player_to_remove.name} has been removed from the game.")
@@ -1320,8 +1600,7 @@ class BankruptcyAction(Action):
 
     @classmethod
     def to_action_mask_flat(cls, state: State) -> List[bool]:
-        current_player = state.current_player()
-        return [current_player.balance < 0]
+        return _bit(_player_action_bits(state) & _CAN_GO_BANKRUPT)
 
     @classmethod
     def flat_parameter_size(cls) -> int:
@@ -1329,15 +1608,10 @@ class BankruptcyAction(Action):
 
     @classmethod
     def to_action_mask_hierarchical(cls, state: State) -> Dict[str, List[bool]]:
-        valid = None
-        current_player = state.current_player()
-        if VOLUNTARY_BANKRUPTCY:
-            valid = current_player.balance < 0
-        else:
-            current_player
-        return {"bankrupt": [valid]}
+        return {"bankrupt": _bit(VOLUNTARY_BANKRUPTCY and _player_action_bits(state) & _CAN_GO_BANKRUPT)}
 
     @classmethod
+    @_class_cached
     def hierarchical_parameters(cls) -> Dict[str, Space]:
         return {"bankrupt": Discrete(1)}
 
@@ -1349,10 +1623,13 @@ class BankruptcyAction(Action):
 
     @classmethod
     def from_dict(cls, data: Dict, state: State) -> BankruptcyAction:
-        player = next(p for p in state.players if p.mgn_code == data["mgn_code"])
+        player = state.players_by_mgn[data["mgn_code"]]
         return BankruptcyAction(player)
 
 class AuctionFoldAction(Action):
+    __slots__ = ()
+    IDLE_HIERARCHICAL_MASK = {"fold": _FALSE_BIT}
+
     def __init__(self, player: Player):
         super().__init__("AuctionFold", player)
 
@@ -1360,13 +1637,16 @@ class AuctionFoldAction(Action):
         return f"{self.player.mgn_code}.F"
 
     def process(self, state: State) -> None:
+        state.bump_version()
         #print("Processing auction fold action")
-        if state.auction_state and self.player in state.auction_state.participants:
-            #print(f"Players before={state.auction_state.to_dict()}")
-            state.auction_state.participants.remove(self.player)
-            #print(f"Players after={state.auction_state.to_dict()}")
-        else:
+        participants = state.auction_state.participants if state.auction_state else []
+        try:
+            # One scan for both the membership check and the removal.
+            fold_idx = participants.index(self.player)
+        except ValueError:
             logger.warning(f"{self.player.name} is not a participant in the current auction.")
+        else:
+            del participants[fold_idx]
 
         if state.auction_state.is_done():
             logger.info("Auction is done after folding.")
@@ -1378,8 +1658,7 @@ class AuctionFoldAction(Action):
 
     @classmethod
     def to_action_mask_flat(cls, state: State) -> List[bool]:
-        valid = bool(state.auction_state and len(state.auction_state.participants) >= 1)
-        return [valid]
+        return _bit(_player_action_bits(state) & _CAN_FOLD)
 
     @classmethod
     def flat_parameter_size(cls) -> int:
@@ -1387,10 +1666,10 @@ class AuctionFoldAction(Action):
 
     @classmethod
     def to_action_mask_hierarchical(cls, state: State) -> Dict[str, List[bool]]:
-        valid = bool(state.auction_state and len(state.auction_state.participants) >= 1)
-        return {"fold": [valid]}
+        return {"fold": _bit(_player_action_bits(state) & _CAN_FOLD)}
 
     @classmethod
+    @_class_cached
     def hierarchical_parameters(cls) -> Dict[str, Space]:
         return {"fold": Discrete(1)}
 
@@ -1399,11 +1678,14 @@ class AuctionFoldAction(Action):
 
     @classmethod
     def from_dict(cls, data: Dict, state: State) -> AuctionFoldAction:
-        player = next(p for p in state.players if p.mgn_code == data["mgn_code"])
+        player = state.players_by_mgn[data["mgn_code"]]
         return AuctionFoldAction(player)
 
 class AcceptTradeAction(Action):
     """If a trade is pending, and the current player is the responder, accept it."""
+    __slots__ = ()
+    IDLE_HIERARCHICAL_MASK = {"accept": _FALSE_BIT}
+
     def __init__(self, player: Player):
         super().__init__("AcceptTrade", player)
 
@@ -1411,48 +1693,51 @@ class AcceptTradeAction(Action):
         return f"{self.player.mgn_code} ACCEPT"
 
     def process(self, state: State) -> None:
+        state.bump_version()
         if not state.pending_trade:
             logger.warning("No pending trade to accept.")
             return
 
         trade = state.pending_trade
 
-        if trade.responder != self.player:
-            logger.warning(f"{self.player.name} is not the responder for this pending trade.")
+        if trade.responder is not self.player:
+            logger.warning("%s is not the responder for this pending trade.", self.player.name)
             return
 
-        logger.info(f"{self.player.name} accepts trade from {trade.proposer.name}")
+        logger.info("%s accepts trade from %s", self.player.name, trade.proposer.name)
         self._execute_trade(state, trade)
-
-        state.pending_trade = None
+        state.resolve_trade()
 
     def _execute_trade(self, state: State, trade: TradeOffer):
         proposer = trade.proposer
         responder = trade.responder
 
         if proposer.balance < trade.cash_offered:
-            logger.error(f"Trade failed: Proposer {proposer.name} lacks cash ${trade.cash_offered}")
+            logger.error("Trade failed: Proposer %s lacks cash $%s", proposer.name, trade.cash_offered)
             return
         if proposer.jail_free_cards < trade.get_out_of_jail_cards_offered:
-             logger.error(f"Trade failed: Proposer {proposer.name} lacks jail cards ({trade.get_out_of_jail_cards_offered})")
+             logger.error("Trade failed: Proposer %s lacks jail cards (%s)", proposer.name, trade.get_out_of_jail_cards_offered)
              return
+        proposer_owned = set(proposer.properties)
         for prop in trade.properties_offered:
-            if prop not in proposer.properties:
-                logger.error(f"Trade failed: Proposer {proposer.name} does not own {prop.name}")
+            if prop not in proposer_owned:
+                logger.error("Trade failed: Proposer %s does not own %s", proposer.name, prop.name)
                 return
 
         if responder.balance < trade.cash_asking:
-            logger.error(f"Trade failed: Responder {responder.name} lacks cash ${trade.cash_asking}")
+            logger.error("Trade failed: Responder %s lacks cash $%s", responder.name, trade.cash_asking)
             return
         if responder.jail_free_cards < trade.get_out_of_jail_cards_asking:
-             logger.error(f"Trade failed: Responder {responder.name} lacks jail cards ({trade.get_out_of_jail_cards_asking})")
+             logger.error("Trade failed: Responder %s lacks jail cards (%s)", responder.name, trade.get_out_of_jail_cards_asking)
              return
+        responder_owned = set(responder.properties)
         for prop in trade.properties_asking:
-             if prop not in responder.properties:
-                 logger.error(f"Trade failed: Responder {responder.name} does not own {prop.name}")
+             if prop not in responder_owned:
+                 logger.error("Trade failed: Responder %s does not own %s", responder.name, prop.name)
                  return
 
-        logger.debug(f"Executing trade: {trade.to_dict()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing trade: %s", trade.to_dict())
 
         proposer.balance -= trade.cash_offered
         responder.balance += trade.cash_offered
@@ -1464,69 +1749,59 @@ class AcceptTradeAction(Action):
         responder.jail_free_cards -= trade.get_out_of_jail_cards_asking
         proposer.jail_free_cards += trade.get_out_of_jail_cards_asking
 
-        for prop in list(trade.properties_offered):
-            if prop in proposer.properties:
-                proposer.properties.remove(prop)
-                responder.properties.append(prop)
+        # Move ownership through the sets, then rebuild each list once instead of
+        # calling list.remove per property.
+        received_by_responder = []
+        for prop in trade.properties_offered:
+            if prop in proposer_owned:
+                proposer_owned.discard(prop)
+                received_by_responder.append(prop)
                 prop.owner = responder
             else:
-                 logger.warning(f"Property {prop.name} already removed from {proposer.name} during trade?")
+                 logger.warning("Property %s already removed from %s during trade?", prop.name, proposer.name)
 
-        for prop in list(trade.properties_asking):
-            if prop in responder.properties:
-                responder.properties.remove(prop)
-                proposer.properties.append(prop)
+        received_by_proposer = []
+        for prop in trade.properties_asking:
+            if prop in responder_owned:
+                responder_owned.discard(prop)
+                received_by_proposer.append(prop)
                 prop.owner = proposer
             else:
-                 logger.warning(f"Property {prop.name} already removed from {responder.name} during trade?")
+                 logger.warning("Property %s already removed from %s during trade?", prop.name, responder.name)
 
-        logger.info(f"Trade completed successfully between {proposer.name} and {responder.name}.")
+        proposer.properties[:] = [prop for prop in proposer.properties if prop in proposer_owned] + received_by_proposer
+        responder.properties[:] = [prop for prop in responder.properties if prop in responder_owned] + received_by_responder
 
-    @classmethod
-    def to_action_mask_flat(cls, state: State) -> List[bool]:
-        if not state.pending_trade:
-            return [False]
-        current_player = state.current_player()
-        valid = (current_player == state.pending_trade.responder)
+        logger.info("Trade completed successfully between %s and %s.", proposer.name, responder.name)
 
+    @classmethod
+    def _can_accept(cls, state: State) -> bool:
+        if not _player_action_bits(state) & _CAN_ANSWER_TRADE:
+            return False
         trade = state.pending_trade
-        
+        current_player = state.current_player()
         if current_player.balance < trade.cash_asking:
-            valid = False
+            return False
         if current_player.jail_free_cards < trade.get_out_of_jail_cards_asking:
-            valid = False
-        for prop_asked in trade.properties_asking:
-            if prop_asked not in current_player.properties:
-                valid = False
-                break
+            return False
+        return set(current_player.properties).issuperset(trade.properties_asking)
 
-        return [valid]
+    @classmethod
+    @_version_cached("flat")
+    def to_action_mask_flat(cls, state: State) -> List[bool]:
+        return _bit(cls._can_accept(state))
 
     @classmethod
     def flat_parameter_size(cls) -> int:
         return 1
 
     @classmethod
+    @_version_cached("hierarchical")
     def to_action_mask_hierarchical(cls, state: State) -> Dict[str, List[bool]]:
-        if not state.pending_trade:
-            return {"accept": [False]}
-        current_player = state.current_player()
-        valid = (current_player == state.pending_trade.responder)
-
-        trade = state.pending_trade
-        
-        if current_player.balance < trade.cash_asking:
-            valid = False
-        if current_player.jail_free_cards < trade.get_out_of_jail_cards_asking:
-            valid = False
-        for prop_asked in trade.properties_asking:
-            if prop_asked not in current_player.properties: # Check ownership
-                valid = False
-                break
-
-        return {"accept": [valid]}
+        return {"accept": _bit(cls._can_accept(state))}
 
     @classmethod
+    @_class_cached
     def hierarchical_parameters(cls) -> Dict[str, Space]:
         return {"accept": Discrete(1)}
 
@@ -1538,12 +1813,15 @@ class AcceptTradeAction(Action):
 
     @classmethod
     def from_dict(cls, data: Dict, state: State) -> AcceptTradeAction:
-        player = next(p for p in state.players if p.mgn_code == data["mgn_code"])
+        player = state.players_by_mgn[data["mgn_code"]]
         return AcceptTradeAction(player)
 
 
 
 class RejectTradeAction(Action):
+    __slots__ = ()
+    IDLE_HIERARCHICAL_MASK = {"reject": _FALSE_BIT}
+
     def __init__(self, player: Player):
         super().__init__("RejectTrade", player)
 
@@ -1551,23 +1829,22 @@ class RejectTradeAction(Action):
         return f"{self.player.mgn_code} REJECT"
 
     def process(self, state: State) -> None:
+        state.bump_version()
         if not state.pending_trade:
             logger.warning("No pending trade to reject.")
             return
 
         trade = state.pending_trade
-        if trade.responder != self.player:
-            logger.warning(f"{self.player.name} is not the responder for this pending trade.")
+        if trade.responder is not self.player:
+            logger.warning("%s is not the responder for this pending trade.", self.player.name)
             return
 
-        logger.info(f"{self.player.name} rejects trade from {trade.proposer.name}")
-        state.pending_trade = None
+        logger.info("%s rejects trade from %s", self.player.name, trade.proposer.name)
+        state.resolve_trade()
 
     @classmethod
     def to_action_mask_flat(cls, state: State) -> List[bool]:
-        if not state.pending_trade:
-            return [False]
-        return [state.current_player() == state.pending_trade.responder]
+        return _bit(_player_action_bits(state) & _CAN_ANSWER_TRADE)
 
     @classmethod
     def flat_parameter_size(cls) -> int:
@@ -1575,12 +1852,10 @@ class RejectTradeAction(Action):
 
     @classmethod
     def to_action_mask_hierarchical(cls, state: State) -> Dict[str, List[bool]]:
-        if not state.pending_trade:
-            return {"reject": [False]}
-        valid = (state.current_player() == state.pending_trade.responder)
-        return {"reject": [valid]}
+        return {"reject": _bit(_player_action_bits(state) & _CAN_ANSWER_TRADE)}
 
     @classmethod
+    @_class_cached
     def hierarchical_parameters(cls) -> Dict[str, Space]:
         return {"reject": Discrete(1)}
 
@@ -1592,11 +1867,13 @@ class RejectTradeAction(Action):
 
     @classmethod
     def from_dict(cls, data: Dict, state: State) -> RejectTradeAction:
-        player = next(p for p in state.players if p.mgn_code == data["mgn_code"])
+        player = state.players_by_mgn[data["mgn_code"]]
         return RejectTradeAction(player)
 
 
 class SendMessageAction(Action):
+    __slots__ = ("message", "recipient")
+
     def __init__(self, sender: Player, message: str, recipient: Optional[Player] = None):
         super().__init__("SendMessage", sender)
         self.message = message
@@ -1609,30 +1886,28 @@ class SendMessageAction(Action):
             return f"{self.player.mgn_code} MSG->ALL: {self.message}"
 
     def process(self, state: State) -> None:
-        # Store message in chat log
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        state.bump_version()
+        # Store message in chat log. Names are recoverable from the MGN codes and
+        # the timestamp is raw nanoseconds, formatted only if someone reads it.
         log_entry = {
             "from_mgn_code": self.player.mgn_code,
-            "from_name": self.player.name,
             "message": self.message,
-            "timestamp": ts
+            "timestamp": time.time_ns()
         }
         if self.recipient:
             log_entry["to_mgn_code"] = self.recipient.mgn_code
-            log_entry["to_name"] = self.recipient.name
             log_entry["private"] = True
-            logger.info(f"[MSG PRIVATE] {self.player.name} to {self.recipient.name}: {self.message}")
+            logger.info("[MSG PRIVATE] %s to %s: %s", self.player.name, self.recipient.name, self.message)
         else:
             log_entry["to_mgn_code"] = "ALL"
-            log_entry["to_name"] = "ALL"
             log_entry["private"] = False
-            logger.info(f"[MSG PUBLIC] {self.player.name}: {self.message}")
+            logger.info("[MSG PUBLIC] %s: %s", self.player.name, self.message)
         
         state.chat_log.append(log_entry)
 
     @classmethod
     def to_action_mask_flat(cls, state: State) -> List[bool]:
-        return [True]
+        return _TRUE_BIT
 
     @classmethod
     def flat_parameter_size(cls) -> int:
@@ -1640,24 +1915,12 @@ class SendMessageAction(Action):
 
     @classmethod
     def to_action_mask_hierarchical(cls, state: State) -> Dict[str,List[bool]]:
-        if state.auction_state or state.pending_trade:
-            return {
-                "recipient": [False] * (MAX_PLAYERS + 1),
-                "message": [False]
-            }
-        
-        recipient_mask = [False] * (MAX_PLAYERS + 1)
-        recipient_mask[0] = True
-        for i in range(len(state.players)):
-            if i < MAX_PLAYERS :
-                 recipient_mask[i+1] = True 
-        
-        return {
-            "recipient": recipient_mask,
-            "message": [True]
-        }
+        if state.actions_blocked:
+            return _DISABLED_MESSAGE_MASK
+        return _MESSAGE_MASKS[min(len(state.players), MAX_PLAYERS)]
 
     @classmethod
+    @_class_cached
     def hierarchical_parameters(cls) -> Dict[str, Space]:
         return {
         "recipient": Discrete(MAX_PLAYERS+1),
@@ -1674,16 +1937,16 @@ class SendMessageAction(Action):
 
     @classmethod
     def from_dict(cls, data: Dict, state: State) -> SendMessageAction:
-        sender = next(p for p in state.players if p.mgn_code == data["sender_mgn_code"])
+        sender = state.players_by_mgn[data["sender_mgn_code"]]
         recipient = None
         if data["recipient_mgn_code"] != "ALL":
-            recipient = next((p for p in state.players if p.mgn_code == data["recipient_mgn_code"]), None)
+            recipient = state.players_by_mgn.get(data["recipient_mgn_code"])
             if recipient is None:
                 logger.warning(f"SendMessage from_dict: recipient {data['recipient_mgn_code']} not found. Message will be public.")
         
         return SendMessageAction(sender=sender, message=data["message"], recipient=recipient)
 
-HIERARCHICAL_ACTION_CLASSES = [
+HIERARCHICAL_ACTION_CLASSES: Tuple[Type[Action], ...] = (
     RollDiceAction,
     EndTurnAction,
     BuyAction,
@@ -1701,10 +1964,10 @@ HIERARCHICAL_ACTION_CLASSES = [
     ProposeTradeAction,
     AcceptTradeAction,
     RejectTradeAction,
-    SendMessageAction
-]
+    SendMessageAction,
+)
 
-HIERARCHICAL_ACTION_CLASSES_WO_SEND_MESSAGE_ACTION = [
+HIERARCHICAL_ACTION_CLASSES_WO_SEND_MESSAGE_ACTION: Tuple[Type[Action], ...] = (
     RollDiceAction,
     EndTurnAction,
     BuyAction,
@@ -1722,7 +1985,148 @@ HIERARCHICAL_ACTION_CLASSES_WO_SEND_MESSAGE_ACTION = [
     ProposeTradeAction,
     AcceptTradeAction,
     RejectTradeAction,
-]
+)
+
+ACTION_CLASSES: Dict[str, Type[Action]] = {
+    "ProposeTrade": ProposeTradeAction,
+    "RollDice": RollDiceAction,
+    "EndTurn": EndTurnAction,
+    "Buy": BuyAction,
+    "Auction": AuctionAction,
+    "AuctionBid": AuctionBidAction,
+    "Mortgage": MortgageAction,
+    "Unmortgage": UnmortgageAction,
+    "Build": BuildAction,
+    "SellBuilding": SellBuildingAction,
+    "UseJailCard": UseJailCardAction,
+    "PayJailFine": PayJailFineAction,
+    "RollJail": RollJailAction,
+    "Bankruptcy": BankruptcyAction,
+    "AuctionFold": AuctionFoldAction,
+    "AcceptTrade": AcceptTradeAction,
+    "RejectTrade": RejectTradeAction,
+    "SendMessage": SendMessageAction,
+}
+
+def action_from_dict(data: Dict, state: State) -> Action:
+    """Rebuild an action from its to_dict() form, dispatching on data["type"]."""
+    return ACTION_CLASSES[data["type"]].from_dict(data, state)
+
+def _decode_street_action(cls: Type[Action], current_player: Player, street_idx: int, quantity: int, state: State) -> Action:
+    if 0 <= street_idx < len(state.board.streets):
+        return cls(current_player, state.board.streets[street_idx], quantity)
+    raise ValueError(f"Invalid street_idx: {street_idx}")
+
+def _selected_properties(owned: List[Property], selection: Union[int, np.ndarray, List[int]]) -> List[Property]:
+    """
+    The owned properties picked by a trade selection, given either as the
+    MultiBinary 0/1 vector indexed by property_idx or packed into an int
+    (bit property_idx set). Unowned selections are ignored.
+    """
+    if isinstance(selection, (int, np.integer)):
+        bits = int(selection)
+        return [prop for prop in owned if bits >> prop.property_idx & 1]
+    return [prop for prop in owned if selection[prop.property_idx] == 1]
+
+def _decode_trade_offer(current_player: Player, params: Dict, state: State) -> ProposeTradeAction:
+    responder_idx = params["trade_partner"]
+    # Partners are the other players in seat order; skip over the proposer's
+    # own seat rather than building the filtered list.
+    proposer_idx = state.player_idx_by_mgn.get(current_player.mgn_code)
+    partner_count = len(state.players) - (proposer_idx is not None)
+    if responder_idx < 0 or responder_idx >= partner_count:
+        raise ValueError(f"Invalid trade_partner index: {responder_idx} for {partner_count} possible partners")
+
+    if proposer_idx is not None and responder_idx >= proposer_idx:
+        responder_idx += 1
+    partner_player = state.players[responder_idx]
+
+    properties_offered = _selected_properties(current_player.properties, params["properties_offered"])
+    properties_asking = _selected_properties(partner_player.properties, params["properties_asking"])
+
+    return ProposeTradeAction(
+        trade_offer=TradeOffer(
+            proposer=current_player,
+            responder=partner_player,
+            cash_offered=params["cash_offered"],
+            properties_offered=properties_offered,
+            get_out_of_jail_cards_offered=params["get_out_of_jail_cards_offered"],
+            cash_asking=params["cash_asking"],
+            properties_asking=properties_asking,
+            get_out_of_jail_cards_asking=params["get_out_of_jail_cards_asking"]
+        )
+    )
+
+def _decode_message(sender: Player, params: Dict, state: State) -> SendMessageAction:
+    recipient_param_val = params["recipient"]
+    message_bytes = np.asarray(params["message"]).astype(np.uint8)
+
+    # The message is zero-terminated; everything from the first 0 on is padding.
+    terminators = np.flatnonzero(message_bytes == 0)
+    message_length = terminators[0] if terminators.size else message_bytes.size
+    actual_bytes = message_bytes[:message_length].tobytes()
+    try:
+        decoded_message_str = actual_bytes.decode('utf-8')
+    except UnicodeDecodeError:
+        decoded_message_str = actual_bytes.decode('latin-1', errors='replace')
+        logger.warning(f"Message from {sender.name} had encoding issues. Used fallback.")
+
+    recipient_player_obj: Optional[Player] = None
+    if recipient_param_val == 0:
+        recipient_player_obj = None
+    elif 1 <= recipient_param_val <= len(state.players):
+        recipient_player_obj = state.players[recipient_param_val - 1]
+        if recipient_player_obj == sender:
+             logger.debug(f"{sender.name} is sending a message to themselves.")
+    else:
+        logger.error(f"Invalid recipient index {recipient_param_val} for SendMessageAction. Defaulting to public.")
+        recipient_player_obj = None
+
+    return SendMessageAction(sender=sender, message=decoded_message_str, recipient=recipient_player_obj)
+
+# Decoders from (current player, action parameter(s), state) to an action, looked
+# up by class so decoding is one dict lookup instead of an if/elif chain.
+_FLAT_DECODERS: Dict[Type[Action], Callable[[Player, int, State], Action]] = {
+    EndTurnAction: lambda player, param, state: EndTurnAction(player),
+    BuyAction: lambda player, param, state: BuyAction(player, state.board.board[player.position]),
+    AuctionAction: lambda player, param, state: AuctionAction(player, state.board.board[player.position]),
+    AuctionBidAction: lambda player, param, state: AuctionBidAction(player, param),
+    MortgageAction: lambda player, param, state: MortgageAction(player, state.board.properties[param]),
+    UnmortgageAction: lambda player, param, state: UnmortgageAction(player, state.board.properties[param]),
+    BuildAction: lambda player, param, state: _decode_street_action(
+        BuildAction, player, param // MAX_BUILD_COUNT, param % MAX_BUILD_COUNT + 1, state),
+    SellBuildingAction: lambda player, param, state: _decode_street_action(
+        SellBuildingAction, player, param // MAX_BUILD_COUNT, param % MAX_BUILD_COUNT + 1, state),
+    UseJailCardAction: lambda player, param, state: UseJailCardAction(player),
+    PayJailFineAction: lambda player, param, state: PayJailFineAction(player),
+    RollJailAction: lambda player, param, state: RollJailAction(player),
+    BankruptcyAction: lambda player, param, state: BankruptcyAction(player),
+    RollDiceAction: lambda player, param, state: RollDiceAction(player),
+    AuctionFoldAction: lambda player, param, state: AuctionFoldAction(player),
+}
+
+_HIERARCHICAL_DECODERS: Dict[Type[Action], Callable[[Player, Dict, State], Action]] = {
+    EndTurnAction: lambda player, params, state: EndTurnAction(player),
+    BuyAction: lambda player, params, state: BuyAction(player, state.board.board[player.position]),
+    AuctionAction: lambda player, params, state: AuctionAction(player, state.board.board[player.position]),
+    AuctionBidAction: lambda player, params, state: AuctionBidAction(player, params["bid_amount"]),
+    MortgageAction: lambda player, params, state: MortgageAction(player, state.board.properties[params["property"]]),
+    UnmortgageAction: lambda player, params, state: UnmortgageAction(player, state.board.properties[params["property"]]),
+    BuildAction: lambda player, params, state: _decode_street_action(
+        BuildAction, player, params["street"], params["quantity"] + 1, state),
+    SellBuildingAction: lambda player, params, state: _decode_street_action(
+        SellBuildingAction, player, params["street"], params["quantity"] + 1, state),
+    UseJailCardAction: lambda player, params, state: UseJailCardAction(player),
+    PayJailFineAction: lambda player, params, state: PayJailFineAction(player),
+    RollJailAction: lambda player, params, state: RollJailAction(player),
+    BankruptcyAction: lambda player, params, state: BankruptcyAction(player),
+    AuctionFoldAction: lambda player, params, state: AuctionFoldAction(player),
+    RollDiceAction: lambda player, params, state: RollDiceAction(player),
+    ProposeTradeAction: _decode_trade_offer,
+    AcceptTradeAction: lambda player, params, state: AcceptTradeAction(player),
+    RejectTradeAction: lambda player, params, state: RejectTradeAction(player),
+    SendMessageAction: _decode_message,
+}
 
 class ActionManager:
     def __init__(
@@ -1731,18 +2135,24 @@ class ActionManager:
         include_send_message_action: bool = True
     ):
         self.action_space_type = action_space_type
-        if action_space_type == ActionSpaceType.FLAT:
-            if include_send_message_action:
-                self.action_classes = [c for c in HIERARCHICAL_ACTION_CLASSES]
-            else:
-                self.action_classes = [c for c in HIERARCHICAL_ACTION_CLASSES_WO_SEND_MESSAGE_ACTION]
+        # Both space types share the same (immutable) class tuples.
+        if include_send_message_action:
+            self.action_classes = HIERARCHICAL_ACTION_CLASSES
         else:
-            if include_send_message_action:
-                self.action_classes = HIERARCHICAL_ACTION_CLASSES
-            else:
-                self.action_classes = HIERARCHICAL_ACTION_CLASSES_WO_SEND_MESSAGE_ACTION
-            
+            self.action_classes = HIERARCHICAL_ACTION_CLASSES_WO_SEND_MESSAGE_ACTION
+
         self.flat_offsets = self._calculate_flat_offsets()
+        self.flat_size = sum(cls.flat_parameter_size() for cls in self.action_classes)
+        self._flat_fill_order = [(cls, self.flat_offsets[cls]) for cls in self.action_classes]
+        # Start offset of each class's flat block, for locating an index's class by bisection.
+        self._flat_starts = [offset for _, offset in self._flat_fill_order]
+        self._named_classes = [(cls.__name__, cls, cls.IDLE_HIERARCHICAL_MASK) for cls in self.action_classes]
+        self.action_name_to_idx = {cls.__name__: i for i, cls in enumerate(self.action_classes)}
+        # Bit of each action class in the hierarchical mask's action_type_bits.
+        self.action_name_to_bit = {name: 1 << i for name, i in self.action_name_to_idx.items()}
+        # Key for this manager's combined mask in state.mask_cache; built from
+        # plain values so managers with the same layout share the entry.
+        self._mask_cache_key = (action_space_type, self.action_classes)
         self.parameter_spaces = {
             cls.__name__: GymDict(cls.hierarchical_parameters())
             for cls in self.action_classes
@@ -1758,7 +2168,7 @@ class ActionManager:
 
     def to_action_space(self) -> Space:
         if self.action_space_type == ActionSpaceType.FLAT:
-            return Discrete(sum(cls.flat_parameter_size() for cls in self.action_classes))
+            return Discrete(self.flat_size)
         else:
             return GymDict({
                 "action_type": Discrete(len(self.action_classes)),
@@ -1769,29 +2179,53 @@ class ActionManager:
             })
 
     def to_action_mask(self, state: State) -> Union[np.ndarray, Dict]:
+        """
+        The mask for the current state version. It is shared by every caller
+        until the version moves, so the flat array and the hierarchical
+        parameter arrays are read-only, and the hierarchical action_type entry
+        is a tuple. ProposeTradeAction's parameters are read-only views into a
+        buffer the state refills on the next version, so copy them to keep
+        them. The hierarchical mask also carries action_type_bits, with bit
+        action_name_to_bit[name] set for each valid class.
+        """
+        cached = state.mask_cache.get(self._mask_cache_key)
+        if cached is not None and cached[0] == state.version:
+            return cached[1]
         if self.action_space_type == ActionSpaceType.FLAT:
-            return self._to_action_mask_flat(state)
+            mask = self._to_action_mask_flat(state)
         else:
-            return self._to_action_mask_hierarchical(state)
+            mask = self._to_action_mask_hierarchical(state)
+        state.mask_cache[self._mask_cache_key] = (state.version, mask)
+        return mask
 
     def _to_action_mask_flat(self, state: State) -> np.ndarray:
-        mask = []
-        for cls in self.action_classes:
-            mask.extend(cls.to_action_mask_flat(state))
-        return np.array(mask, dtype=np.bool_)
+        # Each class overwrites its whole slice, so the buffer needs no zeroing.
+        mask = np.empty(self.flat_size, dtype=np.bool_)
+        for cls, offset in self._flat_fill_order:
+            cls.fill_flat(state, mask, offset)
+        mask.setflags(write=False)
+        return mask
 
     def _to_action_mask_hierarchical(self, state: State) -> Dict:
-        action_type_mask = []
-        parameters_mask = {cls.__name__: {} for cls in self.action_classes}
-
-        for i, cls in enumerate(self.action_classes):
-            cls_mask = cls.to_action_mask_hierarchical(state)
-            action_valid = any(any(v) if isinstance(v, list) else v for v in cls_mask.values()) if cls_mask else False
-            action_type_mask.append(action_valid)
-            parameters_mask[cls.__name__] = cls_mask
+        if state.actions_blocked:
+            parameters_mask = {name: cls.to_action_mask_hierarchical(state) for name, cls, _ in self._named_classes}
+        else:
+            # With no auction or trade pending, the auction and trade-answer
+            # masks are known to be all-False; skip asking those classes.
+            parameters_mask = {
+                name: idle_mask if idle_mask is not None else cls.to_action_mask_hierarchical(state)
+                for name, cls, idle_mask in self._named_classes
+            }
+        # Every parameter mask is a bool ndarray, so a class is valid when any
+        # of its arrays has a set entry.
+        action_type_mask = tuple(
+            any(v.any() for v in cls_mask.values())
+            for cls_mask in parameters_mask.values()
+        )
 
         return {
             "action_type": action_type_mask,
+            "action_type_bits": sum(1 << i for i, valid in enumerate(action_type_mask) if valid),
             "parameters": parameters_mask
         }
 
@@ -1802,12 +2236,25 @@ class ActionManager:
             return self._decode_hierarchical_action(action, state)
 
     def _decode_flat_action(self, action_idx: int, state: State) -> Action:
-        for cls in self.action_classes:
-            offset = self.flat_offsets[cls]
-            size = cls.flat_parameter_size()
-            if offset <= action_idx < offset + size:
-                return self._instantiate_flat_action(cls, action_idx - offset, state)
-        raise ValueError(f"Invalid action index: {action_idx}")
+        if not 0 <= action_idx < self.flat_size:
+            raise ValueError(f"Invalid action index: {action_idx}")
+        class_idx = bisect.bisect_right(self._flat_starts, action_idx) - 1
+        return self._instantiate_flat_action(
+            self.action_classes[class_idx], action_idx - self._flat_starts[class_idx], state)
+
+    def decode_flat_batch(self, action_idxs: np.ndarray, state: State) -> List[Action]:
+        """Decode many flat action indices against one state, e.g. when replaying a trajectory."""
+        action_idxs = np.asarray(action_idxs, dtype=np.int64)
+        if action_idxs.size and (action_idxs.min() < 0 or action_idxs.max() >= self.flat_size):
+            bad = action_idxs[(action_idxs < 0) | (action_idxs >= self.flat_size)][0]
+            raise ValueError(f"Invalid action index: {bad}")
+        starts = np.asarray(self._flat_starts)
+        class_idxs = np.searchsorted(starts, action_idxs, side="right") - 1
+        params = action_idxs - starts[class_idxs]
+        return [
+            self._instantiate_flat_action(self.action_classes[class_idx], param, state)
+            for class_idx, param in zip(class_idxs.tolist(), params.tolist())
+        ]
 
     def _decode_hierarchical_action(self, action_dict: Dict, state: State) -> Action:
         action_type_idx = action_dict["action_type"]
@@ -1825,153 +2272,13 @@ class ActionManager:
             return state.current_player()
 
     def _instantiate_flat_action(self, cls: Type[Action], param: int, state: State) -> Action:
-        current_player = self._get_current_player(state)
-
-        if cls == EndTurnAction:
-            return EndTurnAction(current_player)
-        elif cls == BuyAction:
-            return BuyAction(current_player, state.board.board[current_player.position])
-        elif cls == AuctionAction:
-            return AuctionAction(current_player, state.board.board[current_player.position])
-        elif cls == AuctionBidAction:
-            return AuctionBidAction(current_player, param)
-        elif cls == MortgageAction:
-            return MortgageAction(current_player, state.board.board[param])
-        elif cls == UnmortgageAction:
-            return UnmortgageAction(current_player, state.board.board[param])
-        elif cls == BuildAction:
-            street_idx = param // MAX_BUILD_COUNT
-            quantity = (param % MAX_BUILD_COUNT) + 1
-            if 0 <= street_idx < len(state.board.streets):
-                street = state.board.streets[street_idx] 
-                return BuildAction(current_player, street, quantity)
-            else:
-                raise ValueError(f"Invalid street_idx: {street_idx}")
-        elif cls == SellBuildingAction:
-            street_idx = param // MAX_BUILD_COUNT
-            quantity = (param % MAX_BUILD_COUNT) + 1
-            if 0 <= street_idx < len(state.board.streets):
-                street = state.board.streets[street_idx]
-                return SellBuildingAction(current_player, street, quantity)
-            else:
-                raise ValueError(f"Invalid street_idx: {street_idx}")
-        elif cls == UseJailCardAction:
-            return UseJailCardAction(current_player)
-        elif cls == PayJailFineAction:
-            return PayJailFineAction(current_player)
-        elif cls == RollJailAction:
-            return RollJailAction(current_player)
-        elif cls == BankruptcyAction:
-            return BankruptcyAction(current_player)
-        elif cls == RollDiceAction:
-            return RollDiceAction(current_player)
-        elif cls == AuctionFoldAction:
-            return AuctionFoldAction(current_player)
-        else:
+        decoder = _FLAT_DECODERS.get(cls)
+        if decoder is None:
             raise NotImplementedError(f"Flat decoding not implemented for {cls.__name__}")
+        return decoder(self._get_current_player(state), param, state)
 
     def _instantiate_hierarchical_action(self, cls: Type[Action], params: Dict, state: State) -> Action:
-        current_player = self._get_current_player(state)
-
-        if cls == EndTurnAction:
-            return EndTurnAction(current_player)
-        elif cls == BuyAction:
-            return BuyAction(current_player, state.board.board[current_player.position])
-        elif cls == AuctionAction:
-            return AuctionAction(current_player, state.board.board[current_player.position])
-        elif cls == AuctionBidAction:
-            return AuctionBidAction(current_player, params["bid_amount"])
-        elif cls == MortgageAction:
-            return MortgageAction(current_player, state.board.properties[params["property"]])
-        elif cls == UnmortgageAction:
-            return UnmortgageAction(current_player, state.board.properties[params["property"]])
-        elif cls == BuildAction:
-            street_idx = params["street"]
-            quantity = params["quantity"] + 1 
-            if 0 <= street_idx < len(state.board.streets):
-                street = state.board.streets[street_idx]
-                return BuildAction(current_player, street, quantity)
-            else:
-                raise ValueError(f"Invalid street_idx: {street_idx}")
-        elif cls == SellBuildingAction:
-            street_idx = params["street"]
-            quantity = params["quantity"] + 1 
-            if 0 <= street_idx < len(state.board.streets):
-                street = state.board.streets[street_idx]
-                return SellBuildingAction(current_player, street, quantity)
-            else:
-                raise ValueError(f"Invalid street_idx: {street_idx}")
-        elif cls == UseJailCardAction:
-            return UseJailCardAction(current_player)
-        elif cls == PayJailFineAction:
-            return PayJailFineAction(current_player)
-        elif cls == RollJailAction:
-            return RollJailAction(current_player)
-        elif cls == BankruptcyAction:
-            return cls(current_player)
-        elif cls == AuctionFoldAction:
-            return AuctionFoldAction(current_player)
-        elif cls == RollDiceAction:
-            return RollDiceAction(current_player)
-        elif cls == ProposeTradeAction:
-            responder_idx = params["trade_partner"]
-            possible_responders = [p for p in state.players if p != current_player]
-            if responder_idx < 0 or responder_idx >= len(possible_responders):
-                raise ValueError(f"Invalid trade_partner index: {responder_idx} for {len(possible_responders)} possible partners")
-
-            partner_player = possible_responders[responder_idx]
-
-            cash_offered = params["cash_offered"]
-            properties_offered_indices = [i for i, owned in enumerate(params["properties_offered"]) if owned == 1]
-            properties_offered = [prop for prop in current_player.properties if prop.property_idx in properties_offered_indices]
-
-            get_out_of_jail_cards_offered = params["get_out_of_jail_cards_offered"]
-
-            cash_asking = params["cash_asking"]
-            properties_asking_indices = [i for i, owned in enumerate(params["properties_asking"]) if owned == 1]
-            properties_asking = [prop for prop in partner_player.properties if prop.property_idx in properties_asking_indices]
-
-            get_out_of_jail_cards_asking = params["get_out_of_jail_cards_asking"]
-
-            return ProposeTradeAction(
-                trade_offer=TradeOffer(
-                    proposer=current_player,
-                    responder=partner_player,
-                    cash_offered=cash_offered,
-                    properties_offered=properties_offered,
-                    get_out_of_jail_cards_offered=get_out_of_jail_cards_offered,
-                    cash_asking=cash_asking,
-                    properties_asking=properties_asking, 
-                    get_out_of_jail_cards_asking=get_out_of_jail_cards_asking
-                )
-            )
-        elif cls == AcceptTradeAction:
-            return AcceptTradeAction(current_player)
-        elif cls == RejectTradeAction:
-            return RejectTradeAction(current_player)
-        elif cls == SendMessageAction:
-            sender = current_player
-            recipient_param_val = params["recipient"]
-            message_int_array = params["message"]    
-
-            actual_bytes = message_int_array[message_int_array != 0].astype(np.uint8)
-            try:
-                decoded_message_str = actual_bytes.tobytes().decode('utf-8')
-            except UnicodeDecodeError:
-                decoded_message_str = actual_bytes.tobytes().decode('latin-1', errors='replace')
-                logger.warning(f"Message from {sender.name} had encoding issues. Used fallback.")
-            
-            recipient_player_obj: Optional[Player] = None
-            if recipient_param_val == 0:
-                recipient_player_obj = None
-            elif 1 <= recipient_param_val <= len(state.players):
-                recipient_player_obj = state.players[recipient_param_val - 1]
-                if recipient_player_obj == sender:
-                     logger.debug(f"{sender.name} is sending a message to themselves.")
-            else:
-                logger.error(f"Invalid recipient index {recipient_param_val} for SendMessageAction. Defaulting to public.")
-                recipient_player_obj = None 
-            
-            return SendMessageAction(sender=sender, message=decoded_message_str, recipient=recipient_player_obj)
-        else:
-            raise NotImplementedError(f"Hierarchical decoding not implemented for {cls.__name__}")
\ No newline at end of file
+        decoder = _HIERARCHICAL_DECODERS.get(cls)
+        if decoder is None:
+            raise NotImplementedError(f"Hierarchical decoding not implemented for {cls.__name__}")
+        return decoder(self._get_current_player(state), params, state)
@@ -1,420 +1,307 @@
 # monopoly_gym/gym/board.py
 from __future__ import annotations
-from typing import Callable, List, Optional, Tuple, TYPE_CHECKING, Type
-from monopoly_gym.tile import Chance, ColorSet, CommunityChest, Property, Railroad, SpecialTile, SpecialTileType, Street, Tax, Tile, Utility
+import functools
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING, Type
+import numpy as np
+from monopoly_gym.tile import Chance, ColorSet, CommunityChest, Property, Railroad, SpecialTile, SpecialTileType, Street, Tax, Tile, TileKind, Utility
 
 if TYPE_CHECKING:
     from monopoly_gym.player import Player
     from monopoly_gym.state import State
 
+
+@functools.lru_cache(maxsize=None)
+def _nearest_tables(kinds: Tuple[TileKind, ...]) -> Dict[Type[Tile], Tuple[int, ...]]:
+    """Nearest utility and railroad tables for a board, given the kind of each tile.
+
+    They depend only on the kind sequence, so boards sharing one (every default Board) share the tables.
+    """
+    return {
+        Utility: _nearest_table(kinds, TileKind.UTILITY),
+        Railroad: _nearest_table(kinds, TileKind.RAILROAD),
+    }
+
+
+def _nearest_table(kinds: Tuple[TileKind, ...], kind: TileKind) -> Tuple[int, ...]:
+    """Index of the next tile of the given kind strictly after each position, wrapping around the board."""
+    size = len(kinds)
+    table = list(range(size))
+    last_seen = None
+    for i in range(2 * size - 1, -1, -1):
+        pos = i % size
+        if last_seen is not None:
+            table[pos] = last_seen
+        if kinds[pos] == kind:
+            last_seen = pos
+    return tuple(table)
+
+
+_PROPERTY_KINDS = frozenset((TileKind.STREET, TileKind.RAILROAD, TileKind.UTILITY))
+
+# Shared result for color-set lookups with no streets.
+_NO_STREETS: Tuple[Street, ...] = ()
+
+# The standard board, one (tile class, positional constructor args) entry per tile in board order.
+_BOARD_LAYOUT: Tuple[Tuple[Type[Tile], tuple], ...] = (
+    (SpecialTile, ("GO", SpecialTileType.GO)),
+    (Street, ("Mediterranean Avenue", ColorSet.BROWN, 60, 30, 33, 2, 4, 10, 30, 90, 160, 250)),
+    (CommunityChest, ("Community Chest",)),
+    (Street, ("Baltic Avenue", ColorSet.BROWN, 60, 30, 33, 4, 8, 20, 60, 180, 320, 450)),
+    (Tax, ("Income Tax", 200)),
+    (Railroad, ("Reading Railroad", 200, 100, 110)),
+    (Street, ("Oriental Avenue", ColorSet.LIGHT_BLUE, 100, 50, 55, 6, 12, 30, 90, 270, 400, 550)),
+    (Chance, ("Chance",)),
+    (Street, ("Vermont Avenue", ColorSet.LIGHT_BLUE, 100, 50, 55, 6, 12, 30, 90, 270, 400, 550)),
+    (Street, ("Connecticut Avenue", ColorSet.LIGHT_BLUE, 120, 60, 66, 8, 16, 40, 100, 300, 450, 600)),
+    (SpecialTile, ("Jail", SpecialTileType.JAIL)),
+    (Street, ("St. Charles Place", ColorSet.PINK, 140, 70, 77, 10, 20, 50, 150, 450, 625, 750)),
+    (Utility, ("Electric Company", 150, 75, 83)),
+    (Street, ("States Avenue", ColorSet.PINK, 140, 70, 77, 10, 20, 50, 150, 450, 625, 750)),
+    (Street, ("Virginia Avenue", ColorSet.PINK, 160, 80, 88, 12, 24, 60, 180, 500, 700, 900)),
+    (Railroad, ("Pennsylvania Railroad", 200, 100, 110)),
+    (Street, ("St. James Place", ColorSet.ORANGE, 180, 90, 99, 14, 28, 70, 200, 550, 750, 950)),
+    (CommunityChest, ("Community Chest",)),
+    (Street, ("Tennessee Avenue", ColorSet.ORANGE, 180, 90, 99, 14, 28, 70, 200, 550, 750, 950)),
+    (Street, ("New York Avenue", ColorSet.ORANGE, 200, 100, 110, 16, 32, 80, 220, 600, 800, 1000)),
+    (SpecialTile, ("Free Parking", SpecialTileType.FREE_PARKING)),
+    (Street, ("Kentucky Avenue", ColorSet.RED, 220, 110, 121, 18, 36, 90, 250, 700, 875, 1050)),
+    (Chance, ("Chance",)),
+    (Street, ("Indiana Avenue", ColorSet.RED, 220, 110, 121, 18, 36, 90, 250, 700, 875, 1050)),
+    (Street, ("Illinois Avenue", ColorSet.RED, 240, 120, 132, 20, 40, 100, 300, 750, 925, 1100)),
+    (Railroad, ("B&O Railroad", 200, 100, 110)),
+    (Street, ("Atlantic Avenue", ColorSet.YELLOW, 260, 130, 143, 22, 44, 110, 330, 800, 975, 1150)),
+    (Street, ("Ventnor Avenue", ColorSet.YELLOW, 260, 130, 143, 22, 44, 110, 330, 800, 975, 1150)),
+    (Utility, ("Water Works", 150, 75, 83)),
+    (Street, ("Marvin Gardens", ColorSet.YELLOW, 280, 140, 154, 24, 48, 120, 360, 850, 1025, 1200)),
+    (SpecialTile, ("Go To Jail", SpecialTileType.GO_TO_JAIL)),
+    (Street, ("Pacific Avenue", ColorSet.GREEN, 300, 150, 165, 26, 52, 130, 390, 900, 1100, 1275)),
+    (Street, ("North Carolina Avenue", ColorSet.GREEN, 300, 150, 165, 26, 52, 130, 390, 900, 1100, 1275)),
+    (CommunityChest, ("Community Chest",)),
+    (Street, ("Pennsylvania Avenue", ColorSet.GREEN, 320, 160, 176, 28, 56, 150, 450, 1000, 1200, 1400)),
+    (Railroad, ("Short Line", 200, 100, 110)),
+    (Chance, ("Chance",)),
+    (Street, ("Park Place", ColorSet.DARK_BLUE, 350, 175, 193, 35, 70, 175, 500, 1100, 1300, 1500)),
+    (Tax, ("Luxury Tax", 100)),
+    (Street, ("Boardwalk", ColorSet.DARK_BLUE, 400, 200, 220, 50, 100, 200, 600, 1400, 1700, 2000)),
+)
+
+
 class Board:
+    __slots__ = (
+        "board", "chance_cards", "community_chest_cards", "size", "property_at", "houses_available", "hotels_available",
+        "properties", "streets", "streets_by_color", "color_set_peers", "tiles_of_kind", "_nearest", "house_costs",
+    )
+
     def __init__(self, houses_available: int, hotels_available: int):
-        self.board : List[Tile] = [
-            SpecialTile(name="GO", special_tile_type=SpecialTileType.GO),
-            Street(name="Mediterranean Avenue", color_set=ColorSet.BROWN, purchase_cost=60, mortgage_price=30, 
-                                unmortgage_price=33, no_color_set_rent=2, color_set_rent=4, one_house_rent=10, 
-                                two_house_rent=30, three_house_rent=90, four_house_rent=160, hotel_rent=250),
-            CommunityChest(name="Community Chest"),
-            Street(name="Baltic Avenue", color_set=ColorSet.BROWN, purchase_cost=60, mortgage_price=30, 
-                                unmortgage_price=33, no_color_set_rent=4, color_set_rent=8, one_house_rent=20, 
-                                two_house_rent=60, three_house_rent=180, four_house_rent=320, hotel_rent=450),
-            Tax(name="Income Tax", tax_amount=200),
-            Railroad(name="Reading Railroad", purchase_cost=200, mortgage_price=100, unmortgage_price=110),
-            Street(name="Oriental Avenue", color_set=ColorSet.LIGHT_BLUE, purchase_cost=100, mortgage_price=50, 
-                                unmortgage_price=55, no_color_set_rent=6, color_set_rent=12, one_house_rent=30, 
-                                two_house_rent=90, three_house_rent=270, four_house_rent=400, hotel_rent=550),
-            Chance(name="Chance"),
-            Street(name="Vermont Avenue", color_set=ColorSet.LIGHT_BLUE, purchase_cost=100, mortgage_price=50, 
-                                unmortgage_price=55, no_color_set_rent=6, color_set_rent=12, one_house_rent=30, 
-                                two_house_rent=90, three_house_rent=270, four_house_rent=400, hotel_rent=550),
-            Street(name="Connecticut Avenue", color_set=ColorSet.LIGHT_BLUE, purchase_cost=120, mortgage_price=60, 
-                                unmortgage_price=66, no_color_set_rent=8, color_set_rent=16, one_house_rent=40, 
-                                two_house_rent=100, three_house_rent=300, four_house_rent=450, hotel_rent=600),
-            SpecialTile(name="Jail", special_tile_type=SpecialTileType.JAIL),
-            Street(name="St. Charles Place", color_set=ColorSet.PINK, purchase_cost=140, mortgage_price=70, 
-                                unmortgage_price=77, no_color_set_rent=10, color_set_rent=20, one_house_rent=50, 
-                                two_house_rent=150, three_house_rent=450, four_house_rent=625, hotel_rent=750),
-            Utility(name="Electric Company", purchase_cost=150, mortgage_price=75, unmortgage_price=83),
-            Street(name="States Avenue", color_set=ColorSet.PINK, purchase_cost=140, mortgage_price=70, 
-                                unmortgage_price=77, no_color_set_rent=10, color_set_rent=20, one_house_rent=50, 
-                                two_house_rent=150, three_house_rent=450, four_house_rent=625, hotel_rent=750),
-            Street(name="Virginia Avenue", color_set=ColorSet.PINK, purchase_cost=160, mortgage_price=80, 
-                                unmortgage_price=88, no_color_set_rent=12, color_set_rent=24, one_house_rent=60, 
-                                two_house_rent=180, three_house_rent=500, four_house_rent=700, hotel_rent=900),
-            Railroad(name="Pennsylvania Railroad", purchase_cost=200, mortgage_price=100, unmortgage_price=110),
-            Street(name="St. James Place", color_set=ColorSet.ORANGE, purchase_cost=180, mortgage_price=90, 
-                                unmortgage_price=99, no_color_set_rent=14, color_set_rent=28, one_house_rent=70, 
-                                two_house_rent=200, three_house_rent=550, four_house_rent=750, hotel_rent=950),
-            CommunityChest(name="Community Chest"),
-            Street(name="Tennessee Avenue", color_set=ColorSet.ORANGE, purchase_cost=180, mortgage_price=90, 
-                                unmortgage_price=99, no_color_set_rent=14, color_set_rent=28, one_house_rent=70, 
-                                two_house_rent=200, three_house_rent=550, four_house_rent=750, hotel_rent=950),
-            Street(name="New York Avenue", color_set=ColorSet.ORANGE, purchase_cost=200, mortgage_price=100, 
-                                unmortgage_price=110, no_color_set_rent=16, color_set_rent=32, one_house_rent=80, 
-                                two_house_rent=220, three_house_rent=600, four_house_rent=800, hotel_rent=1000),
-            SpecialTile(name="Free Parking", special_tile_type=SpecialTileType.FREE_PARKING),
-            Street(name="Kentucky Avenue", color_set=ColorSet.RED, purchase_cost=220, mortgage_price=110, 
-                                unmortgage_price=121, no_color_set_rent=18, color_set_rent=36, one_house_rent=90, 
-                                two_house_rent=250, three_house_rent=700, four_house_rent=875, hotel_rent=1050),
-            Chance(name="Chance"),
-            Street(name="Indiana Avenue", color_set=ColorSet.RED, purchase_cost=220, mortgage_price=110, 
-                                unmortgage_price=121, no_color_set_rent=18, color_set_rent=36, one_house_rent=90, 
-                                two_house_rent=250, three_house_rent=700, four_house_rent=875, hotel_rent=1050),
-            Street(name="Illinois Avenue", color_set=ColorSet.RED, purchase_cost=240, mortgage_price=120, 
-                                unmortgage_price=132, no_color_set_rent=20, color_set_rent=40, one_house_rent=100, 
-                                two_house_rent=300, three_house_rent=750, four_house_rent=925, hotel_rent=1100),
-            Railroad(name="B&O Railroad", purchase_cost=200, mortgage_price=100, unmortgage_price=110),
-            Street(name="Atlantic Avenue", color_set=ColorSet.YELLOW, purchase_cost=260, mortgage_price=130, 
-                                unmortgage_price=143, no_color_set_rent=22, color_set_rent=44, one_house_rent=110, 
-                                two_house_rent=330, three_house_rent=800, four_house_rent=975, hotel_rent=1150),
-            Street(name="Ventnor Avenue", color_set=ColorSet.YELLOW, purchase_cost=260, mortgage_price=130, 
-                                unmortgage_price=143, no_color_set_rent=22, color_set_rent=44, one_house_rent=110, 
-                                two_house_rent=330, three_house_rent=800, four_house_rent=975, hotel_rent=1150),
-            Utility(name="Water Works", purchase_cost=150, mortgage_price=75, unmortgage_price=83),
-            Street(name="Marvin Gardens", color_set=ColorSet.YELLOW, purchase_cost=280, mortgage_price=140, 
-                                unmortgage_price=154, no_color_set_rent=24, color_set_rent=48, one_house_rent=120, 
-                                two_house_rent=360, three_house_rent=850, four_house_rent=1025, hotel_rent=1200),
-            SpecialTile(name="Go To Jail", special_tile_type=SpecialTileType.GO_TO_JAIL),
-            Street(name="Pacific Avenue", color_set=ColorSet.GREEN, purchase_cost=300, mortgage_price=150, 
-                                unmortgage_price=165, no_color_set_rent=26, color_set_rent=52, one_house_rent=130, 
-                                two_house_rent=390, three_house_rent=900, four_house_rent=1100, hotel_rent=1275),
-            Street(name="North Carolina Avenue", color_set=ColorSet.GREEN, purchase_cost=300, mortgage_price=150, 
-                                unmortgage_price=165, no_color_set_rent=26, color_set_rent=52, one_house_rent=130, 
-                                two_house_rent=390, three_house_rent=900, four_house_rent=1100, hotel_rent=1275),
-            CommunityChest(name="Community Chest"),
-            Street(name="Pennsylvania Avenue", color_set=ColorSet.GREEN, purchase_cost=320, mortgage_price=160, 
-                                unmortgage_price=176, no_color_set_rent=28, color_set_rent=56, one_house_rent=150, 
-                                two_house_rent=450, three_house_rent=1000, four_house_rent=1200, hotel_rent=1400),
-            Railroad(name="Short Line", purchase_cost=200, mortgage_price=100, unmortgage_price=110),
-            Chance(name="Chance"),
-            Street(name="Park Place", color_set=ColorSet.DARK_BLUE, purchase_cost=350, mortgage_price=175, 
-                                unmortgage_price=193, no_color_set_rent=35, color_set_rent=70, one_house_rent=175, 
-                                two_house_rent=500, three_house_rent=1100, four_house_rent=1300, hotel_rent=1500),
-            Tax(name="Luxury Tax", tax_amount=100),
-            Street(name="Boardwalk", color_set=ColorSet.DARK_BLUE, purchase_cost=400, mortgage_price=200, 
-                                unmortgage_price=220, no_color_set_rent=50, color_set_rent=100, one_house_rent=200, 
-                                two_house_rent=600, three_house_rent=1400, four_house_rent=1700, hotel_rent=2000),
-        ]
-
-        self.chance_cards: List[Tuple[int, str, Callable[[State], None]]] = [
-            (
-                1,
-                "Advance to Go (Collect $200).",
-                lambda state: (
-                    setattr(state.current_player(), "position", 0),
-                    setattr(state.current_player(), "balance", state.current_player().balance + 200 if state.current_player().balance + 200 >= 0 else 0),
-                ),
-
-            ),
-            (
-                2,
-                "Advance to Illinois Avenue. If you pass Go, collect $200.",
-                lambda state: (
-                    setattr(state.current_player(), "balance", state.current_player().balance + 200 if state.current_player().position > 24 else state.current_player().balance),
-                    setattr(state.current_player(), "position", 24),
-                ),
-            ),
-            (
-                3,
-                "Advance to St. Charles Place. If you pass Go, collect $200.",
-                lambda state: (
-                    setattr(state.current_player(), "position", 11),
-                    setattr(state.current_player(), "balance", state.current_player().balance + 200 if state.current_player().position > 11 else state.current_player().balance),
-                ),
-            ),
-            (
-                4,
-                "Advance token to the nearest Utility. If unowned, you may buy it from the Bank.",
-                lambda state: (
-                    setattr(state.current_player(), "position", self._find_nearest(state, state.current_player(), Utility)),
-                ),
-            ),
-            (
-                5,
-                "Advance token to the nearest Railroad and pay owner twice the rental to which they are otherwise entitled.",
-                lambda state: (
-                    setattr(state.current_player(), "position", self._find_nearest(state, state.current_player(), Railroad)),
-                ),
-            ),
-            (
-                6,
-                "Bank pays you dividend of $50.",
-                lambda state: (
-                    setattr(state.current_player(), "balance", state.current_player().balance + 50),
-                ),
-            ),
-            (
-                7,
-                "Get Out of Jail Free. This card may be kept until needed, or traded/sold.",
-                lambda state: (
-                    setattr(state.current_player(), "jail_free_cards", state.current_player().jail_free_cards + 1),
-                ),
-            ),
-            (
-                8,
-                "Go Back 3 Spaces.",
-                lambda state: (
-                    setattr(state.current_player(), "position", max(state.current_player().position - 3, 0)),
-                ),
-            ),
-            (
-                9,
-                "Go to Jail. Go directly to jail, do not pass Go, do not collect $200.",
-                lambda state: (
-                    setattr(state.current_player(), "position", 10),
-                    setattr(state.current_player(), "in_jail", True),
-                    setattr(state.current_player(), "jail_turns", 0),
-                ),
-            ),
-            (
-                10,
-                "Make general repairs on all your property: For each house pay $25, for each hotel pay $100.",
-                lambda state: (
-                    setattr(
-                        state.current_player(),
-                        "balance",
-                        max(
-                            state.current_player().balance
-                            - sum(0 if not isinstance(prop, Street) else prop.houses for prop in state.current_player().properties) * 25
-                            - sum(0 if not isinstance(prop, Street) else prop.hotels for prop in state.current_player().properties) * 100,
-                            0,
-                        ),
-                    ),
-                ),
-            ),
-            (
-                11,
-                "Pay poor tax of $15.",
-                lambda state: (
-                    setattr(state.current_player(), "balance", state.current_player().balance - 15),
-                ),
-            ),
-            (
-                12,
-                "Take a trip to Reading Railroad. If you pass Go, collect $200.",
-                lambda state: (
-                    setattr(state.current_player(), "balance", state.current_player().balance + 200 if state.current_player().position > 5 else state.current_player().balance),
-                    setattr(state.current_player(), "position", 5),
-                ),
-            ),
-            (
-                13,
-                "Take a walk on the Boardwalk. Advance token to Boardwalk.",
-                lambda state: (
-                    setattr(state.current_player(), "position", 39),
-                ),
-            ),
-            (
-                14,
-                "You have been elected Chairman of the Board. Pay each player $50.",
-                lambda state: (
-                    setattr(state.current_player(), "balance", state.current_player().balance - (50 * (len(state.players) - 1))),
-                    *[
-                        (
-                            setattr(p, "balance", p.balance + 50),
-                        )
-                        for p in state.players
-                        if p != state.current_player()
-                    ],
-                ),
-            ),
-            (
-                15,
-                "Your building loan matures. Collect $150.",
-                lambda state: (
-                    setattr(state.current_player(), "balance", state.current_player().balance + 150),
-                ),
-            ),
-            (
-                16,
-                "Receive for services $25.",
-                lambda state: (
-                    setattr(state.current_player(), "balance", state.current_player().balance + 25),
-                ),
-            ),
-        ]
-
-        self.community_chest_cards: List[Tuple[int, str, Callable[[State], None]]] = [
-            (
-                1,
-                "Advance to Go (Collect $200).",
-                lambda state: (
-                    setattr(state.current_player(), "position", 0),
-                    setattr(state.current_player(), "balance", state.current_player().balance + 200 if state.current_player().balance + 200 >= 0 else 0),
-                ),
-            ),
-            (
-                2,
-                "Bank error in your favor. Collect $200.",
-                lambda state: (
-                    setattr(state.current_player(), "balance", state.current_player().balance + 200 if state.current_player().balance + 200 >= 0 else 0),
-                ),
-            ),
-            (
-                3,
-                "Doctor's fees. Pay $50.",
-                lambda state: (
-                    setattr(state.current_player(), "balance", max(state.current_player().balance - 50, 0)),
-                ),
-            ),
-            (
-                4,
-                "From sale of stock you get $50.",
-                lambda state: (
-                    setattr(state.current_player(), "balance", state.current_player().balance + 50 if state.current_player().balance + 50 >= 0 else 0),
-                ),
-            ),
-            (
-                5,
-                "Get Out of Jail Free. This card may be kept until needed, or traded/sold.",
-                lambda state: (
-                    setattr(state.current_player(), "jail_free_cards", state.current_player().jail_free_cards + 1),
-                ),
-            ),
-            (
-                6,
-                "Go to Jail. Go directly to jail, do not pass Go, do not collect $200.",
-                lambda state: (
-                    setattr(state.current_player(), "position", 10),
-                    setattr(state.current_player(), "in_jail", True),
-                    setattr(state.current_player(), "jail_turns", 0),
-                ),
-            ),
-            (
-                7,
-                "Grand Opera Night. Collect $50 from every player for opening night seats.",
-                lambda state: (
-                    setattr(state.current_player(), "balance", state.current_player().balance + 50 if state.current_player().balance + 50 >= 0 else 0),
-                    *[
-                        (
-                            setattr(p, "balance", max(p.balance - 50, 0)),
-                        )
-                        for p in state.players
-                        if p != state.current_player()
-                    ],
-                ),
-            ),
-            (
-                8,
-                "Holiday Fund matures. Receive $100.",
-                lambda state: (
-                    setattr(state.current_player(), "balance", state.current_player().balance + 100 if state.current_player().balance + 100 >= 0 else 0),
-                ),
-            ),
-            (
-                9,
-                "Income tax refund. Collect $20.",
-                lambda state: (
-                    setattr(state.current_player(), "balance", state.current_player().balance + 20 if state.current_player().balance + 20 >= 0 else 0),
-                ),
-            ),
-            (
-                10,
-                "It is your birthday. Collect $10 from every player.",
-                lambda state: (
-                    setattr(state.current_player(), "balance", state.current_player().balance + 10 if state.current_player().balance + 10 >= 0 else 0),
-                    *[
-                        (
-                            setattr(p, "balance", max(p.balance - 10, 0)),
-                        )
-                        for p in state.players
-                        if p != state.current_player()
-                    ],
-                ),
-            ),
-            (
-                11,
-                "Life insurance matures. Collect $100.",
-                lambda state: (
-                    setattr(state.current_player(), "balance", state.current_player().balance + 100 if state.current_player().balance + 100 >= 0 else 0),
-                ),
-            ),
-            (
-                12,
-                "Pay hospital fees of $100.",
-                lambda state: (
-                    setattr(state.current_player(), "balance", max(state.current_player().balance - 100, 0)),
-                ),
-            ),
-            (
-                13,
-                "Pay school fees of $150.",
-                lambda state: (
-                    setattr(state.current_player(), "balance", max(state.current_player().balance - 150, 0)),
-                ),
-            ),
-            (
-                14,
-                "Receive $25 consultancy fee.",
-                lambda state: (
-                    setattr(state.current_player(), "balance", state.current_player().balance + 25 if state.current_player().balance + 25 >= 0 else 0),
-                ),
-            ),
-            (
-                15,
-                "You inherit $100.",
-                lambda state: (
-                    setattr(state.current_player(), "balance", state.current_player().balance + 100 if state.current_player().balance + 100 >= 0 else 0),
-                ),
-            ),
-            (
-                16,
-                "You are assessed for street repairs: Pay $40 per house and $115 per hotel.",
-                lambda state: (
-                    setattr(
-                        state.current_player(),
-                        "balance",
-                        max(
-                            state.current_player().balance
-                            - sum(0 if not isinstance(prop, Street) else prop.houses for prop in state.current_player().properties) * 40
-                            - sum(0 if not isinstance(prop, Street) else prop.hotels for prop in state.current_player().properties) * 115,
-                            0,
-                        ),
-                    ),
-                ),
-            ),
-        ]
+        self.board: List[Tile] = [tile_type(*args) for tile_type, args in _BOARD_LAYOUT]
+
+        # Decks are drawn from and reordered in place, so each board gets its own list over the shared cards.
+        self.chance_cards: List[Tuple[int, str, Callable[[State], None]]] = list(_CHANCE_CARDS)
+        self.community_chest_cards: List[Tuple[int, str, Callable[[State], None]]] = list(_COMMUNITY_CHEST_CARDS)
 
         self.houses_available = houses_available
         self.hotels_available = hotels_available
+        self._index_tiles()
+
+    def _find_nearest(self, state: State, player: Player, tile_type: Type[Tile]) -> int:
+        return self._nearest[tile_type][player.position]
+
+    def _index_tiles(self) -> None:
+        """Number the tiles and rebuild every lookup derived from self.board."""
+        self.size = len(self.board)
+        self.property_at = []
         self.properties = []
         self.streets = []
-        property_idx = 0
-        street_idx = 0
         for i, tile in enumerate(self.board):
             tile.index = i
-            if isinstance(tile, Property):
-                tile.property_idx = property_idx
+            if tile.kind in _PROPERTY_KINDS:
+                tile.property_idx = len(self.properties)
                 self.properties.append(tile)
-                property_idx += 1
-            if isinstance(tile, Street):
-                tile.street_idx = street_idx
-                self.streets.append(tile)
-                street_idx += 1
+                self.property_at.append(tile)
+                if tile.kind == TileKind.STREET:
+                    tile.street_idx = len(self.streets)
+                    self.streets.append(tile)
+            else:
+                self.property_at.append(None)
+        self.streets_by_color = self._group_streets_by_color()
+        self.color_set_peers = self._color_set_peers()
+        self._index_tile_layout()
+        # House cost per street, indexed by street_idx.
+        self.house_costs = np.array([street.color_set.house_cost for street in self.streets], dtype=np.int32)
 
-    def _find_nearest(self, state: State, player: Player, tile_type: Type[Tile]) -> int:
-        current_pos = state.current_player().position
-        for offset in range(1, len(self.board) + 1):
-            next_pos = (current_pos + offset) % len(self.board)
-            if isinstance(self.board[next_pos], tile_type):
-                return next_pos
-        return current_pos
+    def _index_tile_layout(self) -> None:
+        """Tiles grouped by kind, and the nearest-tile tables."""
+        tiles_of_kind = {kind: [] for kind in TileKind}
+        for tile in self.board:
+            tiles_of_kind[tile.kind].append(tile)
+        self.tiles_of_kind = {kind: tuple(tiles) for kind, tiles in tiles_of_kind.items()}
+        self._nearest = _nearest_tables(tuple(tile.kind for tile in self.board))
     
     def generate_board_from_tiles(self, tiles: List[Tile], houses_available: int, hotels_available: int):
-        self.board = []
-        for tile_idx, tile in enumerate(tiles):
-            if isinstance(tile, Property):
-                tile.index = tile_idx
-            self.board.append(tile)
+        self.board = list(tiles)
         self.houses_available = houses_available
         self.hotels_available = hotels_available
+        self._index_tiles()
+
+    def _group_streets_by_color(self) -> Dict[ColorSet, List[Street]]:
+        groups: Dict[ColorSet, List[Street]] = {}
+        for tile in self.board:
+            if isinstance(tile, Street):
+                groups.setdefault(tile.color_set, []).append(tile)
+        return groups
+
+    def _color_set_peers(self) -> Dict[int, Tuple[Street, ...]]:
+        """The other streets in each street's color set, keyed by tile index."""
+        return {
+            street.index: tuple(other for other in streets if other.index != street.index)
+            for streets in self.streets_by_color.values()
+            for street in streets
+        }
 
     def get_property_by_index(self, index: int) -> Optional[Property]:
         return self.board[index]
 
-    def get_properties_by_color(self, color_set: ColorSet) -> List[Property]:
-        properties = [
-            tile for tile in self.board
-            if isinstance(tile, Property) and tile.color_set == color_set
-        ]
-        return properties
\ No newline at end of file
+    def get_properties_by_color(self, color_set: ColorSet) -> Sequence[Street]:
+        return self.streets_by_color.get(color_set, _NO_STREETS)
+
+
+# Card effects. Each takes the game state and applies the card to the current player.
+CardEffect = Callable[["State"], None]
+
+
+def _advance_to_go(state: State) -> None:
+    player = state.current_player()
+    player.position = 0
+    player.balance = max(player.balance + 200, 0)
+
+
+def _advance_to(position: int) -> CardEffect:
+    """Move to position, collecting $200 when the move wraps past Go."""
+    def effect(state: State) -> None:
+        player = state.current_player()
+        if position < player.position:
+            player.balance += 200
+        player.position = position
+    return effect
+
+
+def _advance_to_nearest_utility(state: State) -> None:
+    player = state.current_player()
+    player.position = state.board._find_nearest(state, player, Utility)
+
+
+def _advance_to_nearest_railroad(state: State) -> None:
+    player = state.current_player()
+    player.position = state.board._find_nearest(state, player, Railroad)
+
+
+def _go_back_three_spaces(state: State) -> None:
+    player = state.current_player()
+    player.position = max(player.position - 3, 0)
+
+
+def _go_to_jail(state: State) -> None:
+    player = state.current_player()
+    player.position = 10
+    player.in_jail = True
+    player.jail_turns = 0
+
+
+def _take_jail_free_card(state: State) -> None:
+    state.current_player().jail_free_cards += 1
+
+
+def _collect(amount: int) -> CardEffect:
+    def effect(state: State) -> None:
+        state.current_player().balance += amount
+    return effect
+
+
+def _collect_floored(amount: int) -> CardEffect:
+    def effect(state: State) -> None:
+        player = state.current_player()
+        player.balance = max(player.balance + amount, 0)
+    return effect
+
+
+def _pay(amount: int) -> CardEffect:
+    def effect(state: State) -> None:
+        state.current_player().balance -= amount
+    return effect
+
+
+def _pay_floored(amount: int) -> CardEffect:
+    def effect(state: State) -> None:
+        player = state.current_player()
+        player.balance = max(player.balance - amount, 0)
+    return effect
+
+
+def _pay_repairs(per_house: int, per_hotel: int) -> CardEffect:
+    def effect(state: State) -> None:
+        player = state.current_player()
+        cost = 0
+        for street in state.streets_owned(player):
+            cost += street.houses * per_house + street.hotels * per_hotel
+        player.balance = max(player.balance - cost, 0)
+    return effect
+
+
+def _pay_each_player(amount: int) -> CardEffect:
+    def effect(state: State) -> None:
+        players = state.players
+        me = state.current_player()
+        me.balance -= amount * (len(players) - 1)
+        for other in players:
+            if other is not me:
+                other.balance += amount
+    return effect
+
+
+def _collect_from_each_player(amount: int) -> CardEffect:
+    def effect(state: State) -> None:
+        me = state.current_player()
+        me.balance = max(me.balance + amount, 0)
+        for other in state.players:
+            if other is not me:
+                other.balance = max(other.balance - amount, 0)
+    return effect
+
+
+_CHANCE_CARDS: Tuple[Tuple[int, str, CardEffect], ...] = (
+    (1, "Advance to Go (Collect $200).", _advance_to_go),
+    (2, "Advance to Illinois Avenue. If you pass Go, collect $200.", _advance_to(24)),
+    (3, "Advance to St. Charles Place. If you pass Go, collect $200.", _advance_to(11)),
+    (4, "Advance token to the nearest Utility. If unowned, you may buy it from the Bank.", _advance_to_nearest_utility),
+    (5, "Advance token to the nearest Railroad and pay owner twice the rental to which they are otherwise entitled.", _advance_to_nearest_railroad),
+    (6, "Bank pays you dividend of $50.", _collect(50)),
+    (7, "Get Out of Jail Free. This card may be kept until needed, or traded/sold.", _take_jail_free_card),
+    (8, "Go Back 3 Spaces.", _go_back_three_spaces),
+    (9, "Go to Jail. Go directly to jail, do not pass Go, do not collect $200.", _go_to_jail),
+    (10, "Make general repairs on all your property: For each house pay $25, for each hotel pay $100.", _pay_repairs(25, 100)),
+    (11, "Pay poor tax of $15.", _pay(15)),
+    (12, "Take a trip to Reading Railroad. If you pass Go, collect $200.", _advance_to(5)),
+    (13, "Take a walk on the Boardwalk. Advance token to Boardwalk.", _advance_to(39)),
+    (14, "You have been elected Chairman of the Board. Pay each player $50.", _pay_each_player(50)),
+    (15, "Your building loan matures. Collect $150.", _collect(150)),
+    (16, "Receive for services $25.", _collect(25)),
+)
+
+_COMMUNITY_CHEST_CARDS: Tuple[Tuple[int, str, CardEffect], ...] = (
+    (1, "Advance to Go (Collect $200).", _advance_to_go),
+    (2, "Bank error in your favor. Collect $200.", _collect_floored(200)),
+    (3, "Doctor's fees. Pay $50.", _pay_floored(50)),
+    (4, "From sale of stock you get $50.", _collect_floored(50)),
+    (5, "Get Out of Jail Free. This card may be kept until needed, or traded/sold.", _take_jail_free_card),
+    (6, "Go to Jail. Go directly to jail, do not pass Go, do not collect $200.", _go_to_jail),
+    (7, "Grand Opera Night. Collect $50 from every player for opening night seats.", _collect_from_each_player(50)),
+    (8, "Holiday Fund matures. Receive $100.", _collect_floored(100)),
+    (9, "Income tax refund. Collect $20.", _collect_floored(20)),
+    (10, "It is your birthday. Collect $10 from every player.", _collect_from_each_player(10)),
+    (11, "Life insurance matures. Collect $100.", _collect_floored(100)),
+    (12, "Pay hospital fees of $100.", _pay_floored(100)),
+    (13, "Pay school fees of $150.", _pay_floored(150)),
+    (14, "Receive $25 consultancy fee.", _collect_floored(25)),
+    (15, "You inherit $100.", _collect_floored(100)),
+    (16, "You are assessed for street repairs: Pay $40 per house and $115 per hotel.", _pay_repairs(40, 115)),
+)
@@ -2,17 +2,19 @@
 #python3 -m monopoly_gym.env
 import copy
 import sys
-from typing import Dict, List, Tuple, Union
-import random
+from typing import Dict, List, Optional, Tuple, Type, Union
+import numpy as np
 import logging
+import logging.handlers
 import coloredlogs
 import pygame
 import datetime 
 import os
+import time
 
 import gym
 from monopoly_gym.renderer import Renderer
-from monopoly_gym.action import Action, ActionSpaceType, HIERARCHICAL_ACTION_CLASSES, AuctionAction, AuctionBidAction, AuctionFoldAction, BankruptcyAction, EndTurnAction
+from monopoly_gym.action import Action, ActionSpaceType, HIERARCHICAL_ACTION_CLASSES, AuctionAction, AuctionBidAction, AuctionFoldAction, BankruptcyAction, EndTurnAction, dice_snapshot, restore_dice, seed_dice
 from gym.spaces import Dict as GymDict, Discrete
 
 from monopoly_gym.player import Player
@@ -25,12 +27,26 @@ MAX_JAIL_TURNS = 3
 MAX_PLAYERS = 8
 LEAVE_JAIL_FEE = 50
 DEFAULT_MAX_TURNS = 10000
+# Log records held in memory before a file write; ERROR and above flush immediately.
+LOG_BUFFER_CAPACITY = 4096
+FRAME_INTERVAL = 1 / 30  # seconds between rendered frames
+
+
+def _buffered(handler: logging.Handler) -> logging.handlers.MemoryHandler:
+    return logging.handlers.MemoryHandler(capacity=LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=handler)
 
 class MonopolyEnvironment(gym.Env):
 
     def __init__(self, max_turns: int = DEFAULT_MAX_TURNS, use_render: bool = True,
                  enable_general_log: bool = True, general_log_file: str = "monopoly_game.log",
-                 enable_timestamped_log: bool = False, timestamped_log_dir: str = "logs"):
+                 enable_timestamped_log: bool = False, timestamped_log_dir: str = "logs",
+                 log_level: int = logging.INFO, seed: Optional[int] = None):
+        """``log_level`` applies to the environment logger; pass ``logging.DEBUG``
+        to get the per-action [EXEC] traces, which are skipped entirely otherwise.
+
+        ``seed`` makes a game reproducible: it seeds both the card shuffles and
+        the dice. The dice generator is shared by the whole process, so seeding
+        one environment reseeds the dice of any other running alongside it."""
 
         # --- Configure Loggers ---
         self.env_logger = logging.getLogger("gym.env") 
@@ -57,8 +73,9 @@ class MonopolyEnvironment(gym.Env):
             general_file_h = logging.FileHandler(general_log_file, mode='a') # Append mode
             general_file_h.setFormatter(log_formatter)
             general_file_h.setLevel(logging.DEBUG) # Log all levels to this file
-            self.env_logger.addHandler(general_file_h)
-            self.state_logger.addHandler(general_file_h)
+            general_buffer_h = _buffered(general_file_h)
+            self.env_logger.addHandler(general_buffer_h)
+            self.state_logger.addHandler(general_buffer_h)
 
         # Timestamped Log File (optional, for individual game runs)
         if enable_timestamped_log and timestamped_log_dir:
@@ -71,10 +88,11 @@ class MonopolyEnvironment(gym.Env):
             ts_file_h = logging.FileHandler(ts_log_filename, mode='w') 
             ts_file_h.setFormatter(log_formatter)
             ts_file_h.setLevel(logging.DEBUG)
-            self.env_logger.addHandler(ts_file_h)
-            self.state_logger.addHandler(ts_file_h)
+            ts_buffer_h = _buffered(ts_file_h)
+            self.env_logger.addHandler(ts_buffer_h)
+            self.state_logger.addHandler(ts_buffer_h)
 
-        self.env_logger.setLevel(logging.DEBUG) 
+        self.env_logger.setLevel(log_level)
         self.state_logger.setLevel(logging.INFO)
 
         self.state = State(max_turns=max_turns, logger=self.state_logger)
@@ -83,8 +101,11 @@ class MonopolyEnvironment(gym.Env):
             self.renderer = Renderer(name="MonopolyGym", state=self.state)
         else:
             self.renderer = None
-        self.action_classes: List[Action] = HIERARCHICAL_ACTION_CLASSES
+        self.action_classes: Tuple[Type[Action], ...] = HIERARCHICAL_ACTION_CLASSES
         self.use_render = use_render
+        self._rng = np.random.default_rng(seed)
+        if seed is not None:
+            seed_dice(seed)
         self.env_logger.info(f"MonopolyEnvironment initialized. Timestamped logs: {'Enabled' if enable_timestamped_log else 'Disabled'}")
 
 
@@ -95,13 +116,13 @@ class MonopolyEnvironment(gym.Env):
 
 
     def shuffle_cards(self, deck):
-        """Shuffle a card deck."""
-        random.shuffle(deck)
+        """Shuffle a card deck in place."""
+        self._rng.shuffle(deck)
         return deck
 
     def add_player(self, player: Player):
         if len(self.state.players) < MAX_PLAYERS:
-            self.state.players.append(player)
+            self.state.add_player(player)
         else:
             raise ValueError(f"Maximum number of players is {MAX_PLAYERS}.")
 
@@ -110,63 +131,52 @@ class MonopolyEnvironment(gym.Env):
             self.add_player(player)
 
 
-    def step(self, action: Action) -> Tuple[Union[State,GymDict,dict], float, bool, bool, dict]:
+    def step(self, action: Action, skip_validation: bool = False, return_obs: bool = True) -> Tuple[Union[State,GymDict,dict], float, bool, bool, dict]:
+        """Apply ``action``. Pass ``skip_validation=True`` when the action was
+        drawn from the current action mask, so its preconditions already hold,
+        and ``return_obs=False`` when the observation will be discarded."""
         if isinstance(action, Action):
-            action.process(self.state)
+            if skip_validation:
+                action.process_unchecked(self.state)
+            else:
+                action.process(self.state)
         else:
             self.env_logger.error(f"Unknown action type: {action}")
         reward = None
-        return self.state.to_dict(), reward, self.is_game_over(), {}
+        return self.state.to_dict() if return_obs else None, reward, self.is_game_over(), {}
 
-    def multistep(self, actions: List[Action]) -> Tuple[Union[State,GymDict,dict], float, bool, bool, dict]:
+    def multistep(self, actions: List[Action], return_obs: bool = True) -> Tuple[Union[State,GymDict,dict], float, bool, bool, dict]:
         for action in actions:
-            self.step(action=action)
+            self.step(action=action, return_obs=False)
         reward = None
-        return self.state.to_dict(), reward, self.is_game_over(), {}
+        return self.state.to_dict() if return_obs else None, reward, self.is_game_over(), {}
 
     def validate_actions(self, actions: List[Action]) -> bool:
-        # Clone the entire game state
-        temp_state = copy.deepcopy(self.state)
-
-        tile_map = {}
-        for original_tile, cloned_tile in zip(self.state.board.board, temp_state.board.board):
-            tile_map[original_tile] = cloned_tile
-
-        for orig_action in actions:
-            action_copy = copy.deepcopy(orig_action)
-
-            if action_copy.player:
-                cloned_player = next((p for p in temp_state.players 
-                                    if p.name == action_copy.player.name 
-                                        and p.mgn_code == action_copy.player.mgn_code),
-                                    None)
-                if cloned_player:
-                    action_copy.player = cloned_player
-
-            if hasattr(action_copy, "property"):
-                if action_copy.property in tile_map:
-                    action_copy.property = tile_map[action_copy.property]
-
-            if hasattr(action_copy, "street"):
-                if action_copy.street in tile_map:
-                    action_copy.street = tile_map[action_copy.street]
-
-            old_balance = action_copy.player.balance if action_copy.player else None
-            action_copy.process(temp_state)
-            new_balance = action_copy.player.balance if action_copy.player else None
-
-        for p in temp_state.players:
-            if p.balance < 0:
-                self.env_logger.warning(f"Validation failed: {p.name} ended below $0.")
-                sys.exit()
-                return False
+        # Trial-run the actions on the live state and roll it back afterwards.
+        # Actions are shallow-copied so anything they record while processing
+        # (such as a dice roll) does not leak into the caller's objects, and
+        # the dice stream is rewound so the validated rolls are the ones played.
+        snapshot = self.state.snapshot()
+        dice = dice_snapshot()
+        try:
+            for orig_action in actions:
+                copy.copy(orig_action).process(self.state)
+            overdrawn = [p for p in self.state.players if p.balance < 0]
+        finally:
+            restore_dice(dice)
+            self.state.restore(snapshot)
+
+        for p in overdrawn:
+            self.env_logger.warning(f"Validation failed: {p.name} ended below $0.")
+            sys.exit()
+            return False
 
         return True
 
 
     def _multistep_validated_actions_util(self, player: Player) -> tuple:
         actions = player.decide_actions(self.state)
-        self.multistep(actions=actions)
+        self.multistep(actions=actions, return_obs=False)
 
 
     def multistep_validated_actions(self):
@@ -174,13 +184,18 @@ class MonopolyEnvironment(gym.Env):
             player = self.state.current_player()
             actions = player.decide_actions(self.state)
 
-            self.env_logger.info(f"[EXECUTE] Applying {[a.to_mgn() for a in actions]}")
+            if self.env_logger.isEnabledFor(logging.INFO):
+                self.env_logger.info("[EXECUTE] Applying %s", [a.to_mgn() for a in actions])
+            trace = self.env_logger.isEnabledFor(logging.DEBUG)
             for action in actions:
+                if not trace:
+                    action.process(self.state)
+                    continue
                 before = (action.player.balance, action.player.position, [p.name for p in action.player.properties])
-                self.env_logger.info(f"[EXEC] → {action.to_mgn()} ({action.to_dict()})")
+                self.env_logger.debug("[EXEC] → %s (%s)", action.to_mgn(), action.to_dict())
                 action.process(self.state)
                 after  = (action.player.balance, action.player.position, [p.name for p in action.player.properties])
-                self.env_logger.info(f"[EXEC] {action.to_mgn()} ({action.to_dict()}) → bal {before[0]}->{after[0]}, pos {before[1]}->{after[1]}, props {before[2]}->{after[2]}")
+                self.env_logger.debug("[EXEC] %s (%s) → bal %s->%s, pos %s->%s, props %s->%s", action.to_mgn(), action.to_dict(), before[0], after[0], before[1], after[1], before[2], after[2])
 
             if any(isinstance(a, (EndTurnAction, BankruptcyAction)) for a in actions):
                 self.env_logger.info(f"{player.name} ended their turn.")
@@ -193,25 +208,30 @@ class MonopolyEnvironment(gym.Env):
         self.env_logger.info(f"Starting a new Monopoly game. Max turns: {self.state.max_turns}")
         self.env_logger.info(f"Players: {[p.name for p in self.state.players]}")
 
-        if self.use_render:
-            self.render(mode='human')
+        # Frames are drawn on wall-clock time rather than once per turn, and
+        # only when the state has changed, so the simulation never waits on
+        # the frame-rate cap.
+        last_frame = float("-inf")
+        rendered_version = None
         while not self.is_game_over():
             if self.use_render:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        self.running = False
-                        pygame.quit() # Ensure pygame quits
-                        return # Exit play loop
+                now = time.perf_counter()
+                if now - last_frame >= FRAME_INTERVAL:
+                    last_frame = now
+                    for event in pygame.event.get():
+                        if event.type == pygame.QUIT:
+                            self.running = False
+                            pygame.quit() # Ensure pygame quits
+                            return # Exit play loop
+                    if self.state.version != rendered_version:
+                        rendered_version = self.state.version
+                        self.render(mode='human')
             player = self.state.current_player()
             self.env_logger.info(f"[ENV] It's {player.name}'s turn, jail={player.in_jail}, rolled_this_turn={self.state.rolled_this_turn}, doubles_count={self.state.current_consecutive_doubles}")
             self.multistep_validated_actions()
-            if self.use_render:
-                self.render(mode='human')
-
-            # Limit the frame rate
-            if self.use_render:
-                self.renderer.tick(framerate=30)
 
+        if self.use_render:
+            self.render(mode='human')
         self.env_logger.info(f"The game is over! {self.state.players[0].name} wins!")
         if self.use_render:
             pygame.quit()
@@ -219,21 +239,26 @@ class MonopolyEnvironment(gym.Env):
     def is_game_over(self):
         return len(self.state.players) == 1  # Game ends when only one player remains
 
-    def reset(self) -> dict:
+    def reset(self, seed: Optional[int] = None) -> dict:
+        """Start a new game; a ``seed`` reseeds the shuffles and dice as in ``__init__``."""
+        if seed is not None:
+            self._rng = np.random.default_rng(seed)
+            seed_dice(seed)
         self.state.reset()
         self.env_logger.info("MonopolyEnvironment state has been reset.")
         return self.state.to_dict()
 
     def close(self):
         self.env_logger.info("Closing MonopolyEnvironment.")
-        for handler in list(self.env_logger.handlers):
-            if isinstance(handler, logging.FileHandler):
-                handler.close()
-            self.env_logger.removeHandler(handler)
-        for handler in list(self.state_logger.handlers):
-            if isinstance(handler, logging.FileHandler):
-                handler.close()
-            self.state_logger.removeHandler(handler)
+        for logger_instance in (self.env_logger, self.state_logger):
+            for handler in list(logger_instance.handlers):
+                if isinstance(handler, logging.handlers.MemoryHandler):
+                    handler.flush()
+                    if handler.target is not None:
+                        handler.target.close()
+                if isinstance(handler, (logging.FileHandler, logging.handlers.MemoryHandler)):
+                    handler.close()
+                logger_instance.removeHandler(handler)
         if self.use_render and self.renderer and self.renderer.running: # Check if renderer is running
              pygame.quit()
 
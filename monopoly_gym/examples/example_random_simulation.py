@@ -3,7 +3,7 @@ from gym.env import MonopolyEnvironment
 from gym.players.random_masked import MaskedRandomPlayer, ActionSpaceType
 
 def main():
-    env = MonopolyEnvironment(use_render=True)
+    env = MonopolyEnvironment(use_render=False)
     env.reset()
     
     agents = [
@@ -9,10 +9,14 @@ from monopoly_gym.tile import Property
 
 
 class Player(ABC):
+    __slots__ = ("name", "id", "mgn_code", "balance", "position", "properties", "in_jail", "jail_turns",
+                 "jail_free_cards", "is_bankrupt", "_hash")
+
     def __init__(self, name: str, mgn_code: str, starting_balance: int = 1500) -> None:
         self.name: str = name
         self.id = None
         self.mgn_code: str = mgn_code
+        self._hash: int = hash(mgn_code)
         self.balance: int = starting_balance
         self.position: int = 0
         self.properties: List[Property] = []
@@ -42,12 +46,14 @@ class Player(ABC):
         Check for equality between two Player objects.
         Players are considered equal if their `name` and `mgn_code` are identical.
         """
+        if self is other:
+            return True
         if not isinstance(other, Player):
             return False
-        return self.name == other.name and self.mgn_code == other.mgn_code
+        return self._hash == other._hash and self.mgn_code == other.mgn_code and self.name == other.name
     
     def __hash__(self):
-        return hash(self.mgn_code)
+        return self._hash
 
     def to_dict(self) -> dict:
         return {
@@ -1,6 +1,6 @@
 import logging
 import numpy as np
-from typing import List, Optional, Set, Tuple
+from typing import List, Optional, Sequence, Set, Tuple
 
 from monopoly_gym.player import Player
 from monopoly_gym.state import State
@@ -10,7 +10,7 @@ from monopoly_gym.action import (
     UseJailCardAction, PayJailFineAction, RollJailAction, BankruptcyAction,
     AuctionBidAction, AuctionFoldAction, RejectTradeAction
 )
-from monopoly_gym.tile import Property, Street, Railroad, Utility
+from monopoly_gym.tile import ColorSet, Property, Street, Railroad, Utility
 
 logger = logging.getLogger(__name__)
 
@@ -24,10 +24,8 @@ class FixedPolicyFivePlayer(Player):
         self.build_cash_threshold = 800
 
     def _get_property_obj_from_game_state(self, game_state: State, property_tile_index: int) -> Optional[Property]:
-        if 0 <= property_tile_index < len(game_state.board.tiles):
-            tile = game_state.board.tiles[property_tile_index]
-            if isinstance(tile, Property):
-                return tile
+        if 0 <= property_tile_index < game_state.board.size:
+            return game_state.board.property_at[property_tile_index]
         return None
 
     def _get_owned_property_by_tile_index(self, tile_index: int) -> Optional[Property]:
@@ -36,21 +34,13 @@ class FixedPolicyFivePlayer(Player):
                 return prop
         return None
         
-    def _get_all_streets_in_color_set(self, game_state: State, color_set_name: str) -> List[Street]:
-        if not color_set_name: return []
-        return [
-            p for p in game_state.board.tiles
-            if isinstance(p, Street) and p.color_set == color_set_name
-        ]
+    def _get_all_streets_in_color_set(self, game_state: State, color_set: ColorSet) -> Sequence[Street]:
+        if not color_set: return ()
+        return game_state.board.get_properties_by_color(color_set)
 
     def _owns_full_color_set(self, game_state: State, street_obj: Street) -> bool:
         if not street_obj.color_set: return False
-        all_props_in_set = self._get_all_streets_in_color_set(game_state, street_obj.color_set)
-        if not all_props_in_set: return False
-        for prop_in_set in all_props_in_set:
-            if prop_in_set.owner != self:
-                return False
-        return True
+        return game_state.player_has_complete_color_set(self, street_obj.color_set)
     
     def _get_potential_mortgage_value(self, property_to_mortgage: Property, game_state: State) -> int:
         return property_to_mortgage.mortgage_value
@@ -61,14 +51,21 @@ class FixedPolicyFivePlayer(Player):
         action_types_mask = action_mask_full['action_type']
         am = self.action_manager
 
+        action_type_bits = action_mask_full['action_type_bits']
+        action_name_to_bit = am.action_name_to_bit
+
         def is_action_type_valid(action_name_str: str) -> bool:
-            if action_name_str not in am.action_name_to_idx:
-                return False
-            return bool(action_types_mask[am.action_name_to_idx[action_name_str]])
-        if game_state.auction_state and game_state.auction_state.player_to_act == player:
-            prop_on_auction = game_state.auction_state.property
-            min_bid = game_state.auction_state.current_bid + (game_state.auction_state.bid_increment or 1)
-            max_bid_allowed = player.balance
+            return bool(action_type_bits & action_name_to_bit.get(action_name_str, 0))
+
+        # Nothing is applied while deciding, so these stay valid for the whole call.
+        balance = player.balance
+        properties = player.properties
+        safety_buffer = self.safety_buffer_general
+        auction_state = game_state.auction_state
+        if auction_state and auction_state.player_to_act == player:
+            prop_on_auction = auction_state.property
+            min_bid = auction_state.current_bid + (auction_state.bid_increment or 1)
+            max_bid_allowed = balance
             bid_limit = prop_on_auction.purchase_cost * 0.4 
             actual_bid = min(min_bid, int(bid_limit), max_bid_allowed)
 
@@ -86,43 +83,44 @@ class FixedPolicyFivePlayer(Player):
                 return [UseJailCardAction(player=player)]
             if is_action_type_valid('RollJailAction'): # Prefer roll over pay
                 return [RollJailAction(player=player)]
-            if player.balance >= 50 + self.safety_buffer_general * 2 and is_action_type_valid('PayJailFineAction'): # Pay only if very rich
+            if balance >= 50 + safety_buffer * 2 and is_action_type_valid('PayJailFineAction'): # Pay only if very rich
                 return [PayJailFineAction(player=player)]
-        if player.balance < 0:
+        if balance < 0:
             if is_action_type_valid('SellBuildingAction'):
-                owned_streets_with_one_house = [
-                    p for p in player.properties 
-                    if isinstance(p, Street) and p.houses == 1 and p.hotels == 0
-                ]
-                if owned_streets_with_one_house:
-                    owned_streets_with_one_house.sort(key=lambda s: s.purchase_cost, reverse=True)
-                    return [SellBuildingAction(player=player, street=owned_streets_with_one_house[0], quantity=1)]
+                street_to_sell_from = max(
+                    (p for p in properties if isinstance(p, Street) and p.houses == 1 and p.hotels == 0),
+                    key=lambda s: s.purchase_cost, default=None
+                )
+                if street_to_sell_from is not None:
+                    return [SellBuildingAction(player=player, street=street_to_sell_from, quantity=1)]
 
             if is_action_type_valid('MortgageAction'):
-                unmortgaged_props = [p for p in player.properties if not p.is_mortgaged]
-                unmortgaged_props.sort(key=lambda p_obj: p_obj.purchase_cost)
-                for prop_to_mortgage in unmortgaged_props:
+                prop_to_mortgage = min(
+                    (p for p in properties if not p.is_mortgaged),
+                    key=lambda p_obj: p_obj.purchase_cost, default=None
+                )
+                if prop_to_mortgage is not None:
                     return [MortgageAction(player=player, property_obj=prop_to_mortgage)]
             
-            if player.balance < 0 and is_action_type_valid('BankruptcyAction'):
+            if balance < 0 and is_action_type_valid('BankruptcyAction'):
                 return [BankruptcyAction(player=player)]
         if is_action_type_valid('UnmortgageAction'):
-            if player.balance > 1200: 
-                mortgaged_props = [p for p in player.properties if p.is_mortgaged]
+            if balance > 1200: 
+                mortgaged_props = [p for p in properties if p.is_mortgaged]
                 mortgaged_props.sort(key=lambda p_obj: p_obj.unmortgage_cost) # Unmortgage cheapest
                 for prop_to_unmortgage in mortgaged_props:
-                    if player.balance >= prop_to_unmortgage.unmortgage_cost + 1000: # Huge buffer
+                    if balance >= prop_to_unmortgage.unmortgage_cost + 1000: # Huge buffer
                         return [UnmortgageAction(player=player, property_obj=prop_to_unmortgage)]
-        if is_action_type_valid('BuildAction') and player.balance > self.build_cash_threshold:
+        if is_action_type_valid('BuildAction') and balance > self.build_cash_threshold:
             unmortgaged_owned_streets_no_buildings = []
-            for prop in player.properties:
+            for prop in properties:
                 if isinstance(prop, Street) and not prop.is_mortgaged and prop.houses == 0 and prop.hotels == 0:
                     if self._owns_full_color_set(game_state, prop):
                          unmortgaged_owned_streets_no_buildings.append(prop)
             unmortgaged_owned_streets_no_buildings.sort(key=lambda s: s.house_cost)
 
             for prop_to_build_on in unmortgaged_owned_streets_no_buildings:
-                if player.balance >= prop_to_build_on.house_cost + self.safety_buffer_general:
+                if balance >= prop_to_build_on.house_cost + safety_buffer:
                      return [BuildAction(player=player, street=prop_to_build_on, quantity=1)]
         current_tile_obj = self._get_property_obj_from_game_state(game_state, player.position)
 
@@ -131,14 +129,14 @@ class FixedPolicyFivePlayer(Player):
 
         if isinstance(current_tile_obj, Property) and current_tile_obj.owner is None:
             if is_action_type_valid('BuyAction'):
-                if player.balance >= current_tile_obj.purchase_cost + self.safety_buffer_general and current_tile_obj.purchase_cost <= 200:
+                if balance >= current_tile_obj.purchase_cost + safety_buffer and current_tile_obj.purchase_cost <= 200:
                     return [BuyAction(player=player, property_obj=current_tile_obj)]
-                elif player.balance < current_tile_obj.purchase_cost + self.safety_buffer_general and current_tile_obj.purchase_cost <= 200 and is_action_type_valid('MortgageAction'):
-                    unmortgaged_owned_props = [p for p in player.properties if not p.is_mortgaged]
+                elif balance < current_tile_obj.purchase_cost + safety_buffer and current_tile_obj.purchase_cost <= 200 and is_action_type_valid('MortgageAction'):
+                    unmortgaged_owned_props = [p for p in properties if not p.is_mortgaged]
                     unmortgaged_owned_props.sort(key=lambda p_obj: p_obj.purchase_cost) # Mortgage cheapest owned
                     for prop_to_mortgage in unmortgaged_owned_props:
-                        if player.balance + self._get_potential_mortgage_value(prop_to_mortgage, game_state) >= current_tile_obj.purchase_cost + self.safety_buffer_general / 2:
-                            if current_tile_obj.purchase_cost < prop_to_mortgage.purchase_cost or len(player.properties) < 5:
+                        if balance + self._get_potential_mortgage_value(prop_to_mortgage, game_state) >= current_tile_obj.purchase_cost + safety_buffer / 2:
+                            if current_tile_obj.purchase_cost < prop_to_mortgage.purchase_cost or len(properties) < 5:
                                 return [MortgageAction(player=player, property_obj=prop_to_mortgage)]
             
             if is_action_type_valid('AuctionAction'): # If didn't buy
@@ -147,5 +145,5 @@ class FixedPolicyFivePlayer(Player):
             return [EndTurnAction(player=player)]
         logger.warning(f"{self.policy_name} ({player.name}): Reached fallback. Action Mask: {action_types_mask}")
         if is_action_type_valid('EndTurnAction'): return [EndTurnAction(player=player)]
-        if is_action_type_valid('BankruptcyAction') and player.balance < 0 : return [BankruptcyAction(player=player)]
+        if is_action_type_valid('BankruptcyAction') and balance < 0 : return [BankruptcyAction(player=player)]
         return []
\ No newline at end of file
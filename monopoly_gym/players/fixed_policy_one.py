@@ -66,10 +66,11 @@ class FixedPolicyTwoPlayer(Player):
         action_types_mask = action_mask_full['action_type']
         am = self.action_manager
 
+        action_type_bits = action_mask_full['action_type_bits']
+        action_name_to_bit = am.action_name_to_bit
+
         def is_action_type_valid(action_name_str: str) -> bool:
-            if action_name_str not in am.action_name_to_idx:
-                return False
-            return bool(action_types_mask[am.action_name_to_idx[action_name_str]])
+            return bool(action_type_bits & action_name_to_bit.get(action_name_str, 0))
         if game_state.auction_state and game_state.auction_state.player_to_act == player:
             prop_on_auction = game_state.auction_state.property
             min_bid = game_state.auction_state.current_bid + (game_state.auction_state.bid_increment or 1)
@@ -124,7 +125,7 @@ class FixedPolicyTwoPlayer(Player):
         if player.balance < 0:
             logger.debug(f"{self.policy_name} ({player.name}): Negative balance (${player.balance}). Attempting to resolve.")
             if is_action_type_valid('SellBuildingAction'):
-                owned_streets_with_buildings = [p for p in player.properties if isinstance(p, Street) and (p.houses > 0 or p.hotels > 0)]
+                owned_streets_with_buildings = [p for p in game_state.streets_owned(player) if p.houses > 0 or p.hotels > 0]
                 owned_streets_with_buildings.sort(key=lambda s: (s.hotels, s.houses, s.purchase_cost), reverse=True)
                 for street_to_sell_from in owned_streets_with_buildings:
                     logger.debug(f"{self.policy_name} ({player.name}): Trying to sell building on {street_to_sell_from.name}.")
@@ -171,7 +172,7 @@ class FixedPolicyTwoPlayer(Player):
 
 
             for cs_name in sorted_color_sets:
-                streets_in_this_set = [p for p in player.properties if isinstance(p, Street) and p.color_set == cs_name]
+                streets_in_this_set = [p for p in game_state.streets_owned(player) if p.color_set == cs_name]
                 streets_in_this_set.sort(key=lambda s: (s.hotels, s.houses)) # Build evenly
                 
                 prop_to_build_on = streets_in_this_set[0]
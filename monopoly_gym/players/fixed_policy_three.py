@@ -75,10 +75,11 @@ class FixedPolicyThreePlayer(Player):
         action_types_mask = action_mask_full['action_type']
         am = self.action_manager
 
+        action_type_bits = action_mask_full['action_type_bits']
+        action_name_to_bit = am.action_name_to_bit
+
         def is_action_type_valid(action_name_str: str) -> bool:
-            if action_name_str not in am.action_name_to_idx:
-                return False
-            return bool(action_types_mask[am.action_name_to_idx[action_name_str]])
+            return bool(action_type_bits & action_name_to_bit.get(action_name_str, 0))
 
         if game_state.auction_state and game_state.auction_state.player_to_act == player:
             prop_on_auction = game_state.auction_state.property
@@ -115,7 +116,7 @@ class FixedPolicyThreePlayer(Player):
                 return [RollJailAction(player=player)]
         if player.balance < 0:
             if is_action_type_valid('SellBuildingAction'):
-                owned_streets_with_buildings = [p for p in player.properties if isinstance(p, Street) and (p.houses > 0 or p.hotels > 0)]
+                owned_streets_with_buildings = [p for p in game_state.streets_owned(player) if p.houses > 0 or p.hotels > 0]
                 owned_streets_with_buildings.sort(key=lambda s: (s.hotels, s.houses, s.purchase_cost), reverse=True)
                 for street_to_sell_from in owned_streets_with_buildings:
                     return [SellBuildingAction(player=player, street=street_to_sell_from, quantity=1)]
@@ -160,7 +161,7 @@ class FixedPolicyThreePlayer(Player):
                                        key=lambda cs_name: self._get_all_streets_in_color_set(game_state, cs_name)[0].house_cost)
 
             for cs_name in sorted_color_sets:
-                streets_in_this_set = [p for p in player.properties if isinstance(p, Street) and p.color_set == cs_name]
+                streets_in_this_set = [p for p in game_state.streets_owned(player) if p.color_set == cs_name]
                 streets_in_this_set.sort(key=lambda s: (s.hotels, s.houses))
                 
                 prop_to_build_on = streets_in_this_set[0]
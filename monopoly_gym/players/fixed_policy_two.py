@@ -61,10 +61,11 @@ class FixedPolicyOnePlayer(Player):
         action_types_mask = action_mask_full['action_type']
         am = self.action_manager
 
+        action_type_bits = action_mask_full['action_type_bits']
+        action_name_to_bit = am.action_name_to_bit
+
         def is_action_type_valid(action_name_str: str) -> bool:
-            if action_name_str not in am.action_name_to_idx:
-                return False
-            return bool(action_types_mask[am.action_name_to_idx[action_name_str]])
+            return bool(action_type_bits & action_name_to_bit.get(action_name_str, 0))
         if game_state.auction_state and game_state.auction_state.player_to_act == player:
             prop_on_auction = game_state.auction_state.property
             min_bid = game_state.auction_state.current_bid + (game_state.auction_state.bid_increment or 1)
@@ -106,8 +107,8 @@ class FixedPolicyOnePlayer(Player):
             logger.debug(f"{self.policy_name} ({player.name}): Negative balance (${player.balance}). Attempting to resolve.")
             if is_action_type_valid('SellBuildingAction'):
                 owned_streets_with_buildings = []
-                for prop in player.properties: # player.properties contains Property objects player owns
-                    if isinstance(prop, Street) and (prop.houses > 0 or prop.hotels > 0):
+                for prop in game_state.streets_owned(player):
+                    if prop.houses > 0 or prop.hotels > 0:
                         owned_streets_with_buildings.append(prop)
                 owned_streets_with_buildings.sort(key=lambda s: (s.hotels, s.houses, s.purchase_cost), reverse=True)
                 
@@ -154,7 +155,7 @@ class FixedPolicyOnePlayer(Player):
 
 
             for cs_name in sorted_color_sets:
-                streets_in_this_set = [p for p in player.properties if isinstance(p, Street) and p.color_set == cs_name]
+                streets_in_this_set = [p for p in game_state.streets_owned(player) if p.color_set == cs_name]
                 streets_in_this_set.sort(key=lambda s: (s.hotels, s.houses))
                 
                 prop_to_build_on = streets_in_this_set[0]
@@ -33,43 +33,41 @@ class MaskedRandomPlayer(Player):
             return [EndTurnAction(self)]
 
     def _handle_flat_action(self, action_mask: np.ndarray, game_state: State) -> List[Action]:
-        valid_indices = np.where(action_mask)[0]
+        valid_indices = np.flatnonzero(action_mask)
         if not valid_indices.size:
             return [EndTurnAction(self)]
-        action_idx = np.random.choice(valid_indices)
+        action_idx = _pick(valid_indices)
         action = self.action_manager.decode_action(action_idx, game_state)
         return [action]
 
     def _handle_hierarchical_action(self, action_mask: dict, game_state: State) -> List[Action]:
         action_type_mask = action_mask['action_type']
-        valid_action_indices = np.where(action_type_mask)[0]
+        valid_action_indices = np.flatnonzero(action_type_mask)
         if not valid_action_indices.size:
             print("Defaulting to bad valid action indicies size")
             return [EndTurnAction(self)]
         
-        chosen_action_idx = np.random.choice(valid_action_indices)
+        chosen_action_idx = _pick(valid_action_indices)
         action_cls = self.action_manager.action_classes[chosen_action_idx]
         parameters_mask = action_mask['parameters'][action_cls.__name__]
         
         parameters = {}
         for param_name, param_space in action_cls.hierarchical_parameters().items():
             if isinstance(param_space, Discrete):
-                param_valid = parameters_mask.get(param_name, [True]*param_space.n)
-                valid_options = np.where(param_valid)[0]
+                param_valid = parameters_mask.get(param_name)
+                valid_options = np.arange(param_space.n) if param_valid is None else np.flatnonzero(param_valid)
                 if valid_options.size == 0:
                     parameters[param_name] = 0 
                 else:
-                    parameters[param_name] = np.random.choice(valid_options)
+                    parameters[param_name] = _pick(valid_options)
             elif isinstance(param_space, MultiBinary):
                 n_bits = param_space.n
-                param_valid = parameters_mask.get(param_name, [True]*n_bits)
-                chosen_bits = []
-                for i in range(n_bits):
-                    if param_valid[i]:
-                        chosen_bits.append(np.random.choice([0,1]))
-                    else:
-                        chosen_bits.append(0)
-                parameters[param_name] = np.array(chosen_bits, dtype=int)
+                param_valid = parameters_mask.get(param_name)
+                valid_bits = np.arange(n_bits) if param_valid is None else np.flatnonzero(np.asarray(param_valid)[:n_bits])
+                chosen_bits = np.zeros(n_bits, dtype=int)
+                # One fair coin per selectable bit, drawn in a single call.
+                chosen_bits[valid_bits] = np.random.randint(0, 2, size=valid_bits.size)
+                parameters[param_name] = chosen_bits
 
         
         action_dict = {
@@ -77,4 +75,9 @@ class MaskedRandomPlayer(Player):
             "parameters": {action_cls.__name__: parameters}
         }
         action = self.action_manager.decode_action(action_dict, game_state)
-        return [action]
\ No newline at end of file
+        return [action]
+
+
+def _pick(options: np.ndarray):
+    """A uniformly random entry of options; consumes the global RNG exactly like np.random.choice(options)."""
+    return options[np.random.randint(0, options.size)]
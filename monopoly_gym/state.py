@@ -1,9 +1,10 @@
 # monopoly_gym/gym/state.py
 from __future__ import annotations
+from collections import deque
 from enum import Enum
-from typing import List, Literal, Optional, Tuple, TYPE_CHECKING, Union
+from typing import List, Literal, Optional, Sequence, Tuple, TYPE_CHECKING, Union
 from monopoly_gym.board import Board
-from monopoly_gym.tile import Chance, CommunityChest, Property, ColorSet, Railroad, SpecialTile, SpecialTileType, Street, Tax, Utility
+from monopoly_gym.tile import Chance, CommunityChest, Property, ColorSet, Railroad, SpecialTile, SpecialTileType, Street, Tax, TileKind, Utility
 from gym.spaces import Dict, Discrete, Box
 import logging
 
@@ -19,6 +20,9 @@ HOTEL_AUCTION_THRESHOLD = 2
 MAX_HOUSES_AVAILABLE_FOR_AUCTION = 1
 MAX_HOTELS_AVAILABLE_FOR_AUCTION = 1
 
+# Only the most recent chat messages are kept; older ones are dropped.
+CHAT_LOG_MAX_ENTRIES = 2048
+
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +35,17 @@ class BuildingType(Enum):
         return self.value
 
 class TradeOffer:
+    __slots__ = (
+        "proposer",
+        "responder",
+        "cash_offered",
+        "properties_offered",
+        "get_out_of_jail_cards_offered",
+        "cash_asking",
+        "properties_asking",
+        "get_out_of_jail_cards_asking",
+    )
+
     def __init__(self, proposer: Player, responder: Player, cash_offered: int, properties_offered: List[Property], get_out_of_jail_cards_offered: int,  cash_asking: int, properties_asking:  List[Property], get_out_of_jail_cards_asking: int ):
         self.proposer = proposer
         self.responder = responder
@@ -57,6 +72,8 @@ class TradeOffer:
         }
 
 class AuctionBid:
+    __slots__ = ("bidder", "bid_amount")
+
     def __init__(self, bidder: Player, bid_amount: int):
         self.bidder = bidder
         self.bid_amount = bid_amount
@@ -87,6 +104,7 @@ class AuctionState:
         return max(self.bids, key=lambda bid: bid.bid_amount)
 
     def resolve(self, state: State):
+        state.bump_version()
         if len(self.bids) == 0:
             if isinstance(self.auction_item, Property):
                 logger.info(f"Auction for {self.auction_item.name} ended with no bids. Property remains unowned.")
@@ -161,7 +179,7 @@ class AuctionState:
             
             # The game's current player must become the auction winner for the next action
             try:
-                state.current_player_index = state.players.index(auction_winner)
+                state.current_player_index = state.player_index(auction_winner)
             except ValueError:
                 logger.error(f"Auction winner {auction_winner.name} not found in state.players. Critical error. Building not placed.")
                 # Revert payment and bank inventory
@@ -227,10 +245,22 @@ def eligible_building_bidders(state: "State", property_idx: int, building_type:
     return bidders
 
 
+# Plain State attributes that actions reassign; snapshot() records them by value.
+_SNAPSHOT_FIELDS = (
+    "current_player_index", "current_consecutive_doubles", "turn_counter", "houses_available", "hotels_available",
+    "pending_trade", "rolled_this_turn", "last_dice_roll", "pending_debt_amount", "pending_creditor",
+    "property_decision_made_this_landing",
+)
+
+
 class State:
     def __init__(self, max_turns=50, logger: logging.Logger=None):
         self.board = Board(houses_available=32, hotels_available=12)
-        self.players : List[Player] = []
+        # Bumped whenever the game state changes; caches keyed on it (such as
+        # mask_cache) are stale once it moves. Code that mutates players or
+        # tiles directly, outside Action.process, must call bump_version().
+        self.version: int = 0
+        self.players : Tuple[Player, ...] = ()
         self.current_player_index: int = 0
         self.current_consecutive_doubles: int = 0
         self.max_turns: int = max_turns
@@ -240,14 +270,81 @@ class State:
         self.auction_state: Optional[AuctionState] = None
         self.pending_trade: Optional[TradeOffer] = None
         self.rolled_this_turn = False
-        self.chat_log: List[Dict] = []
+        self.chat_log: deque = deque(maxlen=CHAT_LOG_MAX_ENTRIES)
         self.last_dice_roll: Optional[Tuple[int, int]] = None
         self.pending_debt_amount: Optional[int] = None
         self.pending_creditor: Optional[Union[Player, Literal["Bank"]]] = None
         self.property_decision_made_this_landing: bool = False
         self.logger = logger
+        self.mask_cache: dict = {}
+        # Preallocated per-action mask storage, reused across versions.
+        self.mask_buffers: dict = {}
+        # (version, top balance, its player, runner-up balance)
+        self.top_balances: Optional[Tuple] = None
+        # Results of the color-set/build predicates, valid for predicate_cache_version.
+        self.predicate_cache: dict = {}
+        self.predicate_cache_version: int = -1
+
+    def bump_version(self) -> None:
+        self.version += 1
+
+    @property
+    def actions_blocked(self) -> bool:
+        """True while an auction or a trade response is pending, which disables most actions."""
+        return self.auction_state is not None or self.pending_trade is not None
+
+    @property
+    def players(self) -> Tuple[Player, ...]:
+        return self._players
+
+    @players.setter
+    def players(self, players: Sequence[Player]) -> None:
+        # Held as a tuple so players_by_mgn and player_idx_by_mgn cannot drift
+        # from it: change the roster with add_player / remove_player_at, or by
+        # reassigning it.
+        self._players = tuple(players)
+        self.players_by_mgn: Dict[str, Player] = {p.mgn_code: p for p in self._players}
+        self._reindex_players()
+        self.bump_version()
+
+    def _reindex_players(self) -> None:
+        self.player_idx_by_mgn: Dict[str, int] = {p.mgn_code: i for i, p in enumerate(self._players)}
+
+    def add_player(self, player: Player) -> None:
+        self._players += (player,)
+        self.players_by_mgn[player.mgn_code] = player
+        self.player_idx_by_mgn[player.mgn_code] = len(self._players) - 1
+        self.bump_version()
+
+    def remove_player_at(self, index: int) -> Player:
+        remaining = list(self._players)
+        player = remaining.pop(index)
+        self._players = tuple(remaining)
+        self.players_by_mgn.pop(player.mgn_code, None)
+        self._reindex_players()
+        self.bump_version()
+        return player
+
+    def player_index(self, player: Player) -> int:
+        """Position of player in self.players; raises ValueError like list.index."""
+        try:
+            return self.player_idx_by_mgn[player.mgn_code]
+        except KeyError:
+            raise ValueError(f"{player.name} is not in the game") from None
+
+    def resolve_trade(self) -> Optional[TradeOffer]:
+        """Close the pending trade, whether accepted or rejected, and return it.
+
+        Any transfer must already have been applied; this starts a new version so
+        masks that were computed with the trade pending are recomputed.
+        """
+        trade = self.pending_trade
+        self.pending_trade = None
+        self.bump_version()
+        return trade
 
     def advance_turn(self, player: Player) -> int:
+        self.bump_version()
         if player in self.players:
             if player.balance < 0:
                 return None
@@ -256,6 +353,7 @@ class State:
             self.current_player_index = 0
 
     def advance_auction_turn(self, player: Player) -> int:
+        self.bump_version()
         if player in self.auction_state.participants:
             self.auction_state.current_bidder_index = (self.auction_state.current_bidder_index + 1) % len(self.auction_state.participants)
         elif self.auction_state.current_bidder_index >= len(self.auction_state.participants):
@@ -300,9 +398,60 @@ class State:
             ],
         }
 
+    def snapshot(self) -> tuple:
+        """Capture everything actions mutate, so restore() can undo a trial run made in place."""
+        auction = self.auction_state
+        return (
+            tuple(getattr(self, field) for field in _SNAPSHOT_FIELDS),
+            auction,
+            None if auction is None else (list(auction.participants), list(auction.bids), auction.current_bidder_index, auction.placing_building_after_win),
+            self._players,
+            [
+                (player, player.balance, player.position, player.in_jail, player.jail_turns, player.jail_free_cards,
+                 player.is_bankrupt, list(player.properties))
+                for player in self._players
+            ],
+            [(prop, prop.owner, prop.is_mortgaged) for prop in self.board.properties],
+            [(street, street.houses, street.hotels) for street in self.board.streets],
+            (self.board.houses_available, self.board.hotels_available, list(self.board.chance_cards), list(self.board.community_chest_cards)),
+            deque(self.chat_log, maxlen=self.chat_log.maxlen),
+        )
+
+    def restore(self, snapshot: tuple) -> None:
+        """Return to a snapshot() taken on this state. Caches are invalidated by moving to a fresh version."""
+        fields, auction, auction_fields, players, player_fields, property_fields, street_fields, board_fields, chat_log = snapshot
+        for field, value in zip(_SNAPSHOT_FIELDS, fields):
+            setattr(self, field, value)
+        self.auction_state = auction
+        if auction is not None:
+            participants, bids, auction.current_bidder_index, auction.placing_building_after_win = auction_fields
+            auction.participants[:] = participants
+            auction.bids[:] = bids
+        self.players = players
+        for player, balance, position, in_jail, jail_turns, jail_free_cards, is_bankrupt, properties in player_fields:
+            player.balance = balance
+            player.position = position
+            player.in_jail = in_jail
+            player.jail_turns = jail_turns
+            player.jail_free_cards = jail_free_cards
+            player.is_bankrupt = is_bankrupt
+            player.properties[:] = properties
+        for prop, owner, is_mortgaged in property_fields:
+            prop.owner = owner
+            prop.is_mortgaged = is_mortgaged
+        for street, houses, hotels in street_fields:
+            street.houses = houses
+            street.hotels = hotels
+        board = self.board
+        board.houses_available, board.hotels_available, chance_cards, community_chest_cards = board_fields
+        board.chance_cards[:] = chance_cards
+        board.community_chest_cards[:] = community_chest_cards
+        self.chat_log = chat_log
+        self.bump_version()
+
     def reset(self):
         self.board = Board(houses_available=32, hotels_available=12)
-        self.players = []
+        self.players = ()
         self.current_player_index = 0
         self.current_consecutive_doubles = 0
         self.turn_counter = 0
@@ -310,29 +459,82 @@ class State:
         self.hotels_available = 12
         self.auction_state = None
         self.rolled_this_turn = False
+        self.mask_cache = {}
+        self.bump_version()
         return self 
 
+    def _predicates(self) -> dict:
+        """Predicate memo for the current version; emptied whenever the version moves."""
+        if self.predicate_cache_version != self.version:
+            self.predicate_cache = {}
+            self.predicate_cache_version = self.version
+        return self.predicate_cache
+
+    def streets_owned(self, player: Player) -> List[Street]:
+        """The Streets among player.properties, memoized for the current version."""
+        cache = self._predicates()
+        key = ("streets", player.mgn_code)
+        streets = cache.get(key)
+        if streets is None:
+            streets = cache[key] = [prop for prop in player.properties if isinstance(prop, Street)]
+        return streets
+
+    def buildable_streets(self, player: Player) -> List[Street]:
+        """Unmortgaged streets in the player's complete color sets, memoized for the current version."""
+        cache = self._predicates()
+        key = ("buildable", player.mgn_code)
+        streets = cache.get(key)
+        if streets is None:
+            streets = cache[key] = [
+                street for street in self.streets_owned(player)
+                if not street.is_mortgaged and self.player_has_complete_color_set(player, street.color_set)
+            ]
+        return streets
+
     def player_has_complete_color_set(self, player: Player, color_set: ColorSet) -> bool:
-        color_properties = [prop for prop in self.board.board if isinstance(prop, Street) and prop.color_set == color_set]
-        owns_full_set = all(prop.owner == player for prop in color_properties)
-        return owns_full_set
+        cache = self._predicates()
+        key = ("color_set", player.mgn_code, color_set)
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = all(prop.owner == player for prop in self.board.streets_by_color.get(color_set, ()))
+        return result
 
 
     def current_player(self) -> Player:
         """Return the current player."""
-        if self.auction_state:
+        if self.auction_state is not None:
             return self.auction_state.current_participant()
-        if self.pending_trade:
+        if self.pending_trade is not None:
             return self.pending_trade.responder
-        if not self.players:
+        players = self._players
+        if not players:
             raise ValueError("No players in the game")
         try:
-            return self.players[self.current_player_index]
+            return players[self.current_player_index]
         except Exception as ex:
-            print(f"Failed to set players={self.players} of len={len(self.players)} with ex={str(ex)} and current_player_index={self.current_player_index}")
-            return self.players[self.current_player_index]
+            print(f"Failed to set players={players} of len={len(players)} with ex={str(ex)} and current_player_index={self.current_player_index}")
+            return players[self.current_player_index]
+
+    def max_balance_excluding(self, player: Player) -> int:
+        """Highest balance among the other players (0 if there are none)."""
+        if self.top_balances is None or self.top_balances[0] != self.version:
+            top = second = top_player = None
+            for p in self.players:
+                if top is None or p.balance > top:
+                    second, top, top_player = top, p.balance, p
+                elif second is None or p.balance > second:
+                    second = p.balance
+            self.top_balances = (self.version, top, top_player, second)
+        _, top, top_player, second = self.top_balances
+        best = second if top_player is player else top
+        return 0 if best is None else best
+
+    def current_property(self) -> Optional[Property]:
+        """Return the property under the current player, or None for non-property tiles."""
+        return self.board.property_at[self.current_player().position]
 
     def send_player_to_jail(self, player: Player):
+        self.bump_version()
         player.position = 10
         player.in_jail = True
         self.current_consecutive_doubles = 0
@@ -340,18 +542,19 @@ class State:
 
 
     def handle_landing_on_tile(self, player: Player, dice_roll: Tuple[int, int]):
+        self.bump_version()
         current_tile = self.board.board[player.position]
         if self.logger is not None:
-            self.logger.info(f"{player.name} landed on {current_tile.name}.")
+            self.logger.info("%s landed on %s.", player.name, current_tile.name)
         self.property_decision_made_this_landing = False
         if isinstance(current_tile, Property):
             if current_tile.owner is None:
                 if self.logger is not None:
-                    self.logger.info(f"{current_tile.name} is available for purchase at ${current_tile.purchase_cost}.")
+                    self.logger.info("%s is available for purchase at $%s.", current_tile.name, current_tile.purchase_cost)
             elif current_tile.owner != player:
                 rent = self.calculate_rent(property=current_tile, dice_roll=dice_roll)
                 if self.logger is not None:
-                    self.logger.info(f"{player.name} landed on {current_tile.name}, owned by {current_tile.owner.name}. Rent is ${rent}.")
+                    self.logger.info("%s landed on %s, owned by %s. Rent is $%s.", player.name, current_tile.name, current_tile.owner.name, rent)
                 self.pending_creditor = current_tile.owner
                 self.pending_debt_amount = rent
                 player.balance -= rent
@@ -361,67 +564,9 @@ class State:
             self.pending_debt_amount = current_tile.tax_amount
             player.balance -= current_tile.tax_amount
         elif isinstance(current_tile, Chance):
-            # Draw the Chance card
-            card_id, card_text, card_effect = self.board.chance_cards.pop()
-            if self.logger is not None:
-                self.logger.info(f"{player.name} draws Chance #{card_id}: “{card_text}”")
-
-            before = {
-                "pos": player.position,
-                "bal": player.balance,
-                "in_jail": player.in_jail,
-                "jail_cards": player.jail_free_cards,
-            }
-
-            card_effect(self)
-
-            after = {
-                "pos": player.position,
-                "bal": player.balance,
-                "in_jail": player.in_jail,
-                "jail_cards": player.jail_free_cards,
-            }
-
-            self.logger.info(
-                f"Chance effect → pos {before['pos']}→{after['pos']}, "
-                f"bal {before['bal']}→{after['bal']}, "
-                f"in_jail {before['in_jail']}→{after['in_jail']}, "
-                f"jail_cards {before['jail_cards']}→{after['jail_cards']}"
-            )
-
-            if card_id != 7:
-                self.board.chance_cards.insert(0, (card_id, card_text, card_effect))
-
+            self._draw_card(player, self.board.chance_cards, "Chance", jail_free_card_id=7)
         elif isinstance(current_tile, CommunityChest):
-            card_id, card_text, card_effect = self.board.community_chest_cards.pop()
-            self.logger.info(f"{player.name} draws CC #{card_id}: “{card_text}”")
-
-            before = {
-                "pos": player.position,
-                "bal": player.balance,
-                "in_jail": player.in_jail,
-                "jail_cards": player.jail_free_cards,
-            }
-
-            card_effect(self)
-
-            after = {
-                "pos": player.position,
-                "bal": player.balance,
-                "in_jail": player.in_jail,
-                "jail_cards": player.jail_free_cards,
-            }
-
-            self.logger.info(
-                f"CC effect → pos {before['pos']}→{after['pos']}, "
-                f"bal {before['bal']}→{after['bal']}, "
-                f"in_jail {before['in_jail']}→{after['in_jail']}, "
-                f"jail_cards {before['jail_cards']}→{after['jail_cards']}"
-            )
-
-            if card_id != 5:
-                self.board.community_chest_cards.insert(0, (card_id, card_text, card_effect))
-
+            self._draw_card(player, self.board.community_chest_cards, "CC", jail_free_card_id=5)
         elif isinstance(current_tile, SpecialTile):
             if current_tile.special_tile_type == SpecialTileType.GO:
                 player.balance += 200
@@ -431,38 +576,56 @@ class State:
             self.logger.error(f"Failed to identify the type of tile for tile={current_tile}")
 
 
+    def _draw_card(self, player: Player, deck: list, deck_name: str, jail_free_card_id: int) -> None:
+        """Apply the top card of deck and return it to the bottom, unless it is the Get Out of Jail Free card the player keeps."""
+        card = deck.pop()
+        card_id, card_text, card_effect = card
+        if self.logger is None:
+            card_effect(self)
+        else:
+            self.logger.info("%s draws %s #%s: “%s”", player.name, deck_name, card_id, card_text)
+            pos, bal, in_jail, jail_cards = player.position, player.balance, player.in_jail, player.jail_free_cards
+            card_effect(self)
+            self.logger.info(
+                "%s effect → pos %s→%s, bal %s→%s, in_jail %s→%s, jail_cards %s→%s",
+                deck_name, pos, player.position, bal, player.balance, in_jail, player.in_jail, jail_cards, player.jail_free_cards,
+            )
+        if card_id != jail_free_card_id:
+            deck.insert(0, card)
+
     def calculate_rent(self, property, dice_roll):
         if property.is_mortgaged == True:
             return 0
         if isinstance(property, Street):
-            color_properties = [prop for prop in self.board.board if isinstance(prop, Street) and prop.color_set == property.color_set]
-            owns_full_set = all(prop.owner == property.owner for prop in color_properties)
+            owns_full_set = all(prop.owner == property.owner for prop in self.board.streets_by_color[property.color_set])
             if owns_full_set:
                 if property.hotels > 0:
                     return property.rent["hotel"]
-                elif property.houses > 0:
-                    return property.rent.get(f"{property.houses}_house_rent", 0)
-                else:
-                    return property.rent["color_set"]
+                return property.rent_by_houses[property.houses]
             else:
                 return property.rent.get("no_color_set", 0)
         elif isinstance(property, Utility):
-            utilities_owned = sum(1 for prop in property.owner.properties if isinstance(prop, Utility))
+            utilities_owned = sum(1 for utility in self.board.tiles_of_kind[TileKind.UTILITY] if utility.owner is property.owner)
             return sum(dice_roll) * property.rent_multiplier[utilities_owned - 1]
         elif isinstance(property, Railroad):
-            railroads_owned = sum(1 for prop in property.owner.properties if isinstance(prop, Railroad))
+            railroads_owned = sum(1 for railroad in self.board.tiles_of_kind[TileKind.RAILROAD] if railroad.owner is property.owner)
             return property.rent[railroads_owned - 1]
         return 0
             
-    def get_streets_in_color_set(self, color_set_obj: ColorSet) -> List[Street]:
+    def get_streets_in_color_set(self, color_set_obj: ColorSet) -> Sequence[Street]:
         """Helper to get all Street objects belonging to a given ColorSet."""
-        return [
-            tile for tile in self.board.board
-            if isinstance(tile, Street) and tile.color_set == color_set_obj
-        ]
+        return self.board.get_properties_by_color(color_set_obj)
 
 
     def player_can_build_on_property(self, player: Player, street: Street, building_type: BuildingType, check_even_build: bool = True) -> bool:
+        cache = self._predicates()
+        key = ("can_build", player.mgn_code, street.index, building_type, check_even_build)
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = self._player_can_build_on_property(player, street, building_type, check_even_build)
+        return result
+
+    def _player_can_build_on_property(self, player: Player, street: Street, building_type: BuildingType, check_even_build: bool) -> bool:
         if not isinstance(street, Street) or street.owner != player or street.is_mortgaged:
             return False
         if not self.player_has_complete_color_set(player, street.color_set):
@@ -472,8 +635,8 @@ class State:
             if street.houses >= 4: # Max houses or has hotel
                 return False
             if check_even_build:
-                for other_s_in_set in self.get_streets_in_color_set(street.color_set):
-                    if other_s_in_set.owner == player and other_s_in_set != street:
+                for other_s_in_set in self.board.color_set_peers[street.index]:
+                    if other_s_in_set.owner == player:
                         if other_s_in_set.hotels == 0 and other_s_in_set.houses < street.houses:
                             return False
             return True
@@ -482,15 +645,26 @@ class State:
             if street.houses != 4 or street.hotels >= 1:
                 return False
             if check_even_build:
-                for other_s_in_set in self.get_streets_in_color_set(street.color_set):
-                    if other_s_in_set.owner == player and other_s_in_set != street:
+                for other_s_in_set in self.board.color_set_peers[street.index]:
+                    if other_s_in_set.owner == player:
                         if not (other_s_in_set.houses == 4 or other_s_in_set.hotels > 0):
                             return False
             return True
         return False
 
     def get_potential_building_auction_competitors(self, initiator: Player, building_type_to_auction: BuildingType, cost_basis_property: Street) -> List['Player']:
-        competitors = []
+        return list(self._iter_building_auction_competitors(initiator, building_type_to_auction, cost_basis_property))
+
+    def count_potential_building_auction_competitors(self, initiator: Player, building_type_to_auction: BuildingType, cost_basis_property: Street, up_to: int) -> int:
+        """Count competitors, stopping as soon as up_to of them have been found."""
+        count = 0
+        for _ in self._iter_building_auction_competitors(initiator, building_type_to_auction, cost_basis_property):
+            count += 1
+            if count >= up_to:
+                break
+        return count
+
+    def _iter_building_auction_competitors(self, initiator: Player, building_type_to_auction: BuildingType, cost_basis_property: Street):
         base_cost = cost_basis_property.color_set.house_cost if building_type_to_auction == BuildingType.HOUSE else cost_basis_property.color_set.hotel_cost
 
         for player in self.players:
@@ -501,14 +675,11 @@ class State:
                 continue
 
             if self.player_can_build_type_on_any_property(player, building_type_to_auction):
-                competitors.append(player)
-                
-        return competitors
+                yield player
 
 
     def player_can_build_type_on_any_property(self, player: Player, building_type: BuildingType) -> bool:
-        for prop in player.properties:
-            if isinstance(prop, Street):
-                if self.player_can_build_on_property(player, prop, building_type, check_even_build=True):
-                    return True
+        for street in self.streets_owned(player):
+            if self.player_can_build_on_property(player, street, building_type, check_even_build=True):
+                return True
         return False
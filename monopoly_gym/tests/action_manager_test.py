@@ -1,8 +1,9 @@
+import numpy as np
 import pytest
 
 from monopoly_gym.state import State
 from monopoly_gym.player import Player
-from monopoly_gym.action import ActionManager, ActionSpaceType, EndTurnAction
+from monopoly_gym.action import ActionManager, ActionSpaceType, BuildAction, BuyAction, EndTurnAction, MAX_MESSAGE_LENGTH, ProposeTradeAction, RollDiceAction, SendMessageAction
 from monopoly_gym.tile import Property
 
 class SimplePlayer(Player):
@@ -36,3 +37,220 @@ def test_action_manager_no_endturn_if_unowned_property(minimal_state):
         "EndTurn should not be valid if the current player is on an unowned property "
         "with no auction in progress."
     )
+
+def test_trade_cash_masks_bounded_by_balances():
+    """
+    The cash_offered mask must stop at the proposer's balance and the
+    cash_asking mask at the richest other player's balance.
+    """
+    st = State()
+    p1 = SimplePlayer(name="P1", mgn_code="P1")
+    p2 = SimplePlayer(name="P2", mgn_code="P2")
+    p3 = SimplePlayer(name="P3", mgn_code="P3")
+    st.players = [p1, p2, p3]
+    p1.balance = 300
+    p2.balance = 700
+    p3.balance = 450
+
+    mask = ProposeTradeAction.to_action_mask_hierarchical(st)
+    assert mask["cash_offered"][300] and not mask["cash_offered"][301]
+    assert mask["cash_asking"][700] and not mask["cash_asking"][701]
+
+def test_trade_mask_views_are_read_only_and_refilled():
+    st = State()
+    p1 = SimplePlayer(name="P1", mgn_code="P1")
+    st.players = [p1, SimplePlayer(name="P2", mgn_code="P2"), SimplePlayer(name="P3", mgn_code="P3")]
+    p1.balance = 300
+
+    mask = ProposeTradeAction.to_action_mask_hierarchical(st)
+    for key, array in mask.items():
+        assert not array.flags.writeable, key
+
+    p1.balance = 200
+    st.bump_version()
+    mask = ProposeTradeAction.to_action_mask_hierarchical(st)
+    assert mask["cash_offered"][200] and not mask["cash_offered"][201]
+
+def test_masks_cached_until_state_version_changes(minimal_state):
+    """
+    Direct mutations are invisible to the mask cache until bump_version()
+    is called; after that the mask is recomputed.
+    """
+    st = minimal_state
+    st.players[0].position = 3
+    first = BuyAction.to_action_mask_hierarchical(st)
+    assert first["property"] == [True]
+
+    st.board.board[3].owner = st.players[0]
+    assert BuyAction.to_action_mask_hierarchical(st) is first
+
+    st.bump_version()
+    assert BuyAction.to_action_mask_hierarchical(st)["property"] == [False]
+
+def test_reassigning_players_invalidates_cached_masks(minimal_state):
+    st = minimal_state
+    manager = ActionManager(action_space_type=ActionSpaceType.FLAT)
+    propose_idx = manager.flat_offsets[ProposeTradeAction]
+    assert not manager.to_action_mask(st)[propose_idx]
+
+    st.players = [st.players[0], SimplePlayer(name="P2", mgn_code="P2")]
+    assert manager.to_action_mask(st)[propose_idx]
+
+def test_manager_mask_reused_within_version(minimal_state):
+    """
+    Repeated to_action_mask calls on an unchanged state return the same
+    combined mask; any action processed in between invalidates it.
+    """
+    manager = ActionManager(action_space_type=ActionSpaceType.HIERARCHICAL)
+    st = minimal_state
+    first = manager.to_action_mask(st)
+    assert manager.to_action_mask(st) is first
+
+    roll = RollDiceAction(st.players[0])
+    roll.dice_roll = (1, 2)
+    roll.process(st)
+    assert manager.to_action_mask(st) is not first
+
+def test_action_type_bits_match_action_type_mask(minimal_state):
+    manager = ActionManager(action_space_type=ActionSpaceType.HIERARCHICAL)
+    mask = manager.to_action_mask(minimal_state)
+    for name, idx in manager.action_name_to_idx.items():
+        assert bool(mask["action_type_bits"] & manager.action_name_to_bit[name]) == bool(mask["action_type"][idx])
+
+def test_cached_flat_mask_is_read_only(minimal_state):
+    manager = ActionManager(action_space_type=ActionSpaceType.FLAT)
+    mask = manager.to_action_mask(minimal_state)
+    assert manager.to_action_mask(minimal_state) is mask
+    with pytest.raises(ValueError):
+        mask[0] = True
+
+def test_cached_parameter_masks_are_read_only(minimal_state):
+    manager = ActionManager(action_space_type=ActionSpaceType.HIERARCHICAL)
+    parameters = manager.to_action_mask(minimal_state)["parameters"]
+    for name, cls_mask in parameters.items():
+        for key, array in cls_mask.items():
+            assert not array.flags.writeable, (name, key)
+
+def test_flat_mask_matches_action_space(minimal_state):
+    """
+    Each class's flat mask must be exactly flat_parameter_size() wide so
+    that mask indices decode to the action class they were computed for.
+    """
+    manager = ActionManager(action_space_type=ActionSpaceType.FLAT)
+    st = minimal_state
+    mask = manager.to_action_mask(st)
+    assert mask.shape == (manager.to_action_space().n,)
+
+    roll_idx = manager.flat_offsets[RollDiceAction]
+    assert mask[roll_idx]
+    assert isinstance(manager.decode_action(roll_idx, st), RollDiceAction)
+
+def test_message_decoding_stops_at_first_zero(minimal_state):
+    """
+    The message parameter is a zero-terminated byte array; anything after
+    the first 0 is padding and must not leak into the decoded text.
+    """
+    manager = ActionManager(action_space_type=ActionSpaceType.HIERARCHICAL)
+    st = minimal_state
+    message = np.zeros(MAX_MESSAGE_LENGTH, dtype=np.int32)
+    message[:2] = list(b"hi")
+    message[3:6] = list(b"bye")
+    action = manager.decode_action({
+        "action_type": manager.action_classes.index(SendMessageAction),
+        "parameters": {"SendMessageAction": {"recipient": 0, "message": message}},
+    }, st)
+    assert action.message == "hi"
+    assert action.recipient is None
+
+def test_trade_partner_index_skips_proposer():
+    """
+    trade_partner indexes the other players in seat order, so the
+    proposer's own seat is skipped when decoding.
+    """
+    manager = ActionManager(action_space_type=ActionSpaceType.HIERARCHICAL)
+    st = State()
+    p1 = SimplePlayer(name="P1", mgn_code="P1")
+    p2 = SimplePlayer(name="P2", mgn_code="P2")
+    p3 = SimplePlayer(name="P3", mgn_code="P3")
+    st.players = [p1, p2, p3]
+    st.current_player_index = 1
+
+    params = {
+        "cash_offered": 0, "properties_offered": [0] * 28, "get_out_of_jail_cards_offered": 0,
+        "cash_asking": 0, "properties_asking": [0] * 28, "get_out_of_jail_cards_asking": 0,
+    }
+    decoded = [
+        manager.decode_action({
+            "action_type": manager.action_classes.index(ProposeTradeAction),
+            "parameters": {"ProposeTradeAction": dict(params, trade_partner=partner)},
+        }, st).responder
+        for partner in (0, 1)
+    ]
+    assert decoded == [p1, p3]
+    with pytest.raises(ValueError):
+        manager.decode_action({
+            "action_type": manager.action_classes.index(ProposeTradeAction),
+            "parameters": {"ProposeTradeAction": dict(params, trade_partner=2)},
+        }, st)
+
+def test_decode_flat_batch_matches_single_decoding(minimal_state):
+    """
+    Batch decoding classifies every index into the same action class and
+    parameter as decoding the indices one at a time.
+    """
+    manager = ActionManager(action_space_type=ActionSpaceType.FLAT)
+    st = minimal_state
+    st.players[0].position = 3
+    idxs = [manager.flat_offsets[cls] for cls in (RollDiceAction, EndTurnAction, BuyAction)]
+    idxs.append(manager.flat_offsets[BuildAction] + 7)
+
+    batch = manager.decode_flat_batch(np.array(idxs), st)
+    singles = [manager.decode_action(i, st) for i in idxs]
+    assert [type(a) for a in batch] == [type(a) for a in singles]
+    assert (batch[-1].street, batch[-1].quantity) == (singles[-1].street, singles[-1].quantity) == (st.board.streets[1], 3)
+    with pytest.raises(ValueError):
+        manager.decode_flat_batch(np.array([manager.flat_size]), st)
+
+def test_trade_property_selection_accepts_packed_bits():
+    """
+    properties_offered may be the MultiBinary vector or the same selection
+    packed into an int; both pick only properties the proposer owns.
+    """
+    manager = ActionManager(action_space_type=ActionSpaceType.HIERARCHICAL)
+    st = State()
+    p1 = SimplePlayer(name="P1", mgn_code="P1")
+    p2 = SimplePlayer(name="P2", mgn_code="P2")
+    st.players = [p1, p2]
+    baltic = st.board.properties[1]
+    p1.properties.append(baltic)
+    baltic.owner = p1
+
+    vector = [0] * 28
+    vector[0] = vector[1] = 1
+    for selection in (vector, 0b11):
+        params = {
+            "trade_partner": 0, "cash_offered": 0, "properties_offered": selection,
+            "get_out_of_jail_cards_offered": 0, "cash_asking": 0,
+            "properties_asking": [0] * 28, "get_out_of_jail_cards_asking": 0,
+        }
+        action = manager.decode_action({
+            "action_type": manager.action_classes.index(ProposeTradeAction),
+            "parameters": {"ProposeTradeAction": params},
+        }, st)
+        assert action.properties_offered == [baltic]
+
+def test_idle_masks_match_computed_masks(minimal_state):
+    """
+    Each class's IDLE_HIERARCHICAL_MASK, used by the manager while no
+    auction or trade is pending, equals what the class computes then.
+    """
+    st = minimal_state
+    assert not st.actions_blocked
+    manager = ActionManager(action_space_type=ActionSpaceType.HIERARCHICAL)
+    for cls in manager.action_classes:
+        if cls.IDLE_HIERARCHICAL_MASK is None:
+            continue
+        computed = cls.to_action_mask_hierarchical(st)
+        assert computed.keys() == cls.IDLE_HIERARCHICAL_MASK.keys()
+        for key, value in computed.items():
+            assert np.array_equal(value, cls.IDLE_HIERARCHICAL_MASK[key])
@@ -1,8 +1,8 @@
 import pytest
-from monopoly_gym.state import State, TradeOffer, AuctionState, AuctionBid, AuctionState
+from monopoly_gym.state import State, TradeOffer, AuctionState, AuctionBid, AuctionState, BuildingType
 
 from monopoly_gym.player import Player
-from monopoly_gym.tile import Property, Street
+from monopoly_gym.tile import ColorSet, Property, Street
 
 from monopoly_gym.action import (
     RollDiceAction,
@@ -24,6 +24,11 @@ from monopoly_gym.action import (
     RejectTradeAction,
     ActionManager,
     ActionSpaceType,
+    action_from_dict,
+    dice_snapshot,
+    restore_dice,
+    seed_dice,
+    _roll_two,
 )
 
 
@@ -893,3 +898,257 @@ def test_use_jail_card_none_available(fresh_state: State):
     assert p1.in_jail, "Should remain in jail"
     assert p1.jail_free_cards == 0, "No card to use"
     assert p1.balance == old_balance, "No cost changes"
+
+
+def test_buy_process_unchecked_matches_process(fresh_state: State):
+    """
+    Scenario:
+      - P1 buys a property it can afford via the trusted process_unchecked path
+      - P2 then tries to buy the same (now owned) property via process
+    Expected:
+      - The unchecked path applies the purchase exactly like process would
+      - process still rejects the invalid second purchase
+    """
+    st = fresh_state
+    p1, p2 = st.players
+    p1.balance = 500
+    p2.balance = 500
+    prop = st.board.board[13]
+
+    BuyAction(p1, prop).process_unchecked(st)
+    assert p1.balance == 500 - 140
+    assert prop.owner == p1
+    assert prop in p1.properties
+
+    BuyAction(p2, prop).process(st)
+    assert p2.balance == 500, "Owned property must not be bought again."
+    assert prop.owner == p1
+
+
+def test_action_from_dict_round_trip(fresh_state: State):
+    """
+    Scenario:
+      - Serialize a handful of actions with to_dict
+    Expected:
+      - action_from_dict rebuilds each one as the same class and MGN string
+    """
+    st = fresh_state
+    p1 = st.players[0]
+    prop = st.board.board[13]
+    actions = [
+        RollDiceAction(p1),
+        EndTurnAction(p1),
+        BuyAction(p1, prop),
+        MortgageAction(p1, prop),
+        UseJailCardAction(p1),
+        PayJailFineAction(p1),
+        RollJailAction(p1),
+        BankruptcyAction(p1),
+        AuctionFoldAction(p1),
+    ]
+    for action in actions:
+        rebuilt = action_from_dict(action.to_dict(), st)
+        assert type(rebuilt) is type(action)
+        assert rebuilt.to_mgn() == action.to_mgn()
+
+
+def test_propose_trade_from_dict_resolves_tiles(fresh_state: State):
+    """
+    Scenario:
+      - A serialized trade lists Baltic (tile 3) offered, plus GO (tile 0)
+        and an off-board index asked
+    Expected:
+      - Baltic is resolved; the non-property and out-of-range indices are skipped
+    """
+    st = fresh_state
+    p1, p2 = st.players
+    data = ProposeTradeAction(trade_offer=TradeOffer(
+        proposer=p1, responder=p2,
+        cash_offered=10, properties_offered=[st.board.board[3]], get_out_of_jail_cards_offered=0,
+        cash_asking=0, properties_asking=[], get_out_of_jail_cards_asking=0,
+    )).to_dict()
+    data["properties_asking_indices"] = [0, 99]
+
+    rebuilt = action_from_dict(data, st)
+    assert rebuilt.properties_offered == [st.board.board[3]]
+    assert rebuilt.properties_asking == []
+
+
+def test_max_balance_excluding(fresh_state: State):
+    """
+    Scenario:
+      - P1 holds the top balance, P2 the runner-up
+    Expected:
+      - Excluding P1 yields P2's balance and vice versa
+      - A balance change is picked up after the state version moves
+    """
+    st = fresh_state
+    p1, p2 = st.players
+    p1.balance = 900
+    p2.balance = 300
+    st.bump_version()
+    assert st.max_balance_excluding(p1) == 300
+    assert st.max_balance_excluding(p2) == 900
+
+    p2.balance = 1200
+    st.bump_version()
+    assert st.max_balance_excluding(p1) == 1200
+
+
+def test_build_predicates_recomputed_after_build(fresh_state: State):
+    """
+    Scenario:
+      - p1 owns the whole Dark Blue set (37, 39) with no houses
+      - builds one house on Park Place
+    Expected:
+      - Before: a house may go on either street
+      - After: even-build forbids a second house on Park Place until
+        Boardwalk catches up, even though the predicate was evaluated
+        (and memoized) before the build
+    """
+    st = fresh_state
+    p1 = st.players[0]
+    park_place, boardwalk = st.board.board[37], st.board.board[39]
+    for street in (park_place, boardwalk):
+        street.owner = p1
+        p1.properties.append(street)
+    p1.balance = 2000
+    st.bump_version()
+
+    assert st.player_can_build_on_property(p1, park_place, BuildingType.HOUSE)
+    BuildAction(p1, park_place, quantity=1).process(st)
+
+    assert park_place.houses == 1
+    assert not st.player_can_build_on_property(p1, park_place, BuildingType.HOUSE)
+    assert st.player_can_build_on_property(p1, boardwalk, BuildingType.HOUSE)
+
+
+def test_advance_card_pays_when_passing_go(fresh_state: State):
+    st = fresh_state
+    player = st.current_player()
+    effects = {card_id: effect for card_id, _, effect in st.board.chance_cards}
+
+    player.position = 22
+    player.balance = 1000
+    effects[3](st)
+    assert player.position == 11
+    assert player.balance == 1200
+
+    player.position = 7
+    effects[3](st)
+    assert player.position == 11
+    assert player.balance == 1200
+
+
+def test_repair_card_charges_per_building(fresh_state: State):
+    st = fresh_state
+    player = st.current_player()
+    browns = st.board.streets_by_color[ColorSet.BROWN]
+    for street in browns:
+        street.owner = player
+        player.properties.append(street)
+    browns[0].houses = 3
+    browns[1].hotels = 1
+    st.bump_version()
+    player.balance = 1000
+    effects = {card_id: effect for card_id, _, effect in st.board.community_chest_cards}
+    effects[16](st)
+    assert player.balance == 1000 - 3 * 40 - 115
+
+
+def test_get_properties_by_color(fresh_state: State):
+    names = [street.name for street in fresh_state.board.get_properties_by_color(ColorSet.DARK_BLUE)]
+    assert names == ["Park Place", "Boardwalk"]
+
+
+def test_generate_board_from_tiles_reindexes_everything(fresh_state: State):
+    board = fresh_state.board
+    go, mediterranean, _, baltic = board.board[:4]
+    board.generate_board_from_tiles([go, mediterranean, baltic], houses_available=10, hotels_available=2)
+
+    assert board.size == 3
+    assert board.properties == [mediterranean, baltic] == board.streets
+    assert board.property_at == [None, mediterranean, baltic]
+    assert [(s.index, s.property_idx, s.street_idx) for s in board.streets] == [(1, 0, 0), (2, 1, 1)]
+    assert list(board.house_costs) == [50, 50]
+    assert board.get_properties_by_color(ColorSet.BROWN) == [mediterranean, baltic]
+
+
+def test_each_player_cards_move_money_between_all_players(fresh_state: State):
+    st = fresh_state
+    st.add_player(SimplePlayer(name="P3", mgn_code="P3"))
+    me, second, third = st.players
+    for player in st.players:
+        player.balance = 100
+    chance = {card_id: effect for card_id, _, effect in st.board.chance_cards}
+    community_chest = {card_id: effect for card_id, _, effect in st.board.community_chest_cards}
+
+    chance[14](st)
+    assert (me.balance, second.balance, third.balance) == (0, 150, 150)
+
+    community_chest[10](st)
+    assert (me.balance, second.balance, third.balance) == (10, 140, 140)
+
+
+def test_pay_rent_full_color_set_with_houses(fresh_state: State):
+    st = fresh_state
+    p1, p2 = st.players
+    for street in st.board.streets_by_color[ColorSet.PINK]:
+        street.owner = p1
+        p1.properties.append(street)
+    st.board.board[13].houses = 2
+    old_balance_p2 = p2.balance
+    p2.position = 13
+    st.handle_landing_on_tile(player=p2, dice_roll=(2, 4))
+    assert p2.balance == old_balance_p2 - 150
+
+
+def test_snapshot_restore_undoes_actions(fresh_state: State):
+    st = fresh_state
+    p1 = st.current_player()
+    p1.position = 3
+    tile = st.board.board[3]
+    balance = p1.balance
+    snapshot = st.snapshot()
+
+    BuyAction(p1, tile).process(st)
+    assert tile.owner is p1
+
+    st.restore(snapshot)
+    assert tile.owner is None
+    assert p1.properties == []
+    assert p1.balance == balance
+
+
+def test_restore_dice_replays_the_same_rolls():
+    seed_dice(5)
+    snapshot = dice_snapshot()
+    # Enough rolls to run through a refill of the pre-rolled pool.
+    rolls = [_roll_two() for _ in range(5000)]
+    restore_dice(snapshot)
+    assert [_roll_two() for _ in range(5000)] == rolls
+
+
+def test_player_roster_changes_keep_lookups_in_sync(fresh_state: State):
+    st = fresh_state
+    newcomer = SimplePlayer(name="P3", mgn_code="P3")
+    with pytest.raises(AttributeError):
+        st.players.append(newcomer)
+
+    st.add_player(newcomer)
+    assert st.players_by_mgn["P3"] is newcomer
+    assert st.player_index(newcomer) == 2
+
+    first = st.remove_player_at(0)
+    assert "P3" in st.players_by_mgn and first.mgn_code not in st.players_by_mgn
+    assert st.player_index(newcomer) == 1
+    with pytest.raises(ValueError):
+        st.player_index(first)
+
+
+def test_players_can_be_assigned_from_an_iterator(fresh_state: State):
+    st = fresh_state
+    roster = list(st.players)
+    st.players = (p for p in roster)
+    assert st.players == tuple(roster)
+    assert st.players_by_mgn == {p.mgn_code: p for p in roster}
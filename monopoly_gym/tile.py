@@ -1,5 +1,5 @@
 # monopoly_gym/tile.py
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -20,6 +20,15 @@ class ColorSet(Enum):
         self.house_cost = house_cost
         self.hotel_cost = hotel_cost
 
+class TileKind(IntEnum):
+    SPECIAL = 0
+    STREET = 1
+    RAILROAD = 2
+    UTILITY = 3
+    TAX = 4
+    CHANCE = 5
+    COMMUNITY_CHEST = 6
+
 class SpecialTileType(Enum):
     GO = "Go"
     JAIL = "Jail"
@@ -27,6 +36,8 @@ class SpecialTileType(Enum):
     GO_TO_JAIL = "Go to Jail"
 
 class Tile:
+    __slots__ = ("name", "index")
+
     def __init__(self, name: str, index: int):
         self.name = name
         self.index = index
@@ -38,6 +49,8 @@ class Tile:
         }
 
 class Property(Tile):
+    __slots__ = ("purchase_cost", "mortgage_price", "unmortgage_price", "owner", "is_mortgaged", "property_idx")
+
     def __init__(self, name: str, purchase_cost: int, mortgage_price: int = None, unmortgage_price: int = None):
         super().__init__(name, None)
         self.purchase_cost = purchase_cost
@@ -83,6 +96,9 @@ class Property(Tile):
         return hash(self.index)
 
 class Railroad(Property):
+    __slots__ = ("rent",)
+    kind = TileKind.RAILROAD
+
     def __init__(self, name: str, purchase_cost: int, mortgage_price: int, unmortgage_price: int):
         super().__init__(name=name, purchase_cost=purchase_cost, mortgage_price=mortgage_price, unmortgage_price=unmortgage_price)
         self.rent = [25, 50, 100, 200]  # Rent increases with the number of railroads owned
@@ -96,6 +112,9 @@ class Railroad(Property):
         return base_dict
 
 class Utility(Property):
+    __slots__ = ("rent_multiplier",)
+    kind = TileKind.UTILITY
+
     def __init__(self, name: str, purchase_cost: int, mortgage_price: int, unmortgage_price: int):
         super().__init__(name=name, purchase_cost=purchase_cost, mortgage_price=mortgage_price, unmortgage_price=unmortgage_price)
         self.rent_multiplier = [4, 10]  # Rent multiplier depending on dice roll
@@ -109,6 +128,9 @@ class Utility(Property):
         return base_dict
 
 class Street(Property):
+    __slots__ = ("color_set", "rent", "rent_by_houses", "houses", "hotels", "street_idx")
+    kind = TileKind.STREET
+
     def __init__(self, name: str, color_set: ColorSet, purchase_cost: int, mortgage_price: int, unmortgage_price: int,
                 no_color_set_rent: int, color_set_rent: int, one_house_rent: int, two_house_rent: int,
                 three_house_rent: int, four_house_rent: int, hotel_rent: int):
@@ -123,6 +145,8 @@ class Street(Property):
             "four_house_rent": four_house_rent,
             "hotel": hotel_rent,
         }
+        # Full-color-set rent indexed by house count, so rent lookup needs no key formatting.
+        self.rent_by_houses = (color_set_rent, one_house_rent, two_house_rent, three_house_rent, four_house_rent)
         self.houses = 0
         self.hotels = 0
         self.street_idx = None
@@ -174,6 +198,9 @@ class Street(Property):
         return base_dict
 
 class Tax(Tile):
+    __slots__ = ("tax_amount",)
+    kind = TileKind.TAX
+
     def __init__(self, name: str, tax_amount: int):
         super().__init__(name, None)
         self.name = name
@@ -189,6 +216,9 @@ class Tax(Tile):
 
 
 class CommunityChest(Tile):
+    __slots__ = ()
+    kind = TileKind.COMMUNITY_CHEST
+
     def __init__(self, name: str):
         super().__init__(name, None)
         self.name = name
@@ -201,6 +231,9 @@ class CommunityChest(Tile):
         }
 
 class Chance(Tile):
+    __slots__ = ()
+    kind = TileKind.CHANCE
+
     def __init__(self, name: str):
         super().__init__(name, None)
         self.name = name
@@ -213,6 +246,8 @@ class Chance(Tile):
         }
 
 class SpecialTile(Tile):
+    __slots__ = ("special_tile_type",)
+    kind = TileKind.SPECIAL
 
     def __init__(self, name: str, special_tile_type: SpecialTileType):
         super().__init__(name, None)
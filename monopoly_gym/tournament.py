@@ -163,6 +163,7 @@ class GameRunner:
         self.logger = self._setup_game_logging()
         self.env = MonopolyEnvironment(
             max_turns=game_specific_config.get('max_turns_per_game', 1000),
+            seed=game_specific_config.get('seed'),
         )
         self.game_states_history: List[Dict[str, Any]] = []
 
@@ -243,7 +244,8 @@ class GameRunner:
                     self.logger.info(f"Player {player_name} decided action(s) in {action_decision_duration:.2f}s.")
 
                     for action_idx, action_to_take in enumerate(actions):
-                        action_details_str = str(vars(action_to_take)) if action_to_take and hasattr(action_to_take, '__dict__') else str(action_to_take)
+                        # Actions use __slots__, so serialize through to_dict() rather than vars().
+                        action_details_str = str(action_to_take.to_dict()) if action_to_take and hasattr(action_to_take, 'to_dict') else str(action_to_take)
                         self.logger.info(f"Turn {current_turn}, Sub-action {action_idx+1}: Player {player_name} takes action: {action_to_take.__class__.__name__} (Details: {action_details_str})")
                         
                         if self.env.is_game_over(): break
@@ -267,7 +269,7 @@ class GameRunner:
                 winner_obj = self.env.state.winner
             elif self.env.is_game_over():
                 active_players = []
-                if hasattr(self.env.state, 'players') and isinstance(self.env.state.players, list):
+                if hasattr(self.env.state, 'players') and isinstance(self.env.state.players, (list, tuple)):
                     for p in self.env.state.players:
                         if hasattr(p, 'is_bankrupt'):
                             if not p.is_bankrupt: